@@ -13,7 +13,7 @@ from itertools import compress
 from numpy.typing import ArrayLike
 
 from config import settings
-from functions.MonteCarloSimulation import run_simulation
+from functions.MonteCarloSimulation import run_simulation, run_economic_scenarios, economic_scenario_parameters
 from functions.general.utility import get_project_root
 
 
@@ -36,7 +36,63 @@ def get_pareto_mask(costs_array):
     return pareto_efficient_mask
 
 
-def run_optimisation(optimisation_parameters=None, relative_path_from_root="analysis\\optimisation\\results"):
+def set_parameter_combination(parameter_combination):
+    """
+    Overwrites the user inputs in the settings object with the values of an optimisation parameter combination.
+
+    Parameters
+    ----------
+    parameter_combination: dict
+        Values of the parameters which are varied during optimisation.
+    """
+    # Overwrite instances in settings object
+    if "gasification_temperature" in parameter_combination:
+        settings.user_inputs.process_conditions["gasification_temperature"] = parameter_combination["gasification_temperature"]
+    if "ER" in parameter_combination:
+        settings.user_inputs.process_conditions["ER"] = parameter_combination["ER"]
+    if "gasifying_agent" in parameter_combination:
+        settings.user_inputs.process_conditions["gasifying_agent"] = parameter_combination["gasifying_agent"]
+    if "operation_scale" in parameter_combination:
+        settings.user_inputs.process_conditions["operation_scale"] = parameter_combination["operation_scale"]
+    if "reactor_type" in parameter_combination:
+        settings.user_inputs.process_conditions["reactor_type"] = parameter_combination["reactor_type"]
+        # Updated bed material based on reactor type
+        if settings.user_inputs.process_conditions["reactor_type"] == "Fluidised bed":
+            settings.user_inputs.process_conditions["bed_material"] = "Silica"
+        elif settings.user_inputs.process_conditions["reactor_type"] == "Fixed bed":
+            settings.user_inputs.process_conditions["bed_material"] = "N/A"
+    if "rate_of_return_decimals" in parameter_combination:
+        settings.user_inputs.economic["rate_of_return_decimals"] = parameter_combination["rate_of_return_decimals"]
+    if "system_life_span" in parameter_combination:
+        settings.user_inputs.general["system_life_span"] = parameter_combination["system_life_span"]
+    if "carbon_capture" in parameter_combination:
+        settings.user_inputs.processes.carbon_capture["included"] = parameter_combination["carbon_capture"]
+        settings.user_inputs.processes.carbon_capture["method"] = "VPSA post combustion"
+        settings.user_inputs.economic["CO2_transport_price_choice"] = "default"
+        settings.user_inputs.economic["CO2_storage_price_choice"] = "default"
+    if "carbon_tax" in parameter_combination:
+        settings.user_inputs.economic["carbon_tax_included"] = True
+        settings.user_inputs.economic["carbon_tax_choice"] = "user selected"
+        settings.user_inputs.economic.carbon_tax_parameters["value"] = parameter_combination["carbon_tax"]
+        settings.user_inputs.economic.carbon_tax_parameters["distribution_type"] = "fixed"
+    if "electricity_price" in parameter_combination:
+        settings.user_inputs.economic["electricity_price_choice"] = "user selected"
+        if isinstance(parameter_combination["electricity_price"], list):  # nested list denotes triangular distribution
+            settings.user_inputs.economic.electricity_price_parameters["lower"] = parameter_combination["electricity_price"][0]
+            settings.user_inputs.economic.electricity_price_parameters["mode"] = parameter_combination["electricity_price"][1]
+            settings.user_inputs.economic.electricity_price_parameters["upper"] = parameter_combination["electricity_price"][2]
+            settings.user_inputs.economic.electricity_price_parameters["distribution_type"] = "triangular"
+        else:  # int or float denotes singular fixed value
+            settings.user_inputs.economic.electricity_price_parameters["value"] = parameter_combination["electricity_price"]
+            settings.user_inputs.economic.electricity_price_parameters["distribution_type"] = "fixed"
+            # Check that values are of the expected type
+            if not isinstance(parameter_combination["electricity_price"], int) and not isinstance(parameter_combination["electricity_price"], float):
+                raise ValueError("Decimal or integer expected.")
+
+
+def run_optimisation(optimisation_parameters=None,
+                     relative_path_from_root=os.path.join("analysis", "optimisation", "results"),
+                     batch_economic_parameters=False, common_random_numbers=False, reduced_MC_iterations=100):
     """
     Run optimisation based on user_input file currently defined in config.py.
     It is highly recommended to set number of Monte Carlo iterations to 100 in user_input file to speed up optimisation.
@@ -47,9 +103,19 @@ def run_optimisation(optimisation_parameters=None, relative_path_from_root="anal
         Dictionary of parameters which are to be varied during optimisation.
     relative_path_from_root: str
         Path from root directory where results should be saved.
+    batch_economic_parameters: bool
+        If True, the process models are only run once for each combination of non-economic parameters and all
+        combinations of economic parameters (carbon tax, rate of return, and system life span) are evaluated in a
+        single batch on the same Monte Carlo draws.
+    common_random_numbers: bool
+        If True, all parameter combinations are run with the same seed and each uncertain input (e.g. O&M ratios,
+        prices, CAPEX and ML errors) draws from its own random number stream, so that every combination reuses the same
+        underlying random numbers. Differences between combinations are then not masked by sampling noise. Not
+        supported with Sobol sampling (settings.user_inputs.general.sampling_method).
+    reduced_MC_iterations: int
+        Number of Monte Carlo iterations of each simulation run - reduced so that model runs faster.
     """
     # General parameters
-    reduced_MC_iterations = 100  # so that model runs faster
     results = []
 
     # Default optimisation parameters
@@ -81,63 +147,51 @@ def run_optimisation(optimisation_parameters=None, relative_path_from_root="anal
     # Reduce number of Monte Carlo iterations to speed up model
     settings.user_inputs.general.MC_iterations = reduced_MC_iterations
 
-    # Optimisation loop
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore")
-        for count, parameter_combination in enumerate(optimisation_combinations):
-            # Overwrite instances in settings object
-            if "gasification_temperature" in parameter_combination:
-                settings.user_inputs.process_conditions["gasification_temperature"] = parameter_combination["gasification_temperature"]
-            if "ER" in parameter_combination:
-                settings.user_inputs.process_conditions["ER"] = parameter_combination["ER"]
-            if "gasifying_agent" in parameter_combination:
-                settings.user_inputs.process_conditions["gasifying_agent"] = parameter_combination["gasifying_agent"]
-            if "operation_scale" in parameter_combination:
-                settings.user_inputs.process_conditions["operation_scale"] = parameter_combination["operation_scale"]
-            if "reactor_type" in parameter_combination:
-                settings.user_inputs.process_conditions["reactor_type"] = parameter_combination["reactor_type"]
-                # Updated bed material based on reactor type
-                if settings.user_inputs.process_conditions["reactor_type"] == "Fluidised bed":
-                    settings.user_inputs.process_conditions["bed_material"] = "Silica"
-                elif settings.user_inputs.process_conditions["reactor_type"] == "Fixed bed":
-                    settings.user_inputs.process_conditions["bed_material"] = "N/A"
-            if "rate_of_return_decimals" in parameter_combination:
-                settings.user_inputs.economic["rate_of_return_decimals"] = parameter_combination["rate_of_return_decimals"]
-            if "system_life_span" in parameter_combination:
-                settings.user_inputs.general["system_life_span"] = parameter_combination["system_life_span"]
-            if "carbon_capture" in parameter_combination:
-                settings.user_inputs.processes.carbon_capture["included"] = parameter_combination["carbon_capture"]
-                settings.user_inputs.processes.carbon_capture["method"] = "VPSA post combustion"
-                settings.user_inputs.economic["CO2_transport_price_choice"] = "default"
-                settings.user_inputs.economic["CO2_storage_price_choice"] = "default"
-            if "carbon_tax" in parameter_combination:
-                settings.user_inputs.economic["carbon_tax_included"] = True
-                settings.user_inputs.economic["carbon_tax_choice"] = "default"
-                settings.user_inputs.economic.carbon_tax_parameters["value"] = parameter_combination["carbon_tax"]
-                settings.user_inputs.economic.carbon_tax_parameters["distribution_type"] = "fixed"
-            if "electricity_price" in parameter_combination:
-                settings.user_inputs.economic["electricity_price_choice"] = "user selected"
-                if isinstance(parameter_combination["electricity_price"], list):  # nested list denotes triangular distribution
-                    settings.user_inputs.economic.electricity_price_parameters["lower"] = parameter_combination["electricity_price"][0]
-                    settings.user_inputs.economic.electricity_price_parameters["mode"] = parameter_combination["electricity_price"][1]
-                    settings.user_inputs.economic.electricity_price_parameters["upper"] = parameter_combination["electricity_price"][2]
-                    settings.user_inputs.economic.electricity_price_parameters["distribution_type"] = "triangular"
-                else:  # int or float denotes singular fixed value
-                    settings.user_inputs.economic.electricity_price_parameters["value"] = parameter_combination["electricity_price"]
-                    settings.user_inputs.economic.electricity_price_parameters["distribution_type"] = "fixed"
-                    # Check that values are of the expected type
-                    if not isinstance(parameter_combination["electricity_price"], int) and not isinstance(parameter_combination["electricity_price"], float):
-                        raise ValueError("Decimal or integer expected.")
-
-            settings.user_inputs.general.MC_iterations = reduced_MC_iterations
-
-            result = run_simulation(show_figures=False)
-            result.parameter_combination = parameter_combination
-            results.append(result)
-
-            print(f"Results for simulation run {count+1}:")
-            print(f"Mean GWP: {results[count].GWP_mean}")
-            print(f"Mean BCR: {results[count].BCR_mean}")
+    # Split parameters which require the process models to be rerun from those which can be evaluated in batches
+    if batch_economic_parameters:
+        economic_parameters = {parameter: values for parameter, values in optimisation_parameters.items()
+                               if parameter in economic_scenario_parameters}
+        simulation_combinations = list(ParameterGrid({parameter: values for parameter, values in
+                                                      optimisation_parameters.items()
+                                                      if parameter not in economic_scenario_parameters}))
+        economic_combinations = list(ParameterGrid(economic_parameters))
+    else:
+        simulation_combinations = optimisation_combinations
+        economic_combinations = []
+
+    # Use one seed for all parameter combinations if common random numbers are used
+    seed = None
+    default_common_random_numbers = settings.user_inputs.general.get("common_random_numbers", False)
+    if common_random_numbers:
+        seed = settings.user_inputs.general.get("random_seed", None)
+        if seed is None:
+            seed = np.random.SeedSequence().entropy
+        settings.user_inputs.general["common_random_numbers"] = True
+
+    try:
+        # Optimisation loop
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            for count, parameter_combination in enumerate(simulation_combinations):
+                set_parameter_combination(parameter_combination)
+
+                settings.user_inputs.general.MC_iterations = reduced_MC_iterations
+
+                result = run_simulation(show_figures=False, seed=seed)
+                if batch_economic_parameters:  # evaluate all economic scenarios on the draws of this run
+                    for scenario_result in run_economic_scenarios(result, economic_combinations):
+                        scenario_result.parameter_combination = {**parameter_combination,
+                                                                 **scenario_result.economic_scenario}
+                        results.append(scenario_result)
+                else:
+                    result.parameter_combination = parameter_combination
+                    results.append(result)
+
+                print(f"Results for simulation run {count+1}:")
+                print(f"Mean GWP: {results[-1].GWP_mean}")
+                print(f"Mean BCR: {results[-1].BCR_mean}")
+    finally:
+        settings.user_inputs.general["common_random_numbers"] = default_common_random_numbers
 
     # Store optimisation results
 
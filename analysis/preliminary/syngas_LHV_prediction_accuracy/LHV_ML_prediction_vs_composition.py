@@ -9,7 +9,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 from functions.general import calculate_syngas_LHV, MAPE
-from functions.general.utility import get_project_root
+from functions.general.utility import get_data_path
 from sklearn.metrics import mean_squared_error
 
 
@@ -17,8 +17,7 @@ from sklearn.metrics import mean_squared_error
 # Load dataframe with models stored
 
 # Get file path to GBR data
-project_root = get_project_root()
-full_file_path = str(project_root) + r"\data\GBR_performance_summary"
+full_file_path = get_data_path("GBR_performance_summary")
 
 # Load performance summary object
 perf_summary = pickle.load(open(full_file_path, "rb"))
@@ -97,7 +96,7 @@ plt.xlabel(r"Absolute error [MJ/m$^{3}$]", fontsize=16)
 plt.ylabel("Count", fontsize=16)
 plt.tick_params(labelsize=16)
 plt.tight_layout()
-plt.savefig(current_directory + r"\\" + r"\figures" + r"\ML_predicted_vs_calculated_errors" + ".tiff", dpi=500,
+plt.savefig(os.path.join(current_directory, "figures", "ML_predicted_vs_calculated_errors.tiff"), dpi=500,
             bbox_inches="tight")
 plt.show()
 
@@ -1,7 +1,9 @@
-from .path_handling import get_project_root
+from .path_handling import get_project_root, get_data_path
 from .unit_conversions import kJ_to_kWh, MJ_to_kWh, therm_to_kWh
 from ._scale_gas_fractions import scale_gas_fractions
 from ._fetch_ML_inputs import fetch_ML_inputs
 from .feedstock_conversions import ultimate_comp_daf_to_wb
 from .data_wrangling import reject_outliers
 from .hide_prints import HidePrints
+from .data_registry import load_data, clear_data_registry
+from .data_bundle import load_table, get_data_hash, get_data_bundle_hash, build_data_bundle
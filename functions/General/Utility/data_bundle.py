@@ -0,0 +1,166 @@
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+import toml
+
+from .path_handling import get_data_path
+from .data_registry import load_data
+
+# Version of the data bundle format - bundles written with a different version are ignored and rebuilt
+DATA_BUNDLE_VERSION = 1
+
+# Directory (within data/) holding the binary copies of all tables and the bundle manifest
+_bundle_directory = "bundle"
+_manifest_file = "manifest.toml"
+
+
+def _hash_file(full_file_path):
+    with open(full_file_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def get_data_hash(file_name):
+    """
+    Gets the content hash of a data file (e.g. to key caches of results derived from the data). The hash is only
+    recalculated if the file has changed.
+
+    Parameters
+    ----------
+    file_name: str
+        Name of the file in the data directory - e.g. "CAPEX_boiler.csv".
+
+    Returns
+    -------
+    str
+        SHA-256 hash of the file's content.
+    """
+    return load_data(get_data_path(file_name), loader=_hash_file)
+
+
+def _load_manifest():
+    manifest_path = get_data_path(_bundle_directory, _manifest_file)
+    if not os.path.exists(manifest_path):
+        return {}
+
+    manifest = load_data(manifest_path, loader=toml.load)
+    if manifest.get("version") != DATA_BUNDLE_VERSION:
+        return {}
+
+    return manifest.get("tables", {})
+
+
+def _write_table_npz(df, full_file_path):
+    """
+    Stores a table as arrays (one per column) in a compressed .npz file, which is loaded without parsing or
+    unpickling. Text columns and columns of booleans with missing values are stored together with a mask of missing
+    values.
+    """
+    arrays = {"columns": np.array(df.columns, dtype=str)}
+    for count, column in enumerate(df.columns):
+        if df[column].dtype.kind in "biuf":
+            arrays[f"column_{count}"] = df[column].to_numpy()
+            continue
+
+        missing = df[column].isna().to_numpy()
+        values = df[column][~missing]
+        if all(isinstance(value, str) for value in values):
+            arrays[f"column_{count}"] = np.where(missing, "", df[column].to_numpy(dtype=object)).astype(str)
+        elif all(isinstance(value, (bool, np.bool_)) for value in values):
+            arrays[f"column_{count}"] = np.where(missing, False, df[column].to_numpy(dtype=object)).astype(bool)
+        else:
+            raise ValueError(f"Column '{column}' of mixed types can not be stored in the data bundle.")
+        arrays[f"missing_{count}"] = missing
+
+    np.savez_compressed(full_file_path, **arrays)
+
+
+def _read_table_npz(full_file_path):
+    with np.load(full_file_path, allow_pickle=False) as arrays:
+        data = {}
+        for count, column in enumerate(arrays["columns"]):
+            values = arrays[f"column_{count}"]
+            if f"missing_{count}" in arrays:  # restore missing values (column type is inferred as by pd.read_csv)
+                values = values.astype(object)
+                values[arrays[f"missing_{count}"]] = np.nan
+                values = pd.Series(values)
+            data[str(column)] = values
+
+    return pd.DataFrame(data)
+
+
+def _load_table(full_file_path):
+    """
+    Loads a table from the data bundle if the bundled copy was built from the current version of the file. Otherwise,
+    the CSV file is read directly.
+    """
+    file_name = os.path.basename(full_file_path)
+    bundled_table = _load_manifest().get(file_name)
+    if bundled_table is not None and bundled_table["sha256"] == get_data_hash(file_name):
+        return _read_table_npz(get_data_path(_bundle_directory, bundled_table["file"]))
+
+    return pd.read_csv(full_file_path)
+
+
+def load_table(file_name, index_col=None):
+    """
+    Loads a table (CSV file) from the data directory. Tables are taken from the binary data bundle (see
+    build_data_bundle) where available and are kept in memory after their first use.
+
+    Parameters
+    ----------
+    file_name: str
+        Name of the file in the data directory - e.g. "CAPEX_boiler.csv".
+    index_col: int | None
+        Column to use as index (as in pd.read_csv).
+
+    Returns
+    -------
+    DataFrame
+        Copy of the table, which can be modified freely.
+    """
+    df = load_data(get_data_path(file_name), loader=_load_table).copy()
+    if index_col is not None:
+        df = df.set_index(df.columns[index_col])
+        if str(df.index.name).startswith("Unnamed: "):  # column without header
+            df.index.name = None
+
+    return df
+
+
+def get_data_bundle_hash():
+    """
+    Gets a hash of the content of all tables in the data directory - e.g. to key caches of results derived from
+    several tables.
+
+    Returns
+    -------
+    str
+        SHA-256 hash combining the hashes of all tables.
+    """
+    table_hashes = [f"{file_name}:{get_data_hash(file_name)}" for file_name in sorted(os.listdir(get_data_path()))
+                    if file_name.endswith(".csv")]
+
+    return hashlib.sha256("\n".join(table_hashes).encode()).hexdigest()
+
+
+def build_data_bundle():
+    """
+    Builds the versioned data bundle - a binary (.npz) copy of every table in the data directory together with a
+    manifest recording the bundle version and the content hash of each source file. Rerun whenever a table changes
+    (outdated tables are read from their CSV file until then).
+    """
+    bundle_path = get_data_path(_bundle_directory)
+    os.makedirs(bundle_path, exist_ok=True)
+
+    manifest = {"version": DATA_BUNDLE_VERSION, "tables": {}}
+    for file_name in sorted(os.listdir(get_data_path())):
+        if not file_name.endswith(".csv"):
+            continue
+        bundle_file_name = file_name[:-len(".csv")] + ".npz"
+        _write_table_npz(pd.read_csv(get_data_path(file_name)), os.path.join(bundle_path, bundle_file_name))
+        manifest["tables"][file_name] = {"file": bundle_file_name, "sha256": _hash_file(get_data_path(file_name))}
+
+    with open(os.path.join(bundle_path, _manifest_file), "w") as f:
+        toml.dump(manifest, f)
@@ -0,0 +1,54 @@
+import os
+import pickle
+import threading
+
+# Data loaded from files - keyed by file path and loader, storing the file's state when loaded and the loaded data
+_loaded_data = {}
+_loaded_data_lock = threading.RLock()
+
+
+def _load_pickle(full_file_path):
+    with open(full_file_path, "rb") as f:
+        return pickle.load(f)
+
+
+def load_data(full_file_path, loader=None):
+    """
+    Loads a background data file (e.g. a pickled dataset) once and keeps it in memory, so that repeated calls (e.g. in
+    every Monte Carlo iteration) do not read the file again. The file is only reloaded if it has changed since it was
+    loaded (i.e. its modification time or size differ).
+    Note: The returned data is shared between all callers and must not be modified.
+
+    Parameters
+    ----------
+    full_file_path: str
+        Path to the data file.
+    loader: Callable | None
+        Function which loads the data from the file path. Defaults to unpickling the file.
+
+    Returns
+    -------
+    object
+        Loaded data.
+    """
+    # Get defaults
+    if loader is None:
+        loader = _load_pickle
+
+    file_stats = os.stat(full_file_path)
+    file_state = (file_stats.st_mtime_ns, file_stats.st_size)
+    key = (os.path.abspath(full_file_path), loader)
+
+    with _loaded_data_lock:
+        if key not in _loaded_data or _loaded_data[key][0] != file_state:
+            _loaded_data[key] = (file_state, loader(full_file_path))
+
+        return _loaded_data[key][1]
+
+
+def clear_data_registry():
+    """
+    Removes all loaded data from memory, so that files are read again on their next use.
+    """
+    with _loaded_data_lock:
+        _loaded_data.clear()
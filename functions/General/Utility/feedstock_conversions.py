@@ -1,16 +1,26 @@
 from config import settings
 
 
-def ultimate_comp_daf_to_wb(C=settings.user_inputs.feedstock.carbon, H=settings.user_inputs.feedstock.hydrogen,
-                            N=settings.user_inputs.feedstock.nitrogen, S=settings.user_inputs.feedstock.sulphur,
-                            O=settings.user_inputs.feedstock.oxygen, moisture=None,
-                            ash=settings.user_inputs.feedstock.ash):
+def ultimate_comp_daf_to_wb(C=None, H=None, N=None, S=None, O=None, moisture=None, ash=None):
     """
     Converts ultimate composition of a material from % daf (dry ash free)basis to % wb (wet basis).
     By default, takes feedstock data given by user.
 
     """
     # Get defaults
+    feedstock = settings.user_inputs.feedstock
+    if C is None:
+        C = feedstock.carbon
+    if H is None:
+        H = feedstock.hydrogen
+    if N is None:
+        N = feedstock.nitrogen
+    if S is None:
+        S = feedstock.sulphur
+    if O is None:
+        O = feedstock.oxygen
+    if ash is None:
+        ash = feedstock.ash
     if moisture is None:
         try:
             moisture = settings.user_inputs.feedstock.moisture_post_drying
@@ -24,3 +24,20 @@ def get_project_root(return_type="str"):
         raise ValueError("Wrong return type supplied.")
 
     return output
+
+
+def get_data_path(*path_parts):
+    """
+    Gets the path to a file or directory within the data directory, independent of the operating system.
+
+    Parameters
+    ----------
+    path_parts: str
+        Parts of the path relative to the data directory - e.g. "CAPEX_boiler.csv" or "bundle", "manifest.toml".
+
+    Returns
+    -------
+    str
+        Path to the file or directory.
+    """
+    return str(get_project_root(return_type="path").joinpath("data", *path_parts))
@@ -0,0 +1,22 @@
+import os
+
+import pandas as pd
+
+from functions.general.utility import get_data_path, get_data_hash, load_table
+
+
+def test_data_path_independent_of_operating_system():
+    assert get_data_path("bundle", "manifest.toml") == os.path.join(get_data_path(), "bundle", "manifest.toml")
+    assert os.path.exists(get_data_path("CAPEX_boiler.csv"))
+
+
+def test_bundled_tables_match_source_files():
+    for file_name in ["CAPEX_boiler.csv", "CAPEX_Gasification.csv", "annual_operating_hours.csv"]:
+        pd.testing.assert_frame_equal(load_table(file_name), pd.read_csv(get_data_path(file_name)))
+    pd.testing.assert_frame_equal(load_table("system_size_data.csv", index_col=0),
+                                  pd.read_csv(get_data_path("system_size_data.csv"), index_col=0))
+
+    table = load_table("CAPEX_boiler.csv")
+    table["CAPEX"] = 0  # copies are returned
+    assert not (load_table("CAPEX_boiler.csv")["CAPEX"] == 0).all()
+    assert len(get_data_hash("CAPEX_boiler.csv")) == 64
@@ -0,0 +1,18 @@
+import os
+import pickle
+
+from functions.general.utility import load_data
+
+
+def test_data_loaded_once_and_reloaded_on_change(tmp_path):
+    file_path = str(tmp_path / "data")
+    with open(file_path, "wb") as f:
+        pickle.dump({"mode": 1}, f)
+
+    loaded_data = load_data(file_path)
+    assert load_data(file_path) is loaded_data  # kept in memory
+
+    with open(file_path, "wb") as f:
+        pickle.dump({"mode": 2, "upper": 3}, f)
+    os.utime(file_path, ns=(0, os.stat(file_path).st_mtime_ns + 1))
+    assert load_data(file_path) == {"mode": 2, "upper": 3}
@@ -1,6 +1,4 @@
-import pickle
-
-from functions.general.utility import get_project_root
+from functions.general.utility import get_data_path, load_data
 from pandas import DataFrame
 
 
@@ -16,10 +14,9 @@ def load_GBR_performance_summary_df():
 
     """
     # Get file path to GBR data
-    project_root = get_project_root()
-    full_file_path = str(project_root) + r"\data\GBR_performance_summary"
+    full_file_path = get_data_path("GBR_performance_summary")
 
     # Load performance summary object
-    perf_summary = pickle.load(open(full_file_path, "rb"))
+    perf_summary = load_data(full_file_path)
 
     return perf_summary
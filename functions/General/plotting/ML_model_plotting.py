@@ -233,8 +233,8 @@ def individual_feat_imp_plot(performance_summary, plot_type, plot_style=None, er
             plt.show()
 
             if save:
-                fig.savefig(storage_location + r'\Figures\\Individual Feature Importance Graphs\\' + save_loc +
-                            r'\\Gini_output_' + save_loc + '_' + str(count) + '.png')
+                fig.savefig(os.path.join(storage_location, "Figures", "Individual Feature Importance Graphs", save_loc,
+                            "Gini_output_" + save_loc + "_" + str(count) + ".png"))
 
     elif plot_type == 'perm':
         for count, model in enumerate(np.arange(performance_summary.loc['model'].shape[0])):
@@ -257,8 +257,8 @@ def individual_feat_imp_plot(performance_summary, plot_type, plot_style=None, er
             plt.show()
 
             if save:
-                fig.savefig(storage_location + r'\Figures\\Individual Feature Importance Graphs\\' + save_loc +
-                            r'\\Perm_output_' + save_loc + '_' + str(count) + '.png')
+                fig.savefig(os.path.join(storage_location, "Figures", "Individual Feature Importance Graphs", save_loc,
+                            "Perm_output_" + save_loc + "_" + str(count) + ".png"))
 
     elif plot_type == 'shap':
         for count, model in enumerate(np.arange(performance_summary.loc['model'].shape[0])):
@@ -298,8 +298,8 @@ def individual_feat_imp_plot(performance_summary, plot_type, plot_style=None, er
                 plt.show()
 
             if save:
-                fig.savefig(storage_location + r'\Figures\\Individual Feature Importance Graphs\\' + save_loc +
-                            r'\Shap_output_' + save_loc + '_' + str(count) + '.png')
+                fig.savefig(os.path.join(storage_location, "Figures", "Individual Feature Importance Graphs", save_loc,
+                            "Shap_output_" + save_loc + "_" + str(count) + ".png"))
 
     else:
         print('Warning: Plottype not supported!')
@@ -26,7 +26,8 @@ def pred_to_dist(prediction, output_label):
     # Get correct error value
     sigma = get_correct_sigma(prediction, output_label)
     # Get distribution
-    distribution = get_distribution_draws(gaussian_dist_maker(prediction, sigma))
+    distribution = get_distribution_draws(gaussian_dist_maker(prediction, sigma),
+                                          input_name=f"ML prediction error {output_label}")
 
     return distribution
 
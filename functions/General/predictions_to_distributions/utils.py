@@ -1,6 +1,4 @@
-import pickle
-
-from functions.general.utility import get_project_root
+from functions.general.utility import get_data_path, load_data
 
 
 def get_correct_sigma(prediction, output_label):
@@ -21,10 +19,8 @@ def get_correct_sigma(prediction, output_label):
     """
 
     # Load dataframe containing errors
-    root_path = get_project_root()
-    file_path = str(root_path) + r"\data\prediction_boundaries_and_errors_df"
-    with open(file_path, "rb") as f:
-        boundaries_errors_df = pickle.load(f)
+    file_path = get_data_path("prediction_boundaries_and_errors_df")
+    boundaries_errors_df = load_data(file_path)  # kept in memory after first use
 
     # Get boundaries and errors (sigmas)
     boundaries = boundaries_errors_df.loc["boundaries"][output_label]
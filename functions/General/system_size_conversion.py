@@ -1,8 +1,7 @@
-import pandas as pd
 import numpy as np
 
 from config import settings
-from functions.general.utility import get_project_root, MJ_to_kWh
+from functions.general.utility import load_table, MJ_to_kWh
 from sklearn.linear_model import LinearRegression
 from typing import Literal
 
@@ -36,12 +35,8 @@ def convert_system_size(value, input_units: _input_output_unit_types, feedstock_
     if feedstock_LHV is None:
         feedstock_LHV = settings.user_inputs.feedstock.LHV  # [MJ/kg]
 
-    # Get project root and define data source
-    project_root = get_project_root()
-    file_name = str(project_root) + r"\data\system_size_data.csv"
-
     # Load data
-    data = pd.read_csv(file_name, index_col=0)
+    data = load_table("system_size_data.csv", index_col=0)
     feedstock_mass_data = np.array(data["Feedstock mass input (tonnes/h)"].values)
     power_data = np.array(data["Size electricity generation (MWe)"].values)
 
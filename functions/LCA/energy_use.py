@@ -1,5 +1,7 @@
 import warnings
 
+import numpy as np
+
 from config import settings
 from functions.general.utility import kJ_to_kWh, MJ_to_kWh
 from dynaconf.vendor.box import BoxKeyError
@@ -11,8 +13,8 @@ def thermal_energy_GWP(amount, source=None, units="kWh", country=None, displaced
 
     Parameters
     ----------
-    amount: float
-        Defines the amount of thermal energy used.
+    amount: float | ArrayLike
+        Defines the amount of thermal energy used. Arrays (e.g. a Monte Carlo distribution) are converted at once.
     source: str
         Defines which source is considered for heat production.
     units: str
@@ -23,7 +25,7 @@ def thermal_energy_GWP(amount, source=None, units="kWh", country=None, displaced
         Determines whether energy is used (False) or displaces grid use (True).
     Returns
     -------
-    float
+    float | ArrayLike
         GWP value in kg CO2eq.
     """
     # Get defaults
@@ -46,6 +48,9 @@ def thermal_energy_GWP(amount, source=None, units="kWh", country=None, displaced
     else:
         raise TypeError("Heat source not supported.")
 
+    if not np.isscalar(amount):
+        amount = np.asarray(amount, dtype=float)
+
     # Convert units if not kWh
     if units == "kWh":
         pass
@@ -72,8 +77,8 @@ def electricity_GWP(amount, source=None, units="kWh", country=None, displaced=Fa
 
     Parameters
     ----------
-    amount: float
-        Defines the amount of electricity used.
+    amount: float | ArrayLike
+        Defines the amount of electricity used. Arrays (e.g. a Monte Carlo distribution) are converted at once.
     source: str
         Defines which source is considered for electricity production.
     units: str
@@ -84,7 +89,7 @@ def electricity_GWP(amount, source=None, units="kWh", country=None, displaced=Fa
         Determines whether energy is used (False) or displaced (True).
     Returns
     -------
-    float
+    float | ArrayLike
         GWP value in kg CO2eq.
     """
     # Get defaults
@@ -94,6 +99,9 @@ def electricity_GWP(amount, source=None, units="kWh", country=None, displaced=Fa
     if country is None:
         country = settings.user_inputs.general.country
 
+    if not np.isscalar(amount):
+        amount = np.asarray(amount, dtype=float)
+
     # Convert units if not kWh
     if units == "kWh":
         pass
@@ -13,3 +13,13 @@ import pytest
 #     from functions.LCA.energy_use import electricity_GWP
 #
 #     assert electricity_GWP(amount=1000, country="UK") == pytest.approx(0.21233 * 1000)
+
+
+def test_energy_use_GWP_of_arrays_matches_scalars():
+    import numpy as np
+    from functions.LCA.energy_use import thermal_energy_GWP, electricity_GWP
+
+    amounts = np.array([0.5, 10, 250])
+    for GWP_function in [thermal_energy_GWP, electricity_GWP]:
+        assert GWP_function(amounts, units="MJ") == pytest.approx([GWP_function(amount, units="MJ")
+                                                                   for amount in amounts])
@@ -1,2 +1,13 @@
 from .distribution_creation import to_fixed_MC_array, get_distribution_draws, dist_maker_from_settings
+from .random_number_generation import (RandomStream, set_random_seed, get_root_seed_sequence, use_random_seed,
+                                       get_random_stream, use_random_stream, get_rng)
+from .sampling import (get_sampling_method, get_antithetic_sampling, reset_sampling_plan, use_sampling_plan,
+                       get_unit_draws, inverse_cdf, get_expected_value, get_control_variates, get_record_control_variates,
+                       get_common_random_numbers, get_input_rng)
+from .run_context import run_context
+from .process_graph import ProcessGraph
 from ._run_simulation import run_simulation
+from ._run_simulation_sharded import run_simulation_sharded, merge_results
+from ._run_simulation_streaming import run_simulation_streaming
+from ._run_simulation_adaptive import run_simulation_adaptive, get_convergence_summary
+from ._run_simulation_batched import run_economic_scenarios, economic_scenario_parameters
@@ -1,3 +1,5 @@
+from functools import partial
+
 from config import settings
 from processes.CHP import CombinedHeatPower
 from processes.gasification import Gasification
@@ -7,9 +9,14 @@ from processes.carbon_capture import CarbonCapture
 from processes.pretreatment import (FeedstockDrying, FeedstockPelleting, FeedstockMilling, FeedstockBaleShredding,
                                     Pretreatment)
 from objects.result_objects import Results
+from functions.general.predictions_to_distributions import get_all_prediction_distributions
+from functions.MonteCarloSimulation.random_number_generation import set_random_seed
+from functions.MonteCarloSimulation.sampling import get_control_variates, get_record_control_variates
+from functions.MonteCarloSimulation.run_context import run_context
+from functions.MonteCarloSimulation.process_graph import ProcessGraph
 
 
-def run_simulation(show_figures=True):
+def run_simulation(show_figures=True, seed=None, MC_iterations=None):
     """
     Runs techno-economic and environmental simulation based on user inputs file defined in config.py.
 
@@ -17,67 +24,159 @@ def run_simulation(show_figures=True):
     ----------
     show_figures: bool
         Determines whether figures should be shown.
+    seed: None | int | np.random.SeedSequence
+        Seed from which all random number streams of the run are derived. If None, the seed defined in
+        settings.user_inputs.general.random_seed is used or fresh entropy is drawn if no seed is defined.
+    MC_iterations: int | None
+        Number of Monte Carlo iterations of this run. Defaults to the number defined in settings.
 
     Returns
     -------
 
     """
-    # Create processes
-    processes = ()  # to store all created processes
-
-    # Pretreatment - Note: Run first so that particle size gets updated
-    process_pretreatment = None
-    if settings.user_inputs.processes.drying.included or settings.user_inputs.processes.milling.included or settings.user_inputs.processes.pelleting.included or settings.user_inputs.processes.bale_shredding.included:
-        process_pretreatment = Pretreatment()
-
-        if settings.user_inputs.processes.drying.included:
-            process_pretreatment.add_subprocess(FeedstockDrying())
-
-        if settings.user_inputs.processes.milling.included:
-            process_pretreatment.add_subprocess(FeedstockMilling())
-
-        if settings.user_inputs.processes.pelleting.included:
-            process_pretreatment.add_subprocess(FeedstockPelleting())
-
-        if settings.user_inputs.processes.bale_shredding.included:
-            process_pretreatment.add_subprocess(FeedstockBaleShredding())
-
-        processes = processes + (process_pretreatment,)
+    if MC_iterations is not None:  # run with a temporary number of iterations
+        with run_context(MC_iterations=MC_iterations):
+            return run_simulation(show_figures=show_figures, seed=seed)
+
+    # Seed random number streams - same seed gives identical Monte Carlo draws
+    root_seed_sequence = set_random_seed(seed)
+
+    # Build dependency graph of all processes and the shared inputs they require
+    graph = ProcessGraph()
+
+    # Pretreatment - Note: Evaluated before the ML predictions so that particle size gets updated
+    pretreatment_included = (settings.user_inputs.processes.drying.included or
+                             settings.user_inputs.processes.milling.included or
+                             settings.user_inputs.processes.pelleting.included or
+                             settings.user_inputs.processes.bale_shredding.included)
+    if pretreatment_included:
+        graph.add_node("Pretreatment", _create_pretreatment)
+
+    # Get ML predictions and their distributions once (after pretreatment as this may update the ML inputs), so that
+    # all processes share the same draws
+    graph.add_node("ML predictions", get_all_prediction_distributions,
+                   after=("Pretreatment",) if pretreatment_included else None)
+
+    # CHP requirements - heat output is also used to estimate the auxiliary heat demands of gasification
+    graph.add_node("CHP requirements",
+                   partial(_calculate_process_requirements, CombinedHeatPower(instantiate_with_default_reqs=False)),
+                   inputs={"ML_predictions": "ML predictions"})
 
     # Gasification
-    process_gasification = Gasification(short_label="Gasif.")
-    processes = processes + (process_gasification,)
+    graph.add_node("Gasification",
+                   partial(_calculate_process, Gasification(short_label="Gasif.", instantiate_with_default_reqs=False)),
+                   inputs={"ML_predictions": "ML predictions", "CHP_results_object": "CHP requirements"})
 
     # Syngas combustion and CHP
-    process_CHP = CombinedHeatPower()
-    process_syngas_combustion = SyngasCombustion()
-    process_CHP.add_subprocess(process_syngas_combustion)  # add subprocess
-    processes = processes + (process_CHP,)
+    graph.add_node("Syngas combustion",
+                   partial(_calculate_process, SyngasCombustion(instantiate_with_default_reqs=False)),
+                   inputs={"ML_predictions": "ML predictions"})
+    graph.add_node("CHP", _add_subprocess, inputs={"process": "CHP requirements", "subprocess": "Syngas combustion"})
+    process_names = ("Pretreatment",) if pretreatment_included else ()
+    process_names = process_names + ("Gasification", "CHP")
 
     # Biochar application to soil
     if settings.user_inputs.processes.biochar.included:
-        process_biochar = BiocharSoilApplication(short_label="Biochar")
-        processes = processes + (process_biochar,)
+        graph.add_node("Biochar", _calculate_biochar, inputs={"ML_predictions": "ML predictions"})
+        process_names = process_names + ("Biochar",)
 
-    # Carbon Capture
+    # Carbon Capture - reuses the syngas combustion node rather than rerunning the syngas combustion sub-model
     if settings.user_inputs.processes.carbon_capture.included:
-        process_carbon_capture = CarbonCapture(instantiate_with_default_reqs=False)
-        # Calculate requirements and GWP/TEA manually to avoid rerunning syngas combustion sub-model
-        process_carbon_capture.calculate_requirements(syngas_combustion_object=process_syngas_combustion,
-                                                      cc_method=settings.user_inputs.processes.carbon_capture.method)
-        process_carbon_capture.calculate_GWP()
-        process_carbon_capture.calculate_TEA()
-        processes = processes + (process_carbon_capture,)
+        graph.add_node("Carbon capture", _calculate_carbon_capture,
+                       inputs={"ML_predictions": "ML predictions", "syngas_combustion_object": "Syngas combustion"})
+        process_names = process_names + ("Carbon capture",)
+
+    # Evaluate each node once - independent nodes (e.g. CAPEX estimation of different processes) run concurrently if
+    # several workers are defined
+    graph_results = graph.evaluate()
+    processes = tuple(graph_results[process_name] for process_name in process_names)
 
     # Create results object
     results = Results(processes=processes, plot_style="digital")
+    results.random_seed = root_seed_sequence.entropy  # store to allow run to be reproduced
+    results.store_run_state()  # economic totals and energy results are calculated lazily from this run's random streams
     results.calculate_total_GWP()
-    results.calculate_global_economic_effects()
-    results.calculate_total_TEA()
-    results.calculate_electricity_heat_output()
+    results.calculate_global_economic_effects()  # draws uncertain inputs - calculated as part of the run
+    if get_record_control_variates():
+        results.control_variates = get_control_variates()  # input draws with known expected values
 
     # # Plot results
     if show_figures:
         results.plot_all_results()
 
     return results
+
+
+def _create_pretreatment():
+    """
+    Creates the pretreatment process with all pretreatment steps defined in settings as subprocesses.
+    """
+    process_pretreatment = Pretreatment()
+
+    if settings.user_inputs.processes.drying.included:
+        process_pretreatment.add_subprocess(FeedstockDrying())
+
+    if settings.user_inputs.processes.milling.included:
+        process_pretreatment.add_subprocess(FeedstockMilling())
+
+    if settings.user_inputs.processes.pelleting.included:
+        process_pretreatment.add_subprocess(FeedstockPelleting())
+
+    if settings.user_inputs.processes.bale_shredding.included:
+        process_pretreatment.add_subprocess(FeedstockBaleShredding())
+
+    return process_pretreatment
+
+
+def _calculate_process_requirements(process, **requirements_inputs):
+    """
+    Calculates the requirements of a process instantiated without default requirements.
+    """
+    process.calculate_requirements(**requirements_inputs)
+
+    return process
+
+
+def _calculate_process(process, **requirements_inputs):
+    """
+    Calculates the requirements, GWP, and TEA results of a process instantiated without default requirements.
+    """
+    _calculate_process_requirements(process, **requirements_inputs)
+    process.calculate_GWP()
+    process.calculate_TEA()
+
+    return process
+
+
+def _add_subprocess(process, subprocess):
+    """
+    Creates a new process with the requirements of a process and a calculated subprocess added, and calculates its
+    results. The given process is not changed, as other nodes may use it concurrently.
+    """
+    combined_process = type(process)(name=process.name, short_label=process.short_label,
+                                     information=process.information,
+                                     subprocesses=process.subprocesses + (subprocess, ),
+                                     requirements=process.requirements, instantiate_with_default_reqs=False)
+    combined_process.plot_style = process.plot_style
+    combined_process.calculate_GWP()
+    combined_process.calculate_TEA()
+
+    return combined_process
+
+
+def _calculate_biochar(ML_predictions):
+    """
+    Calculates the biochar application to soil process from the char yield predictions.
+    """
+    return _calculate_process(BiocharSoilApplication(short_label="Biochar", instantiate_with_default_reqs=False),
+                              biochar_yield_predictions=ML_predictions["Char yield [g/kg wb]"])
+
+
+def _calculate_carbon_capture(ML_predictions, syngas_combustion_object):
+    """
+    Calculates the carbon capture process from the outputs of the (already calculated) syngas combustion process.
+    """
+    return _calculate_process(CarbonCapture(instantiate_with_default_reqs=False),
+                              ML_predictions=ML_predictions,
+                              syngas_combustion_object=syngas_combustion_object,
+                              cc_method=settings.user_inputs.processes.carbon_capture.method)
@@ -0,0 +1,161 @@
+import time
+
+import numpy as np
+
+from functions.MonteCarloSimulation._run_simulation import run_simulation
+from functions.MonteCarloSimulation.random_number_generation import get_root_seed_sequence, set_random_seed
+from objects import StreamedResults
+
+# Default targets for the width of the confidence interval of each metric relative to the magnitude of its estimate
+_default_relative_targets = {"GWP_mean": 0.02,
+                             "BCR_mean": 0.02,
+                             "GWP_5th_percentile": 0.05,
+                             "GWP_95th_percentile": 0.05,
+                             "BCR_5th_percentile": 0.05,
+                             "BCR_95th_percentile": 0.05}
+
+# Default batch size and minimum number of Monte Carlo iterations - kept small, so that the confidence interval targets
+# rather than the batch size decide how many iterations are run
+_default_batch_size = 100
+_default_min_iterations = 200
+
+
+def get_convergence_summary(streamed_results, targets, relative_targets=True, confidence_level=0.95):
+    """
+    Calculates the confidence interval width of each convergence metric and compares it to its target.
+
+    Parameters
+    ----------
+    streamed_results: StreamedResults
+        Online statistics of the simulation run so far.
+    targets: dict
+        Target confidence interval width of each metric. Metrics are given as "<GWP/PV/AV/BCR>_mean" or
+        "<GWP/PV/AV/BCR>_<percentile>th_percentile" (e.g. "GWP_95th_percentile").
+    relative_targets: bool
+        Determines whether targets are given relative to the magnitude of the estimate or in absolute terms.
+    confidence_level: float
+        Confidence level of the confidence intervals as a decimal.
+
+    Returns
+    -------
+    dict
+        Estimate, confidence interval width, target width, and convergence status of each metric.
+    """
+    summary = {}
+    for metric, target in targets.items():
+        total, statistic = metric.split("_", 1)
+        statistics = streamed_results.totals[total]
+
+        if statistic == "mean":
+            estimate = statistics.mean
+            lower, upper = statistics.confidence_interval_mean(confidence_level)
+        elif statistic.endswith("th_percentile"):
+            q = float(statistic[:-len("th_percentile")]) / 100
+            estimate = float(statistics.quantile(q))
+            lower, upper = statistics.confidence_interval_quantile(q, confidence_level)
+        else:
+            raise ValueError(f"Convergence metric '{metric}' not supported.")
+
+        width = float(upper - lower)
+        target_width = target * abs(estimate) if relative_targets else target
+        summary[metric] = {"Estimate": estimate,
+                           "CI width": width,
+                           "Target width": target_width,
+                           "Converged": bool(width <= target_width)}
+
+    return summary
+
+
+def run_simulation_adaptive(targets=None, relative_targets=True, confidence_level=0.95, batch_size=None,
+                            min_iterations=None, max_iterations=100000, max_time=None, seed=None, n_bins=1000,
+                            show_progress=False):
+    """
+    Runs techno-economic and environmental simulation based on user inputs file defined in config.py in batches until
+    the confidence intervals of all convergence metrics are narrower than their targets, or until the iteration or time
+    budget is used up.
+
+    Parameters
+    ----------
+    targets: dict | None
+        Target confidence interval width of each metric (see get_convergence_summary). Defaults to a 2% relative width
+        for GWP_mean and BCR_mean and a 5% relative width for their 5th and 95th percentiles.
+    relative_targets: bool
+        Determines whether targets are given relative to the magnitude of the estimate or in absolute terms. Must be
+        True if the default targets are used.
+    confidence_level: float
+        Confidence level of the confidence intervals as a decimal.
+    batch_size: int | None
+        Number of Monte Carlo iterations per batch. Defaults to 100.
+    min_iterations: int | None
+        Minimum number of Monte Carlo iterations before convergence is checked. Defaults to 200.
+    max_iterations: int
+        Maximum number of Monte Carlo iterations.
+    max_time: float | None
+        Maximum run time in seconds. No new batch is started once exceeded. No limit if None.
+    seed: None | int | np.random.SeedSequence
+        Seed from which the seeds of all batches are derived.
+    n_bins: int
+        Number of histogram bins used for each distribution.
+    show_progress: bool
+        Determines whether the convergence status should be printed after each batch.
+
+    Returns
+    -------
+    StreamedResults
+        Online statistics of the total and process level results, including the number of iterations used and the
+        convergence summary.
+    """
+    # Get defaults
+    if targets is None:
+        if not relative_targets:
+            raise ValueError("The default targets are relative - give targets to use absolute targets.")
+        targets = _default_relative_targets
+
+    if batch_size is None:
+        batch_size = _default_batch_size
+
+    if min_iterations is None:
+        min_iterations = _default_min_iterations
+
+    set_random_seed(seed)
+    root_seed_sequence = get_root_seed_sequence()
+
+    # Run batches until converged or out of budget
+    streamed_results = StreamedResults(n_bins=n_bins)
+    convergence_summary = {}
+    converged = False
+    start_time = time.perf_counter()
+    while streamed_results.MC_iterations < max_iterations:
+        batch_seed_sequence = root_seed_sequence.spawn(1)[0]
+        streamed_results.update(run_simulation(show_figures=False, seed=batch_seed_sequence,
+                                               MC_iterations=min(batch_size,
+                                                                 max_iterations - streamed_results.MC_iterations)))
+
+        if streamed_results.MC_iterations >= min_iterations:
+            convergence_summary = get_convergence_summary(streamed_results, targets, relative_targets,
+                                                          confidence_level)
+            converged = all(metric["Converged"] for metric in convergence_summary.values())
+
+            if show_progress:
+                print(f"Iterations: {streamed_results.MC_iterations} - "
+                      f"converged metrics: {sum(metric['Converged'] for metric in convergence_summary.values())}"
+                      f"/{len(convergence_summary)}")
+
+            if converged:
+                break
+
+        if max_time is not None and time.perf_counter() - start_time > max_time:
+            break
+
+    if not converged:
+        convergence_summary = get_convergence_summary(streamed_results, targets, relative_targets, confidence_level)
+
+    streamed_results.converged = converged
+    streamed_results.convergence = convergence_summary
+    streamed_results.random_seed = root_seed_sequence.entropy
+
+    if show_progress:
+        print(f"Converged: {converged} after {streamed_results.MC_iterations} Monte Carlo iterations "
+              f"({np.round(time.perf_counter() - start_time, 1)} s).")
+
+    return streamed_results
@@ -0,0 +1,192 @@
+import copy
+
+import numpy as np
+
+from config import settings
+from functions.MonteCarloSimulation.distribution_creation import to_fixed_MC_array
+from functions.TEA import get_annual_operating_hours_draws, get_present_value_factor, get_annual_value_factor
+from objects import PresentValue, AnnualValue, FutureValue, ResultsMatrix
+
+# Parameters which only affect the economic results and can therefore be evaluated without rerunning the process models
+economic_scenario_parameters = ("carbon_tax", "rate_of_return_decimals", "system_life_span")
+
+
+def _get_conversion_factors(rates, periods):
+    """
+    Gets the factors converting annual values (AV) and future values (FV) to present values (PV) and PV and FV to AV.
+
+    Parameters
+    ----------
+    rates: ArrayLike
+        Rates of return as decimals - shaped (n_scenarios, 1).
+    periods: ArrayLike
+        Number of periods in years - shaped (n_scenarios, 1).
+
+    Returns
+    -------
+    dict
+        Conversion factors keyed by (from, to) value type - each shaped (n_scenarios, 1).
+    """
+    return {("AV", "PV"): get_present_value_factor("AV", rates, periods),
+            ("FV", "PV"): get_present_value_factor("FV", rates, periods),
+            ("PV", "AV"): get_annual_value_factor("PV", rates, periods),
+            ("FV", "AV"): get_annual_value_factor("FV", rates, periods)}
+
+
+def _get_scenario_cash_flows(CBA_result, rates, life_spans):
+    """
+    Gets the present and annual values of a cost or benefit for each scenario.
+
+    Parameters
+    ----------
+    CBA_result: CostBenefit
+        Cost or benefit object of the base simulation run.
+    rates: ArrayLike
+        Rate of return of each scenario - shaped (n_scenarios, 1).
+    life_spans: ArrayLike
+        System life span of each scenario - shaped (n_scenarios, 1).
+
+    Returns
+    -------
+    tuple[ArrayLike, ArrayLike]
+        Present and annual values - each shaped (n_scenarios, n_iterations).
+    """
+    requirement = CBA_result.requirement
+    n_scenarios = len(rates)
+
+    if not isinstance(requirement, (PresentValue, AnnualValue, FutureValue)):  # independent of economic parameters
+        values_PV = np.tile(np.array(CBA_result.values_PV, dtype=float).flatten(), (n_scenarios, 1))
+        values_AV = np.tile(np.array(CBA_result.values_AV, dtype=float).flatten(), (n_scenarios, 1))
+        return values_PV, values_AV
+
+    # Use scenario parameters unless the requirement defines its own
+    requirement_rates = rates if requirement.uses_default_rate_of_return else np.full((n_scenarios, 1),
+                                                                                     requirement.rate_of_return)
+    requirement_periods = life_spans if requirement.uses_default_number_of_periods else np.full(
+        (n_scenarios, 1), requirement.number_of_periods)
+    factors = _get_conversion_factors(requirement_rates, requirement_periods)
+    values = np.array(requirement.values, dtype=float).flatten()[np.newaxis, :]
+
+    if isinstance(requirement, PresentValue):
+        values_PV = np.tile(values, (n_scenarios, 1))
+        values_AV = values * factors[("PV", "AV")]
+    elif isinstance(requirement, AnnualValue):
+        values_PV = values * factors[("AV", "PV")]
+        values_AV = np.tile(values, (n_scenarios, 1))
+    else:
+        values_PV = values * factors[("FV", "PV")]
+        values_AV = values * factors[("FV", "AV")]
+
+    return values_PV, values_AV
+
+
+def run_economic_scenarios(results, scenarios):
+    """
+    Evaluates a batch of economic scenarios (e.g. from an optimisation grid) on the Monte Carlo draws of a single
+    simulation run. Scenarios may only differ in their carbon tax [currency/tonne CO2eq.], rate of return, and system
+    life span, so the process models do not need to be rerun. All scenarios are computed at once as arrays shaped
+    (n_scenarios, n_iterations).
+
+    Parameters
+    ----------
+    results: Results
+        Results of the base simulation run based on the user inputs currently defined in settings.
+    scenarios: list[dict]
+        Economic parameters of each scenario - keys are "carbon_tax" (fixed price), "rate_of_return_decimals", and
+        "system_life_span". Parameters which are not given are taken from the base simulation run.
+
+    Returns
+    -------
+    list[Results]
+        Results of each scenario - copies of the base results with their own economic results and PV and AV component
+        matrices. Process level economic results are those of the base simulation run.
+    """
+    for scenario in scenarios:
+        unsupported_parameters = set(scenario) - set(economic_scenario_parameters)
+        if unsupported_parameters:
+            raise ValueError(f"Parameters {unsupported_parameters} require the process models to be rerun.")
+
+    # Get economic parameters of each scenario
+    base_rate_of_return = settings.user_inputs.economic.rate_of_return_decimals
+    base_life_span = settings.user_inputs.general.system_life_span
+    rates = np.array([[scenario.get("rate_of_return_decimals", base_rate_of_return)] for scenario in scenarios],
+                     dtype=float)
+    life_spans = np.array([[scenario.get("system_life_span", base_life_span)] for scenario in scenarios], dtype=float)
+    carbon_tax_mask = np.array(["carbon_tax" in scenario for scenario in scenarios])
+    carbon_prices = np.array([[scenario.get("carbon_tax", 0)] for scenario in scenarios], dtype=float)
+
+    if np.any(life_spans != base_life_span) and (settings.user_inputs.processes.milling.included or
+                                                 settings.user_inputs.processes.pelleting.included):
+        raise ValueError("Equipment replacement of milling and pelleting depends on the system life span - "
+                         "run these scenarios individually.")
+
+    n_iterations = len(results.GWP_distribution)
+
+    # Costs and benefits of the base simulation run in each scenario
+    components = []
+    for process in results.processes:
+        for CBA_result in process.CBA_results:
+            values_PV, values_AV = _get_scenario_cash_flows(CBA_result, rates, life_spans)
+            components.append({"process": process.name,
+                               "process_short_label": process.short_label,
+                               "name": CBA_result.name,
+                               "short_label": CBA_result.short_label,
+                               "tag": CBA_result.tag,
+                               "cost": bool(CBA_result.cost),
+                               "benefit": bool(CBA_result.benefit),
+                               "values_PV": values_PV,
+                               "values_AV": values_AV})
+
+    # Carbon tax of scenarios which define their own carbon tax
+    if np.any(carbon_tax_mask):
+        system_size_tonnes_per_hour = settings.user_inputs.system_size.mass_basis_tonnes_per_hour
+        if settings.user_inputs.general.annual_operating_hours_user_imputed:
+            annual_operating_hours_array = to_fixed_MC_array(value=settings.user_inputs.general.annual_operating_hours,
+                                                             no_iterations=n_iterations)
+        else:
+            annual_operating_hours_array = np.array(get_annual_operating_hours_draws(
+                input_name="annual operating hours carbon price"))
+        system_size_tonnes_per_year_array = system_size_tonnes_per_hour * annual_operating_hours_array
+
+        GWP_tonnes_per_FU = np.array(results.GWP_distribution, dtype=float) / 1000  # tonnes CO2eq./FU
+        carbon_tax_AV = -1 * GWP_tonnes_per_FU * carbon_prices * system_size_tonnes_per_year_array
+        carbon_tax_PV = carbon_tax_AV * _get_conversion_factors(rates, life_spans)[("AV", "PV")]
+
+    # Split into results of each scenario - each scenario has its own component matrices and distributions, whereas
+    # the processes and all other results are shared with the base simulation run
+    scenario_results = []
+    for count, scenario in enumerate(scenarios):
+        scenario_components = [{**component, "values_PV": component["values_PV"][count],
+                                "values_AV": component["values_AV"][count]}
+                               for component in components
+                               if not (carbon_tax_mask[count] and component["name"] == "Carbon tax")]
+        if carbon_tax_mask[count]:  # replaces the carbon tax of the base simulation run
+            scenario_components.append({"process": "General",
+                                        "process_short_label": "Gen",
+                                        "name": "Carbon tax",
+                                        "short_label": "CT",
+                                        "tag": "Other",
+                                        "cost": bool(np.all(carbon_tax_PV[count] < 0)),
+                                        "benefit": bool(np.all(carbon_tax_PV[count] > 0)),
+                                        "values_PV": carbon_tax_PV[count],
+                                        "values_AV": carbon_tax_AV[count]})
+
+        matrices = dict(results.matrices)
+        for metric in ["PV", "AV"]:
+            matrices[metric] = ResultsMatrix.from_components(
+                metric, [{**component, "values": component[f"values_{metric}"]} for component in scenario_components],
+                n_iterations)
+
+        result = copy.copy(results)
+        result.matrices = matrices
+        result.PV_distribution = matrices["PV"].total()
+        result.AV_distribution = matrices["AV"].total()
+        result.BCR_distribution = (matrices["PV"].select(benefit=True).total() /
+                                   (-1 * matrices["PV"].select(cost=True).total()))
+        result.PV_mean = float(np.mean(result.PV_distribution))
+        result.AV_mean = float(np.mean(result.AV_distribution))
+        result.BCR_mean = float(np.mean(result.BCR_distribution))
+        result.economic_scenario = scenario
+        scenario_results.append(result)
+
+    return scenario_results
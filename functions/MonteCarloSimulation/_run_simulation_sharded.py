@@ -0,0 +1,234 @@
+import copy
+import os
+
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+
+from config import settings
+from functions.MonteCarloSimulation._run_simulation import run_simulation
+from functions.MonteCarloSimulation.random_number_generation import get_root_seed_sequence, set_random_seed
+from functions.MonteCarloSimulation.run_context import run_context
+from objects import to_float_array
+
+# Attributes holding Monte Carlo distributions which are merged across shards and the means derived from them
+_distribution_attributes = {"values": "mean",
+                            "values_PV": "values_PV_mean",
+                            "values_AV": "values_AV_mean",
+                            "GWP_distribution": "GWP_mean",
+                            "PV_distribution": "PV_mean",
+                            "AV_distribution": "AV_mean",
+                            "BCR_distribution": "BCR_mean"}
+
+
+def _run_simulation_shard(user_inputs, MC_iterations, seed_sequence):
+    """
+    Runs a single shard of a sharded simulation on a worker process.
+
+    Parameters
+    ----------
+    user_inputs: dict
+        User inputs of the parent process - ensures runtime changes to settings are available to the worker.
+    MC_iterations: int
+        Number of Monte Carlo iterations of the shard.
+    seed_sequence: np.random.SeedSequence
+        Seed sequence of the shard.
+
+    Returns
+    -------
+    Results
+        Results object of the shard with all metrics calculated.
+    """
+    settings.set("user_inputs", user_inputs, merge=False)
+    settings.user_inputs.general.MC_iterations = MC_iterations
+
+    results = run_simulation(show_figures=False, seed=seed_sequence)
+    results.calculate_all()  # calculated within the shard's run, so that metrics are not recalculated when merging
+
+    return results
+
+
+def _merge_distributions(shard_objects, merged_ids):
+    """
+    Concatenates the Monte Carlo distributions of corresponding objects of each shard into the first object and
+    updates the associated means.
+
+    Parameters
+    ----------
+    shard_objects: tuple
+        Corresponding objects (e.g. requirements, GWP or CostBenefit objects) of each shard.
+    merged_ids: set
+        IDs of objects which have already been merged - objects are shared between processes and their subprocesses.
+    """
+    merged_object = shard_objects[0]
+    if id(merged_object) in merged_ids:
+        return
+    merged_ids.add(id(merged_object))
+
+    for distribution_attribute, mean_attribute in _distribution_attributes.items():
+        if getattr(merged_object, distribution_attribute, None) is None:
+            continue
+        merged_distribution = np.concatenate([to_float_array(getattr(shard_object, distribution_attribute))
+                                              for shard_object in shard_objects])
+        # Inputs and results are merged together, so set without assigning new versions to changed requirements -
+        # stored results remain up to date
+        object.__setattr__(merged_object, distribution_attribute, merged_distribution)
+        if hasattr(merged_object, mean_attribute):
+            object.__setattr__(merged_object, mean_attribute, float(np.mean(merged_distribution)))
+
+
+def _merge_processes(shard_processes, merged_ids):
+    """
+    Merges corresponding processes of each shard, including their requirements, GWP and CostBenefit results, and
+    subprocesses.
+
+    Parameters
+    ----------
+    shard_processes: tuple[Process]
+        Corresponding process of each shard.
+    merged_ids: set
+        IDs of objects which have already been merged.
+    """
+    _merge_distributions(shard_processes, merged_ids)
+
+    # Requirements
+    for shard_requirements in zip(*[process.requirements for process in shard_processes]):
+        for requirement_field in fields(shard_requirements[0]):
+            if requirement_field.name in ["name", "_version"]:
+                continue
+            for shard_requirement in zip(*[getattr(requirements, requirement_field.name)
+                                           for requirements in shard_requirements]):
+                _merge_distributions(shard_requirement, merged_ids)
+
+    # GWP and CostBenefit results
+    for shard_GWP_result in zip(*[process.GWP_results or () for process in shard_processes]):
+        _merge_distributions(shard_GWP_result, merged_ids)
+    for shard_CBA_result in zip(*[process.CBA_results or () for process in shard_processes]):
+        _merge_distributions(shard_CBA_result, merged_ids)
+
+    # Subprocesses
+    for shard_subprocesses in zip(*[process.subprocesses for process in shard_processes]):
+        _merge_processes(shard_subprocesses, merged_ids)
+
+
+def merge_results(shard_results):
+    """
+    Merges the results of several simulation shards into a single results object as if all Monte Carlo iterations had
+    been run at once. All shards must have been run with the same user inputs. Process models are not rerun - all
+    metrics of each shard must have been calculated (see Results.calculate_all) before merging.
+
+    Parameters
+    ----------
+    shard_results: list[Results]
+        Results objects of each shard.
+
+    Returns
+    -------
+    Results
+        Merged results object (the first shard's results object is updated in place).
+    """
+    merged_results = shard_results[0]
+    merged_ids = set()
+
+    # Merge the metrics calculated within each shard's run
+    if not all(results.is_up_to_date() for results in shard_results):
+        raise ValueError("Calculate all results of each shard (Results.calculate_all) before merging.")
+
+    # Processes
+    for shard_processes in zip(*[results.processes for results in shard_results]):
+        _merge_processes(shard_processes, merged_ids)
+
+    # Global GWP and economic results
+    _merge_distributions(shard_results, merged_ids)
+
+    # Columnar store of the component distributions
+    merged_results.build_results_matrices()
+
+    # Energy results
+    for energy_attribute in ["electricity_results", "heat_results"]:
+        if getattr(merged_results, energy_attribute) is None:
+            continue
+        shard_energy_results = [getattr(results, energy_attribute) for results in shard_results]
+        total_distribution = np.concatenate([energy_results["Total MC distribution"]
+                                             for energy_results in shard_energy_results])
+        component_distributions = np.concatenate([energy_results["Component distributions"]
+                                                  for energy_results in shard_energy_results], axis=1)
+        energy_matrix = merged_results.matrices.get(energy_attribute.split("_")[0])
+        if energy_matrix is not None:
+            energy_matrix.values = component_distributions
+        getattr(merged_results, energy_attribute).update(
+            {"Total mean": np.mean(total_distribution),
+             "Total MC distribution": total_distribution,
+             "Component distributions": component_distributions,
+             "Component means": np.mean(component_distributions, axis=1)})
+
+    # Control variates - inputs are recorded in the same order in each shard
+    if all(results.control_variates is not None for results in shard_results):
+        merged_results.control_variates = [
+            (np.concatenate([draws for draws, _ in shard_control_variates]), shard_control_variates[0][1])
+            for shard_control_variates in zip(*[results.control_variates for results in shard_results])]
+
+    return merged_results
+
+
+def run_simulation_sharded(MC_iterations=None, n_shards=None, max_workers=None, seed=None, show_figures=True):
+    """
+    Runs techno-economic and environmental simulation based on user inputs file defined in config.py, with the Monte
+    Carlo iterations split into shards which are run in parallel on a pool of worker processes. The shard results are
+    merged into a single results object. For a given seed and number of shards results are reproducible.
+
+    Parameters
+    ----------
+    MC_iterations: int | None
+        Total number of Monte Carlo iterations. Defaults to the number defined in settings.
+    n_shards: int | None
+        Number of shards the iterations are split into. Defaults to the number of workers.
+    max_workers: int | None
+        Maximum number of worker processes. Defaults to the number of CPUs.
+    seed: None | int | np.random.SeedSequence
+        Seed from which the seeds of all shards are derived.
+    show_figures: bool
+        Determines whether figures should be shown.
+
+    Returns
+    -------
+    Results
+        Merged results of all shards.
+    """
+    # Get defaults
+    if MC_iterations is None:
+        MC_iterations = settings.user_inputs.general.MC_iterations
+
+    if max_workers is None:
+        max_workers = os.cpu_count()
+
+    if n_shards is None:
+        n_shards = max_workers
+
+    n_shards = min(n_shards, MC_iterations)  # each shard requires at least one iteration
+
+    # Split iterations and seeds into shards
+    shard_iterations = [len(shard) for shard in np.array_split(np.arange(MC_iterations), n_shards)]
+    set_random_seed(seed)
+    root_seed_sequence = get_root_seed_sequence()
+    shard_seed_sequences = root_seed_sequence.spawn(n_shards)
+
+    # Run shards
+    user_inputs = copy.deepcopy(dict(settings.user_inputs))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        shard_results = list(executor.map(_run_simulation_shard,
+                                          [user_inputs] * n_shards,
+                                          shard_iterations,
+                                          shard_seed_sequences))
+
+    # Merge shards - within the total number of iterations, without changing the settings of later runs
+    with run_context(MC_iterations=MC_iterations):
+        results = merge_results(shard_results)
+    results.random_seed = root_seed_sequence.entropy
+
+    # Plot results
+    if show_figures:
+        results.plot_all_results()
+
+    return results
@@ -0,0 +1,53 @@
+import numpy as np
+
+from config import settings
+from functions.MonteCarloSimulation._run_simulation import run_simulation
+from functions.MonteCarloSimulation.random_number_generation import get_root_seed_sequence, set_random_seed
+from objects import StreamedResults
+
+
+def run_simulation_streaming(MC_iterations=None, chunk_size=None, seed=None, n_bins=1000):
+    """
+    Runs techno-economic and environmental simulation based on user inputs file defined in config.py in fixed-size
+    chunks. Each chunk's distributions are folded into online statistics (mean, variance, histogram, and quantiles)
+    and then discarded, so memory use stays flat regardless of the number of Monte Carlo iterations.
+
+    Parameters
+    ----------
+    MC_iterations: int | None
+        Total number of Monte Carlo iterations. Defaults to the number defined in settings.
+    chunk_size: int | None
+        Number of Monte Carlo iterations per chunk. Defaults to the number defined in settings.
+    seed: None | int | np.random.SeedSequence
+        Seed from which the seeds of all chunks are derived.
+    n_bins: int
+        Number of histogram bins used for each distribution.
+
+    Returns
+    -------
+    StreamedResults
+        Online statistics of the total and process level results.
+    """
+    # Get defaults
+    default_MC_iterations = settings.user_inputs.general.MC_iterations
+    if MC_iterations is None:
+        MC_iterations = default_MC_iterations
+
+    if chunk_size is None:
+        chunk_size = default_MC_iterations
+
+    # Split iterations and seeds into chunks
+    n_chunks = int(np.ceil(MC_iterations / chunk_size))
+    chunk_iterations = [min(chunk_size, MC_iterations - chunk_no * chunk_size) for chunk_no in range(n_chunks)]
+    set_random_seed(seed)
+    root_seed_sequence = get_root_seed_sequence()
+    chunk_seed_sequences = root_seed_sequence.spawn(n_chunks)
+
+    # Run chunks and fold their results into online statistics
+    streamed_results = StreamedResults(n_bins=n_bins)
+    for iterations, chunk_seed_sequence in zip(chunk_iterations, chunk_seed_sequences):
+        streamed_results.update(run_simulation(show_figures=False, seed=chunk_seed_sequence, MC_iterations=iterations))
+
+    streamed_results.random_seed = root_seed_sequence.entropy
+
+    return streamed_results
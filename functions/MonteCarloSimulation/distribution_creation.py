@@ -4,6 +4,10 @@ from config import settings
 from numpy.typing import ArrayLike
 from dynaconf.utils.boxing import DynaBox
 from objects import triangular_dist_maker, gaussian_dist_maker, fixed_dist_maker, range_dist_maker
+from functions.MonteCarloSimulation.random_number_generation import get_rng
+from functions.MonteCarloSimulation.sampling import (get_sampling_method, get_antithetic_sampling, get_unit_draws,
+                                                     inverse_cdf, record_control_variate, get_common_random_numbers,
+                                                     get_input_rng)
 
 
 def to_fixed_MC_array(value, no_iterations=None):
@@ -31,44 +35,91 @@ def to_fixed_MC_array(value, no_iterations=None):
     return mc_array
 
 
-def get_distribution_draws(distribution_maker, length_array=settings.user_inputs.general.MC_iterations):
+def get_distribution_draws(distribution_maker, length_array=None, rng=None, sampling_method=None, dimension=None,
+                           antithetic=None, input_name=None):
     """
-    Function to get draws from a given distribution type (e.g. gaussian, triangular, fixed).
+    Function to get draws from a given distribution type (e.g. gaussian, triangular, fixed). Draws are either plain
+    pseudo-random draws or stratified (Latin hypercube) / quasi-random (scrambled Sobol) draws transformed through the
+    inverse cumulative distribution function of the distribution.
 
     Parameters
     ----------
     distribution_maker: triangular_dist_maker | gaussian_dist_maker | fixed_dist_maker | range_dist_maker
         Named tuple defining the variables of the distribution. Defined in objects/generic_objects.py.
         Contains variables (e.g. mean, std, lower, upper, mode) defining the given distribution.
-    length_array: int
+    length_array: int | None
         Length of created array. Default value is the number of Monte Carlo iterations loaded from settings.
         If set to 1 only a single value is drawn from distribution.
+    rng: np.random.Generator | None
+        Random number generator used for the draws. Defaults to a child stream of the stream of the process currently
+        being evaluated (see use_random_stream) - the input's own stream if input_name is given and the
+        "distribution draws" stream otherwise - for random sampling and the "sampling" stream otherwise.
+    sampling_method: str | None
+        "random", "lhs", or "sobol". Defaults to the method defined in settings.user_inputs.general.sampling_method
+        ("random" if not defined).
+    dimension: int | None
+        Dimension index of the uncertain input within the Latin hypercube / Sobol sampling plan. If None, inputs are
+        assigned the next unused dimension in order of first use.
+    antithetic: bool | None
+        Determines whether antithetic pairs of draws are used. Defaults to the setting defined in
+        settings.user_inputs.general.antithetic_sampling (False if not defined).
+    input_name: str | None
+        Name of the uncertain input. Named inputs draw from their own random number stream - with common random
+        numbers (settings.user_inputs.general.common_random_numbers) each draw of the input is given a new stream.
+        Common random numbers are not supported with Sobol sampling.
 
     Returns
     -------
     ArrayLike | float
         Numpy array of distribution values or float if length_array has been set as 1.
     """
-    # np.random.seed(random_state)  # set random seed
+    # Get defaults
+    if length_array is None:
+        length_array = settings.user_inputs.general.MC_iterations
+
+    if sampling_method is None:
+        sampling_method = get_sampling_method()
+
+    if antithetic is None:
+        antithetic = get_antithetic_sampling()
+
+    if rng is None and input_name is not None and get_common_random_numbers():
+        if sampling_method == "sobol" and not isinstance(distribution_maker, fixed_dist_maker):
+            raise ValueError("Common random numbers are not supported with Sobol sampling, as the Sobol dimension of an "
+                             "input depends on the order in which inputs are drawn. Use 'random' or 'lhs' sampling.")
+        rng = get_input_rng(input_name)
+
+    if (sampling_method != "random" or antithetic) and not isinstance(distribution_maker, fixed_dist_maker):
+        unit_draws = get_unit_draws(length_array, sampling_method=sampling_method, dimension=dimension, rng=rng,
+                                    antithetic=antithetic)
+        distribution = inverse_cdf(distribution_maker, unit_draws)
+        record_control_variate(distribution, distribution_maker)
+        if length_array == 1:
+            distribution = float(distribution[0])
+
+        return distribution
+
+    if rng is None:
+        rng = get_rng(f"component: {input_name}" if input_name is not None else "distribution draws")
 
     if isinstance(distribution_maker, gaussian_dist_maker):
-        distribution = np.random.default_rng().normal(loc=distribution_maker.mean, scale=distribution_maker.std,
-                                                      size=length_array)
+        distribution = rng.normal(loc=distribution_maker.mean, scale=distribution_maker.std, size=length_array)
 
     elif isinstance(distribution_maker, triangular_dist_maker):
-        distribution = np.random.default_rng().triangular(left=distribution_maker.lower, mode=distribution_maker.mode,
-                                                          right=distribution_maker.upper, size=length_array)
+        distribution = rng.triangular(left=distribution_maker.lower, mode=distribution_maker.mode,
+                                      right=distribution_maker.upper, size=length_array)
 
     elif isinstance(distribution_maker, fixed_dist_maker):
         distribution = to_fixed_MC_array(value=distribution_maker.value, no_iterations=length_array)
 
     elif isinstance(distribution_maker, range_dist_maker):
-        distribution = np.random.default_rng().uniform(low=distribution_maker.low, high=distribution_maker.high,
-                                                       size=length_array)
+        distribution = rng.uniform(low=distribution_maker.low, high=distribution_maker.high, size=length_array)
 
     else:
         raise ValueError("Warning: Distribution type not supported. Currently only 'gaussian_dist_maker' supported.")
 
+    record_control_variate(distribution, distribution_maker)
+
     if length_array == 1:
         distribution = float(distribution)
 
@@ -0,0 +1,147 @@
+import contextvars
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from config import settings
+from functions.MonteCarloSimulation.random_number_generation import get_random_stream, use_random_stream
+from functions.MonteCarloSimulation.sampling import use_sampling_plan
+
+
+class ProcessGraph:
+    """
+    Declarative dependency graph (DAG) of the steps of a simulation run - e.g. ML predictions, the CHP heat output,
+    or the processes themselves. Each node states which other nodes it takes as inputs, so that every node is
+    evaluated exactly once and its result is shared by all nodes depending on it. Each node draws from its own random
+    number stream, derived from the stream the graph is evaluated in and the node's name, and its own slice of the
+    sampling plan. Independent nodes can be evaluated concurrently on a thread pool - nodes must therefore not change
+    the results of their input nodes.
+
+    Methods
+    -------
+    add_node(name, function, inputs=None, after=None)
+        Adds a node to the graph.
+    get_evaluation_order()
+        Gets an order in which all nodes can be evaluated.
+    evaluate(max_workers=None)
+        Evaluates all nodes and returns their results.
+    """
+    def __init__(self):
+        self.nodes = {}
+
+    def add_node(self, name, function, inputs=None, after=None):
+        """
+        Adds a node to the graph.
+
+        Parameters
+        ----------
+        name: str
+            Unique name of the node.
+        function: Callable
+            Function evaluating the node. It is called with the results of its input nodes as keyword arguments.
+        inputs: dict[str, str] | None
+            Maps keyword arguments of the function to the names of the nodes whose results are passed.
+        after: tuple[str] | None
+            Names of nodes which need to be evaluated first without their results being passed (e.g. steps which
+            update settings).
+        """
+        if name in self.nodes:
+            raise ValueError(f"Node '{name}' already exists.")
+
+        # Get defaults
+        if inputs is None:
+            inputs = {}
+
+        if after is None:
+            after = ()
+
+        self.nodes[name] = {"function": function,
+                            "inputs": dict(inputs),
+                            "dependencies": tuple(dict.fromkeys(tuple(inputs.values()) + tuple(after)))}
+
+    def get_evaluation_order(self):
+        """
+        Gets an order in which all nodes can be evaluated, i.e. each node follows its dependencies. Nodes are kept in
+        the order they were added where possible.
+
+        Returns
+        -------
+        list[str]
+            Names of all nodes in evaluation order.
+        """
+        for name, node in self.nodes.items():
+            for dependency in node["dependencies"]:
+                if dependency not in self.nodes:
+                    raise ValueError(f"Node '{name}' depends on unknown node '{dependency}'.")
+
+        evaluation_order = []
+        remaining = list(self.nodes)
+        while remaining:
+            ready = [name for name in remaining
+                     if all(dependency in evaluation_order for dependency in self.nodes[name]["dependencies"])]
+            if not ready:
+                raise ValueError(f"Process graph contains a cycle between nodes {remaining}.")
+            evaluation_order.append(ready[0])
+            remaining.remove(ready[0])
+
+        return evaluation_order
+
+    def _evaluate_node(self, name, results, random_stream):
+        node = self.nodes[name]
+        with use_random_stream(random_stream.child(name)), use_sampling_plan(name):
+            return node["function"](**{argument: results[input_name]
+                                       for argument, input_name in node["inputs"].items()})
+
+    def evaluate(self, max_workers=None):
+        """
+        Evaluates all nodes once each. With a single worker nodes are evaluated in the order given by
+        get_evaluation_order. With several workers each node is started as soon as its dependencies are available.
+        As each node draws from its own random number stream and sampling plan, random draws are identical between
+        runs with the same seed either way.
+
+        Parameters
+        ----------
+        max_workers: int | None
+            Maximum number of threads evaluating nodes concurrently. Defaults to
+            settings.user_inputs.general.process_graph_workers (1 if not defined).
+
+        Returns
+        -------
+        dict
+            Result of each node.
+        """
+        # Get defaults
+        if max_workers is None:
+            max_workers = settings.user_inputs.general.get("process_graph_workers", 1)
+
+        evaluation_order = self.get_evaluation_order()  # also validates the graph
+        random_stream = get_random_stream()  # passed on explicitly, as worker threads do not share the current stream
+        results = {}
+
+        if max_workers == 1:
+            for name in evaluation_order:
+                results[name] = self._evaluate_node(name, results, random_stream)
+            return results
+
+        remaining = list(evaluation_order)
+        running = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while remaining or running:
+                # Start all nodes whose dependencies are available
+                for name in [name for name in remaining
+                             if all(dependency in results for dependency in self.nodes[name]["dependencies"])]:
+                    # Run in a copy of the current context, so that nested sampling plans are named as without workers
+                    running[executor.submit(contextvars.copy_context().run, self._evaluate_node, name, dict(results),
+                                            random_stream)] = name
+                    remaining.remove(name)
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except BaseException:
+                        for pending_future in running:
+                            pending_future.cancel()
+                        raise
+
+        return results
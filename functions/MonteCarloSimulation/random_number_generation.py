@@ -0,0 +1,246 @@
+import contextvars
+import threading
+import zlib
+
+import numpy as np
+
+from contextlib import contextmanager
+
+from config import settings
+
+
+class RandomStream:
+    """
+    Random number stream of a simulation run, process, or component. Child streams are derived from the stream's seed
+    sequence by name, so that draws of one process or component do not depend on how many values other processes or
+    components have drawn. Generators and child streams are created once and reused.
+
+    Attributes
+    ----------
+    seed_sequence: np.random.SeedSequence
+        Seed sequence of the stream.
+
+    Methods
+    -------
+    child(stream_name)
+        Gets a named child stream.
+    next_child(stream_name)
+        Gets a new child stream each time it is called with the same name.
+    get_rng(stream_name=None)
+        Gets the random number generator of the stream or of a named child stream.
+    """
+    def __init__(self, seed_sequence):
+        self.seed_sequence = seed_sequence
+        self._rng = None
+        self._children = {}
+        self._occurrences = {}
+        self._lock = threading.Lock()  # child streams may be requested by concurrently evaluated processes
+
+    def child(self, stream_name):
+        """
+        Gets a named child stream - the same name always gives the same stream.
+
+        Parameters
+        ----------
+        stream_name: str
+            Name of the child stream (e.g. a process or component).
+
+        Returns
+        -------
+        RandomStream
+            Child stream.
+        """
+        with self._lock:
+            if stream_name not in self._children:
+                child_seed_sequence = np.random.SeedSequence(entropy=self.seed_sequence.entropy,
+                                                             spawn_key=self.seed_sequence.spawn_key +
+                                                             (zlib.crc32(stream_name.encode()),),
+                                                             pool_size=self.seed_sequence.pool_size)
+                self._children[stream_name] = RandomStream(child_seed_sequence)
+
+            return self._children[stream_name]
+
+    def next_child(self, stream_name):
+        """
+        Gets a new child stream each time it is called with the same name (e.g. for repeated draws of an uncertain
+        input). Children are numbered consecutively, so that the n-th call always gives the same stream.
+
+        Parameters
+        ----------
+        stream_name: str
+            Name of the child streams.
+
+        Returns
+        -------
+        RandomStream
+            Child stream.
+        """
+        with self._lock:
+            occurrence = self._occurrences.get(stream_name, 0)
+            self._occurrences[stream_name] = occurrence + 1
+
+        return self.child(f"{stream_name} #{occurrence}")
+
+    def get_rng(self, stream_name=None):
+        """
+        Gets the random number generator of the stream or, if a name is given, of the named child stream.
+
+        Parameters
+        ----------
+        stream_name: str | None
+            Name of the child stream.
+
+        Returns
+        -------
+        np.random.Generator
+            Random number generator.
+        """
+        if stream_name is not None:
+            return self.child(stream_name).get_rng()
+
+        with self._lock:
+            if self._rng is None:
+                self._rng = np.random.default_rng(self.seed_sequence)
+
+            return self._rng
+
+
+# Root stream of the current simulation run and the stream of the process or component currently being evaluated
+_root_stream = None
+_current_stream = contextvars.ContextVar("current random stream", default=None)
+
+
+def set_random_seed(seed=None):
+    """
+    Resets the root seed sequence from which all random number generator (RNG) streams of a simulation run are derived.
+    Calling this function with the same seed makes all subsequent Monte Carlo draws reproducible.
+
+    Parameters
+    ----------
+    seed: None | int | np.random.SeedSequence
+        Seed of the simulation run. If None, the seed defined in settings.user_inputs.general.random_seed is used and
+        if no seed is defined there fresh entropy is drawn from the OS. A SeedSequence can be given directly (e.g. a
+        child sequence handed to a worker process).
+
+    Returns
+    -------
+    np.random.SeedSequence
+        Root seed sequence of the simulation run. Its entropy can be used to reproduce the run.
+    """
+    global _root_stream
+
+    # Get defaults
+    if seed is None:
+        seed = settings.user_inputs.general.get("random_seed", None)
+
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    # Streams derived from the previous root seed sequence are discarded (kept by results which still need them)
+    _root_stream = RandomStream(seed)
+
+    return _root_stream.seed_sequence
+
+
+def get_root_seed_sequence():
+    """
+    Gets the root seed sequence of the current simulation run. Initialises it from settings if not yet set.
+
+    Returns
+    -------
+    np.random.SeedSequence
+        Root seed sequence of the simulation run.
+    """
+    if _root_stream is None:
+        set_random_seed()
+
+    return _root_stream.seed_sequence
+
+
+def get_random_stream():
+    """
+    Gets the random number stream of the process or component currently being evaluated (see use_random_stream), or
+    the root stream of the simulation run outside of processes.
+
+    Returns
+    -------
+    RandomStream
+        Current random number stream.
+    """
+    get_root_seed_sequence()  # initialise root stream if required
+
+    return _current_stream.get() or _root_stream
+
+
+@contextmanager
+def use_random_stream(stream):
+    """
+    Context manager which evaluates a process or component within its own random number stream. All draws within the
+    context (e.g. via get_rng or get_distribution_draws) are taken from child streams of this stream, so they do not
+    depend on the draws of other processes or components. The previous stream is restored on exit.
+
+    Parameters
+    ----------
+    stream: str | RandomStream
+        Stream to be used - a name gives the named child stream of the current stream.
+
+    Examples
+    --------
+    >>> with use_random_stream("Gasification"):
+    ...     process.calculate_TEA()
+    """
+    if not isinstance(stream, RandomStream):
+        stream = get_random_stream().child(stream)
+
+    token = _current_stream.set(stream)
+    try:
+        yield stream
+    finally:
+        _current_stream.reset(token)
+
+
+def get_rng(stream_name="default"):
+    """
+    Gets the random number generator of a named child stream (e.g. of a component) of the current stream - i.e. of the
+    process being evaluated or of the simulation run outside of processes. Each child stream is derived from its
+    parent's seed sequence and its name, so draws of one component do not depend on how many values other components
+    have drawn. The generator is created once and reused on subsequent calls.
+
+    Parameters
+    ----------
+    stream_name: str
+        Name of the stream.
+
+    Returns
+    -------
+    np.random.Generator
+        Random number generator of the given stream.
+    """
+    return get_random_stream().get_rng(stream_name)
+
+
+@contextmanager
+def use_random_seed(seed):
+    """
+    Context manager which temporarily sets the root seed sequence of a simulation run (e.g. to calculate results of a
+    previous run lazily after another run has started). Streams are derived anew from the seed, so that processes and
+    components draw the same values as in a run started with this seed. The current streams are restored on exit.
+
+    Parameters
+    ----------
+    seed: int | np.random.SeedSequence
+        Seed of the simulation run - see set_random_seed.
+    """
+    global _root_stream
+
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    previous_root_stream = _root_stream
+    _root_stream = RandomStream(seed)
+    token = _current_stream.set(None)
+    try:
+        yield
+    finally:
+        _current_stream.reset(token)
+        _root_stream = previous_root_stream
@@ -0,0 +1,36 @@
+import copy
+
+from contextlib import contextmanager
+
+from config import settings
+
+
+@contextmanager
+def run_context(MC_iterations=None, user_inputs=None):
+    """
+    Context manager which temporarily overrides the user inputs of a simulation run. All process models and functions
+    resolve their defaults (e.g. number of Monte Carlo iterations, feedstock composition) from settings when they are
+    called, so overrides take effect without reimporting any modules. The previous user inputs are restored on exit.
+
+    Parameters
+    ----------
+    MC_iterations: int | None
+        Number of Monte Carlo iterations of the run. Not overridden if None.
+    user_inputs: dict | None
+        Nested dictionary of user inputs which are merged into the current user inputs
+        (e.g. {"feedstock": {"carbon": 50.1}}). Not overridden if None.
+
+    Examples
+    --------
+    >>> with run_context(MC_iterations=100):
+    ...     screening_results = run_simulation(show_figures=False)
+    """
+    previous_user_inputs = copy.deepcopy(dict(settings.user_inputs))  # nested inputs may be changed in place
+    try:
+        if user_inputs is not None:
+            settings.set("user_inputs", user_inputs, merge=True)
+        if MC_iterations is not None:
+            settings.user_inputs.general.MC_iterations = MC_iterations
+        yield settings.user_inputs
+    finally:
+        settings.set("user_inputs", previous_user_inputs, merge=False)
@@ -0,0 +1,327 @@
+import contextvars
+import threading
+
+import numpy as np
+
+from contextlib import contextmanager
+from scipy.stats import norm, qmc
+
+from config import settings
+from functions.MonteCarloSimulation.random_number_generation import get_rng, get_root_seed_sequence, get_random_stream
+from objects import triangular_dist_maker, gaussian_dist_maker, fixed_dist_maker, range_dist_maker
+
+# Supported sampling methods
+sampling_methods = ("random", "lhs", "sobol")
+
+# Number of dimensions of the scrambled Sobol sequence - inputs beyond this fall back to Latin hypercube sampling
+_sobol_dimensions = 64
+
+
+class _SamplingPlan:
+    """
+    Sampling plan of a simulation run or of one of its process graph nodes - the next unused dimension, the Sobol
+    samples (keyed by number of iterations), and the draws of uncertain inputs with their expected values.
+    """
+    def __init__(self):
+        self.next_dimension = 0
+        self.sobol_samples = {}
+        self.control_variates = []
+
+
+# Sampling plans of the current simulation run keyed by the names of the nodes they belong to (() for the run itself)
+# - reset whenever a new root seed sequence is set. Each process graph node has its own plan, so that the dimensions
+# and draws of its inputs do not depend on the order in which concurrently evaluated nodes draw.
+_sampling_plan_seed_sequence = None
+_sampling_plans = {}
+_current_sampling_plan = contextvars.ContextVar("current sampling plan", default=())
+_sampling_plan_lock = threading.Lock()  # plans may be requested by concurrently evaluated nodes
+
+
+def get_sampling_method():
+    """
+    Gets the sampling method defined in settings.user_inputs.general.sampling_method ("random" by default).
+
+    Returns
+    -------
+    str
+        Sampling method - "random", "lhs" (Latin hypercube sampling), or "sobol" (scrambled Sobol sequence).
+    """
+    sampling_method = settings.user_inputs.general.get("sampling_method", "random")
+    if sampling_method not in sampling_methods:
+        raise ValueError(f"Sampling method '{sampling_method}' not supported. Use one of {sampling_methods}.")
+
+    return sampling_method
+
+
+def get_antithetic_sampling():
+    """
+    Gets whether antithetic sampling is defined in settings.user_inputs.general.antithetic_sampling (False by default).
+
+    Returns
+    -------
+    bool
+        Whether antithetic sampling is used.
+    """
+    return bool(settings.user_inputs.general.get("antithetic_sampling", False))
+
+
+def get_common_random_numbers():
+    """
+    Gets whether common random numbers are defined in settings.user_inputs.general.common_random_numbers (False by
+    default).
+
+    Returns
+    -------
+    bool
+        Whether common random numbers are used.
+    """
+    return bool(settings.user_inputs.general.get("common_random_numbers", False))
+
+
+def get_record_control_variates():
+    """
+    Gets whether the draws of uncertain inputs are recorded as control variates, as defined in
+    settings.user_inputs.general.record_control_variates (False by default). Recording stores the draws of every
+    uncertain input with the results of a run, so it is only switched on when control variate estimates are needed.
+
+    Returns
+    -------
+    bool
+        Whether control variates are recorded.
+    """
+    return bool(settings.user_inputs.general.get("record_control_variates", False))
+
+
+def get_input_rng(input_name):
+    """
+    Gets the random number generator of a named uncertain input (e.g. an O&M ratio, price, or CAPEX error). Each input
+    draws from its own child stream of the current process' stream, so that runs with the same seed reuse the same
+    underlying random numbers for each input no matter which other inputs are drawn (common random numbers). Repeated
+    draws of the same input within a process are given consecutive streams.
+
+    Parameters
+    ----------
+    input_name: str
+        Name of the uncertain input.
+
+    Returns
+    -------
+    np.random.Generator
+        Random number generator of the given input.
+    """
+    return get_random_stream().next_child(f"input: {input_name}").get_rng()
+
+
+def reset_sampling_plan():
+    """
+    Resets the sampling plan at the start of a simulation run, so that each uncertain input is assigned the same
+    dimension index (in order of first use within its process graph node) in every run. Called automatically when a
+    new random seed is set.
+    """
+    global _sampling_plan_seed_sequence
+    with _sampling_plan_lock:
+        _sampling_plan_seed_sequence = get_root_seed_sequence()
+        _sampling_plans.clear()
+
+
+def _get_sampling_plan():
+    """
+    Gets the sampling plan of the current process graph node. The plans are reset if a new root seed sequence has been
+    set since they were last used.
+    """
+    if _sampling_plan_seed_sequence is not get_root_seed_sequence():
+        reset_sampling_plan()
+
+    with _sampling_plan_lock:
+        return _sampling_plans.setdefault(_current_sampling_plan.get(), _SamplingPlan())
+
+
+@contextmanager
+def use_sampling_plan(plan_name):
+    """
+    Context manager which draws all uncertain inputs within it from their own slice of the sampling plan (e.g. for a
+    process graph node), i.e. their dimensions are numbered from 0 and their Sobol samples are scrambled separately.
+    Plans are nested, so the same name in different parent plans gives different plans.
+
+    Parameters
+    ----------
+    plan_name: str
+        Name of the sampling plan.
+    """
+    token = _current_sampling_plan.set(_current_sampling_plan.get() + (plan_name, ))
+    try:
+        yield
+    finally:
+        _current_sampling_plan.reset(token)
+
+
+def get_unit_draws(length_array, sampling_method=None, dimension=None, rng=None, antithetic=None):
+    """
+    Gets stratified or quasi-random draws on the unit interval for a single uncertain input.
+
+    Parameters
+    ----------
+    length_array: int
+        Number of draws.
+    sampling_method: str | None
+        "random", "lhs", or "sobol". Defaults to the method defined in settings.
+    dimension: int | None
+        Dimension index of the uncertain input. If None, the next unused dimension of the current sampling plan is
+        assigned.
+    rng: np.random.Generator | None
+        Random number generator used for permutations and scrambling. Defaults to the "sampling" stream of the current
+        random stream.
+    antithetic: bool | None
+        If True, the second half of the draws mirrors the first half (u -> 1 - u), so that iterations i and
+        i + ceil(length_array / 2) form antithetic pairs. Defaults to the setting defined in settings.
+
+    Returns
+    -------
+    ArrayLike
+        Draws on the unit interval.
+    """
+    sampling_plan = _get_sampling_plan()
+
+    # Get defaults
+    if sampling_method is None:
+        sampling_method = get_sampling_method()
+
+    if antithetic is None:
+        antithetic = get_antithetic_sampling()
+
+    if rng is None:
+        rng = get_rng("sampling")
+
+    if dimension is None:
+        dimension = sampling_plan.next_dimension
+        sampling_plan.next_dimension += 1
+
+    if antithetic and length_array > 1:
+        unit_draws = get_unit_draws(int(np.ceil(length_array / 2)), sampling_method=sampling_method,
+                                    dimension=dimension, rng=rng, antithetic=False)
+        return np.concatenate([unit_draws, 1 - unit_draws])[:length_array]
+
+    if sampling_method == "random":
+        unit_draws = rng.random(length_array)
+
+    elif sampling_method == "sobol" and dimension < _sobol_dimensions:
+        if length_array not in sampling_plan.sobol_samples:
+            sobol_sampler = qmc.Sobol(d=_sobol_dimensions, scramble=True, seed=rng)
+            sobol_draws = sobol_sampler.random_base2(m=int(np.ceil(np.log2(max(length_array, 2)))))
+            sampling_plan.sobol_samples[length_array] = sobol_draws[:length_array]
+        unit_draws = sampling_plan.sobol_samples[length_array][:, dimension]
+
+    elif sampling_method in ["lhs", "sobol"]:
+        # Latin hypercube sampling - one draw from each of length_array equally probable strata in random order
+        unit_draws = (rng.permutation(length_array) + rng.random(length_array)) / length_array
+
+    else:
+        raise ValueError(f"Sampling method '{sampling_method}' not supported. Use one of {sampling_methods}.")
+
+    return unit_draws
+
+
+def inverse_cdf(distribution_maker, unit_draws):
+    """
+    Transforms draws on the unit interval into draws of a given distribution via its inverse cumulative distribution
+    function.
+
+    Parameters
+    ----------
+    distribution_maker: triangular_dist_maker | gaussian_dist_maker | fixed_dist_maker | range_dist_maker
+        Named tuple defining the variables of the distribution. Defined in objects/generic_objects.py.
+    unit_draws: ArrayLike
+        Draws on the unit interval.
+
+    Returns
+    -------
+    ArrayLike
+        Draws of the given distribution.
+    """
+    unit_draws = np.asarray(unit_draws)
+
+    if isinstance(distribution_maker, gaussian_dist_maker):
+        distribution = norm.ppf(unit_draws, loc=distribution_maker.mean, scale=distribution_maker.std)
+
+    elif isinstance(distribution_maker, triangular_dist_maker):
+        lower, mode, upper = distribution_maker.lower, distribution_maker.mode, distribution_maker.upper
+        mode_fraction = (mode - lower) / (upper - lower) if upper > lower else 0.5
+        distribution = np.where(unit_draws < mode_fraction,
+                                lower + np.sqrt(unit_draws * (upper - lower) * (mode - lower)),
+                                upper - np.sqrt((1 - unit_draws) * (upper - lower) * (upper - mode)))
+
+    elif isinstance(distribution_maker, range_dist_maker):
+        distribution = distribution_maker.low + unit_draws * (distribution_maker.high - distribution_maker.low)
+
+    elif isinstance(distribution_maker, fixed_dist_maker):
+        distribution = np.repeat(distribution_maker.value, len(unit_draws))
+
+    else:
+        raise ValueError("Distribution type not supported.")
+
+    return distribution
+
+
+def get_expected_value(distribution_maker):
+    """
+    Gets the expected value of the distribution defined by a distribution maker.
+
+    Parameters
+    ----------
+    distribution_maker: triangular_dist_maker | gaussian_dist_maker | fixed_dist_maker | range_dist_maker
+        Named tuple defining the variables of the distribution. Defined in objects/generic_objects.py.
+
+    Returns
+    -------
+    float
+        Expected value of the distribution.
+    """
+    if isinstance(distribution_maker, gaussian_dist_maker):
+        expected_value = distribution_maker.mean
+    elif isinstance(distribution_maker, triangular_dist_maker):
+        expected_value = (distribution_maker.lower + distribution_maker.mode + distribution_maker.upper) / 3
+    elif isinstance(distribution_maker, range_dist_maker):
+        expected_value = (distribution_maker.low + distribution_maker.high) / 2
+    elif isinstance(distribution_maker, fixed_dist_maker):
+        expected_value = distribution_maker.value
+    else:
+        raise ValueError("Distribution type not supported.")
+
+    return float(expected_value)
+
+
+def record_control_variate(draws, distribution_maker):
+    """
+    Records the draws of an uncertain input together with its known expected value, so that they can be used as a
+    control variate for the results of the current simulation run. Inputs without variance are not recorded, and
+    nothing is recorded unless settings.user_inputs.general.record_control_variates is set.
+
+    Parameters
+    ----------
+    draws: ArrayLike
+        Monte Carlo draws of the uncertain input.
+    distribution_maker: triangular_dist_maker | gaussian_dist_maker | fixed_dist_maker | range_dist_maker
+        Distribution maker the draws were taken from.
+    """
+    if (not get_record_control_variates() or isinstance(distribution_maker, fixed_dist_maker) or
+            np.size(draws) < 2):
+        return
+    sampling_plan = _get_sampling_plan()
+    sampling_plan.control_variates.append((np.asarray(draws, dtype=float), get_expected_value(distribution_maker)))
+
+
+def get_control_variates():
+    """
+    Gets the control variates recorded during the current simulation run. They are ordered by the name of the sampling
+    plan they were recorded in, so that the order does not depend on how concurrent nodes were scheduled.
+
+    Returns
+    -------
+    list[tuple[ArrayLike, float]]
+        Draws of each uncertain input and their expected value.
+    """
+    _get_sampling_plan()  # reset plans of a previous run
+
+    with _sampling_plan_lock:
+        return [control_variate for plan_name in sorted(_sampling_plans)
+                for control_variate in _sampling_plans[plan_name].control_variates]
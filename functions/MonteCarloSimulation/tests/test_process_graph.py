@@ -0,0 +1,68 @@
+import threading
+
+import numpy as np
+import pytest
+
+from functions.MonteCarloSimulation import ProcessGraph
+from functions.MonteCarloSimulation._run_simulation import _add_subprocess
+from objects import FossilGWP, Process, Requirements
+
+
+def test_process_graph_evaluates_each_node_once():
+    calls = []
+
+    def shared_input():
+        calls.append("shared")
+        return 2
+
+    graph = ProcessGraph()
+    graph.add_node("double", lambda value: 2 * value, inputs={"value": "shared"})
+    graph.add_node("square", lambda value: value ** 2, inputs={"value": "shared"})
+    graph.add_node("shared", shared_input)
+    graph.add_node("total", lambda a, b: a + b, inputs={"a": "double", "b": "square"})
+
+    assert graph.get_evaluation_order() == ["shared", "double", "square", "total"]
+    for max_workers in [1, 4]:
+        calls.clear()
+        assert graph.evaluate(max_workers=max_workers)["total"] == 8
+        assert calls == ["shared"]
+
+
+def test_process_graph_runs_independent_nodes_concurrently():
+    barrier = threading.Barrier(2, timeout=5)  # only passes if both nodes run at the same time
+    graph = ProcessGraph()
+    graph.add_node("CAPEX 1", barrier.wait)
+    graph.add_node("CAPEX 2", barrier.wait)
+    assert set(graph.evaluate(max_workers=2)) == {"CAPEX 1", "CAPEX 2"}
+
+
+def test_process_graph_rejects_invalid_graphs():
+    graph = ProcessGraph()
+    graph.add_node("a", lambda b: b, inputs={"b": "b"})
+    graph.add_node("b", lambda a: a, inputs={"a": "a"})
+    with pytest.raises(ValueError):
+        graph.evaluate()
+    with pytest.raises(ValueError):
+        graph.add_node("a", lambda: None)
+
+
+def test_adding_subprocess_does_not_change_input_node():
+    # Other nodes may read the input process concurrently, so a new process is created
+    requirements = Requirements(name="Test")
+    requirements.add_requirement(FossilGWP(values=np.full(4, 2.0)))
+    process = Process(name="CHP", instantiate_with_default_reqs=False, requirements=(requirements, ))
+    subprocess = Process(name="Syngas combustion", instantiate_with_default_reqs=False,
+                         requirements=(Requirements(name="Empty"), ))
+    subprocess.calculate_GWP()
+    subprocess.calculate_TEA()
+
+    graph = ProcessGraph()
+    graph.add_node("CHP requirements", lambda: process)
+    graph.add_node("Syngas combustion", lambda: subprocess)
+    graph.add_node("CHP", _add_subprocess, inputs={"process": "CHP requirements", "subprocess": "Syngas combustion"})
+    results = graph.evaluate()
+
+    assert process.subprocesses == ()
+    assert results["CHP"] is not process
+    assert results["CHP"].subprocesses == (subprocess, )
+    assert results["CHP"].GWP_mean == pytest.approx(2)
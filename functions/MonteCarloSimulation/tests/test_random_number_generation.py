@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from config import settings
+from functions.MonteCarloSimulation import (get_distribution_draws, set_random_seed, get_rng, use_random_stream,
+                                            ProcessGraph)
+from objects import gaussian_dist_maker, triangular_dist_maker
+
+
+def test_same_seed_same_draws():
+    set_random_seed(42)
+    draws_1 = get_distribution_draws(triangular_dist_maker(1, 2, 4), length_array=100)
+    set_random_seed(42)
+    draws_2 = get_distribution_draws(triangular_dist_maker(1, 2, 4), length_array=100)
+    assert np.array_equal(draws_1, draws_2)
+
+
+def test_streams_are_independent():
+    # Draws from one stream should not be affected by draws from another stream
+    set_random_seed(42)
+    draws_1 = get_distribution_draws(gaussian_dist_maker(0, 1), length_array=10)
+    set_random_seed(42)
+    get_rng("carbon capture").normal(size=5)
+    draws_2 = get_distribution_draws(gaussian_dist_maker(0, 1), length_array=10)
+    assert np.array_equal(draws_1, draws_2)
+
+
+def test_common_random_numbers():
+    # With common random numbers a named input gets the same draws regardless of which other inputs are drawn
+    settings.user_inputs.general.common_random_numbers = True
+    try:
+        set_random_seed(42)
+        draws_1 = get_distribution_draws(triangular_dist_maker(1, 2, 4), length_array=10, input_name="price")
+        set_random_seed(42)
+        get_distribution_draws(gaussian_dist_maker(0, 1), length_array=10, input_name="CAPEX error")
+        draws_2 = get_distribution_draws(triangular_dist_maker(1, 2, 4), length_array=10, input_name="price")
+    finally:
+        settings.user_inputs.general.common_random_numbers = False
+    assert np.array_equal(draws_1, draws_2)
+
+
+def test_common_random_numbers_sampling_methods():
+    # Latin hypercube draws of a named input do not depend on which inputs are drawn first - Sobol draws would
+    settings.user_inputs.general.common_random_numbers = True
+    try:
+        set_random_seed(42)
+        draws_1 = get_distribution_draws(triangular_dist_maker(1, 2, 4), length_array=10, input_name="price",
+                                         sampling_method="lhs")
+        set_random_seed(42)
+        get_distribution_draws(gaussian_dist_maker(0, 1), length_array=10, input_name="CAPEX boiler",
+                               sampling_method="lhs")
+        draws_2 = get_distribution_draws(triangular_dist_maker(1, 2, 4), length_array=10, input_name="price",
+                                         sampling_method="lhs")
+        with pytest.raises(ValueError):
+            get_distribution_draws(triangular_dist_maker(1, 2, 4), length_array=10, input_name="price",
+                                   sampling_method="sobol")
+    finally:
+        settings.user_inputs.general.common_random_numbers = False
+    assert np.array_equal(draws_1, draws_2)
+
+
+def test_process_and_component_streams():
+    # Each process draws from its own child stream, and each named component from its own child stream of the process
+    set_random_seed(42)
+    with use_random_stream("Gasification"):
+        draws_1 = get_distribution_draws(gaussian_dist_maker(0, 1), length_array=10, input_name="CAPEX error")
+    set_random_seed(42)
+    with use_random_stream("CHP"):
+        draws_other_process = get_distribution_draws(gaussian_dist_maker(0, 1), length_array=10,
+                                                     input_name="CAPEX error")
+    with use_random_stream("Gasification"):
+        get_distribution_draws(gaussian_dist_maker(0, 1), length_array=10, input_name="O&M ratio")
+        draws_2 = get_distribution_draws(gaussian_dist_maker(0, 1), length_array=10, input_name="CAPEX error")
+    assert np.array_equal(draws_1, draws_2)
+    assert not np.array_equal(draws_1, draws_other_process)
+
+
+def test_process_graph_nodes_draw_from_own_streams():
+    def draw():
+        return get_distribution_draws(gaussian_dist_maker(0, 1), length_array=10)
+
+    graph_1 = ProcessGraph()
+    graph_1.add_node("a", draw)
+    graph_1.add_node("b", draw)
+    graph_2 = ProcessGraph()
+    graph_2.add_node("b", draw)
+    graph_2.add_node("a", draw)
+    set_random_seed(42)
+    results_1 = graph_1.evaluate(max_workers=1)
+    set_random_seed(42)
+    results_2 = graph_2.evaluate(max_workers=2)
+    assert np.array_equal(results_1["a"], results_2["a"])
+    assert not np.array_equal(results_1["a"], results_1["b"])
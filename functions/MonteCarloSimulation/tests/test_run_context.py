@@ -0,0 +1,25 @@
+import pytest
+
+from config import settings
+from functions.MonteCarloSimulation import get_distribution_draws, run_context
+from functions.general.utility import ultimate_comp_daf_to_wb
+from objects import range_dist_maker
+
+
+def test_run_context_overrides_defaults_at_call_time():
+    default_MC_iterations = settings.user_inputs.general.MC_iterations
+    default_carbon = ultimate_comp_daf_to_wb()["C"]
+    with run_context(MC_iterations=7, user_inputs={"feedstock": {"carbon": 10.0}}):
+        assert len(get_distribution_draws(range_dist_maker(0, 1))) == 7
+        assert ultimate_comp_daf_to_wb()["C"] < default_carbon
+    assert settings.user_inputs.general.MC_iterations == default_MC_iterations
+    assert ultimate_comp_daf_to_wb()["C"] == default_carbon
+
+
+@pytest.mark.filterwarnings("error::DeprecationWarning")
+def test_run_context_restores_inputs_changed_in_place():
+    default_MC_iterations = settings.user_inputs.general.MC_iterations
+    with run_context():
+        settings.user_inputs.general.MC_iterations = 7
+        assert len(get_distribution_draws(range_dist_maker(0, 1))) == 7
+    assert settings.user_inputs.general.MC_iterations == default_MC_iterations
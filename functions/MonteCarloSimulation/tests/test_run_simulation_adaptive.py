@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from functions.MonteCarloSimulation import _run_simulation_adaptive, run_simulation_adaptive, get_convergence_summary
+
+
+def _run_simulation_stub(show_figures=False, seed=None, MC_iterations=None):
+    # Stands in for the process models - GWP ~ N(10, 1) and BCR ~ N(2, 0.5)
+    rng = np.random.default_rng(seed)
+    return SimpleNamespace(GWP_distribution=rng.normal(10, 1, MC_iterations),
+                           PV_distribution=rng.normal(0, 1, MC_iterations),
+                           AV_distribution=rng.normal(0, 1, MC_iterations),
+                           BCR_distribution=rng.normal(2, 0.5, MC_iterations),
+                           electricity_results=None, heat_results=None, processes=())
+
+
+@pytest.fixture
+def stubbed_run_simulation(monkeypatch):
+    monkeypatch.setattr(_run_simulation_adaptive, "run_simulation", _run_simulation_stub)
+
+
+def test_adaptive_run_stops_once_targets_are_met(stubbed_run_simulation):
+    # A 2% relative interval of the GWP mean needs about (2 * 1.96 / 0.2) ** 2 = 385 iterations
+    streamed_results = run_simulation_adaptive(targets={"GWP_mean": 0.02}, seed=42)
+
+    assert streamed_results.converged
+    assert 300 <= streamed_results.MC_iterations <= 500
+    convergence = streamed_results.convergence["GWP_mean"]
+    assert convergence["CI width"] <= convergence["Target width"]
+    assert streamed_results.MC_iterations % 100 == 0
+
+
+def test_adaptive_run_stops_at_iteration_budget(stubbed_run_simulation):
+    streamed_results = run_simulation_adaptive(targets={"GWP_95th_percentile": 1e-6}, max_iterations=450, seed=42)
+
+    assert not streamed_results.converged
+    assert streamed_results.MC_iterations == 450
+    assert not streamed_results.convergence["GWP_95th_percentile"]["Converged"]
+
+
+def test_convergence_summary_absolute_targets(stubbed_run_simulation):
+    streamed_results = run_simulation_adaptive(targets={"GWP_mean": 0.5, "BCR_5th_percentile": 0.5},
+                                               relative_targets=False, seed=42)
+    summary = get_convergence_summary(streamed_results, {"GWP_mean": 0.5, "BCR_5th_percentile": 0.5},
+                                      relative_targets=False)
+
+    assert streamed_results.MC_iterations == 200  # converged at the minimum number of iterations
+    assert summary["GWP_mean"]["Target width"] == 0.5
+    assert summary["BCR_5th_percentile"]["Estimate"] == pytest.approx(2 - 1.645 * 0.5, abs=0.2)
+
+
+def test_default_targets_are_relative():
+    with pytest.raises(ValueError):
+        run_simulation_adaptive(relative_targets=False)
@@ -0,0 +1,54 @@
+import numpy as np
+
+from config import settings
+from functions.MonteCarloSimulation import run_economic_scenarios
+from objects import Requirements, AnnualValue, PresentValue
+from objects.result_objects import Results
+from processes.other import General
+
+
+def _get_results():
+    n_iterations = settings.user_inputs.general.MC_iterations
+    requirements = Requirements(name="Economic")
+    requirements.add_requirement(PresentValue(values=list(np.linspace(-200, -100, n_iterations)), name="CAPEX"))
+    requirements.add_requirement(AnnualValue(values=list(np.linspace(10, 30, n_iterations)), name="Sales"))
+    process = General(instantiate_with_default_reqs=False)
+    process.add_requirements(requirements)
+    process.calculate_GWP()
+    process.calculate_TEA()
+    results = Results(processes=(process,))
+    results.GWP_distribution = list(np.zeros(n_iterations))
+    results.calculate_total_TEA()
+
+    return results
+
+
+def test_economic_scenarios_match_individual_runs():
+    base_rate_of_return = settings.user_inputs.economic.rate_of_return_decimals
+    scenario_results = run_economic_scenarios(_get_results(), [{"rate_of_return_decimals": 0.02},
+                                                               {"rate_of_return_decimals": 0.08}])
+    try:
+        for scenario_result in scenario_results:
+            settings.user_inputs.economic.rate_of_return_decimals = \
+                scenario_result.economic_scenario["rate_of_return_decimals"]
+            individual_result = _get_results()
+            assert np.allclose(scenario_result.PV_distribution, individual_result.PV_distribution)
+            assert np.allclose(scenario_result.BCR_distribution, individual_result.BCR_distribution)
+    finally:
+        settings.user_inputs.economic.rate_of_return_decimals = base_rate_of_return
+
+
+def test_economic_scenarios_do_not_share_results():
+    results = _get_results()
+    base_PV_distribution = np.array(results.PV_distribution)
+    scenario_results = run_economic_scenarios(results, [{"rate_of_return_decimals": 0.02},
+                                                        {"rate_of_return_decimals": 0.08}])
+    assert scenario_results[0].matrices["PV"] is not scenario_results[1].matrices["PV"]
+    assert np.allclose(scenario_results[1].matrices["PV"].total(), scenario_results[1].PV_distribution)
+
+    scenario_results[0].matrices["PV"].values[:] = 0
+    scenario_results[0].PV_distribution[:] = 0
+    assert not np.allclose(scenario_results[1].matrices["PV"].total(), 0)
+    assert not np.allclose(scenario_results[1].PV_distribution, 0)
+    assert np.allclose(results.PV_distribution, base_PV_distribution)
+    assert np.allclose(results.matrices["PV"].total(), base_PV_distribution)
@@ -0,0 +1,66 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from config import settings
+from functions.MonteCarloSimulation import (merge_results, run_context, set_random_seed, get_distribution_draws,
+                                            use_random_stream, run_simulation_sharded, _run_simulation_sharded)
+from objects import FossilGWP, AnnualValue, Process, Requirements, Results, gaussian_dist_maker
+
+
+def _get_shard_results(seed, MC_iterations=50):
+    with run_context(MC_iterations=MC_iterations):
+        set_random_seed(seed)
+        with use_random_stream("Test"):
+            requirements = Requirements(name="Test")
+            requirements.add_requirement(FossilGWP(values=get_distribution_draws(gaussian_dist_maker(2, 1))))
+            requirements.add_requirement(AnnualValue(values=get_distribution_draws(gaussian_dist_maker(10, 1)),
+                                                     name="Sales"))
+            process = Process(name="Test", instantiate_with_default_reqs=False, requirements=(requirements, ))
+            process.calculate_GWP()
+            process.calculate_TEA()
+        results = Results(processes=(process, ))
+        results.store_run_state()
+        results.calculate_all()
+
+    return results
+
+
+def _run_shard_stub(user_inputs, MC_iterations, seed_sequence):
+    return _get_shard_results(seed_sequence, MC_iterations=MC_iterations)
+
+
+def test_merge_pickled_shards():
+    # Shards are returned pickled by the worker processes - merging must not rerun any process models
+    shard_results = [pickle.loads(pickle.dumps(_get_shard_results(seed))) for seed in [1, 2]]
+    GWP_distributions = [np.array(results.GWP_distribution) for results in shard_results]
+    PV_distributions = [np.array(results.PV_distribution) for results in shard_results]
+    results_versions = [dict(results.processes[0]._results_versions) for results in shard_results]
+
+    with run_context(MC_iterations=100):
+        merged_results = merge_results(shard_results)
+
+        assert merged_results.processes[0]._results_versions == results_versions[0]
+        assert merged_results.GWP_distribution == pytest.approx(np.concatenate(GWP_distributions))
+        assert merged_results.PV_distribution == pytest.approx(np.concatenate(PV_distributions))
+        assert merged_results.matrices["GWP"].n_iterations == 100
+        assert len(merged_results.electricity_results["Total MC distribution"]) == 100
+
+
+def test_merge_requires_calculated_shards():
+    shard_results = [_get_shard_results(seed) for seed in [1, 2]]
+    shard_results[1].processes[0].requirements[0].add_requirement(FossilGWP(values=np.ones(50)))
+    with pytest.raises(ValueError):
+        merge_results(shard_results)
+
+
+def test_sharded_run_keeps_settings(monkeypatch):
+    # Shards run the stub instead of the process models (inherited by the forked worker processes)
+    monkeypatch.setattr(_run_simulation_sharded, "_run_simulation_shard", _run_shard_stub)
+    MC_iterations = settings.user_inputs.general.MC_iterations
+    results = run_simulation_sharded(MC_iterations=MC_iterations + 10, n_shards=2, max_workers=2, seed=1,
+                                     show_figures=False)
+
+    assert len(results.GWP_distribution) == MC_iterations + 10
+    assert settings.user_inputs.general.MC_iterations == MC_iterations
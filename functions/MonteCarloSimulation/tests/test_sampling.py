@@ -0,0 +1,90 @@
+import numpy as np
+
+from functions.MonteCarloSimulation import (get_distribution_draws, set_random_seed, get_control_variates, ProcessGraph,
+                                            run_context)
+from objects.result_objects import Results
+from objects import triangular_dist_maker, range_dist_maker
+
+
+def test_lhs_draws_are_stratified():
+    # Each of the equally probable strata of the distribution should contain exactly one draw
+    set_random_seed(42)
+    draws = get_distribution_draws(range_dist_maker(0, 10), length_array=100, sampling_method="lhs")
+    assert np.array_equal(np.sort(np.floor(draws * 10)), np.arange(100))
+
+
+def test_sobol_draws_match_distribution():
+    set_random_seed(42)
+    draws = get_distribution_draws(triangular_dist_maker(1, 2, 4), length_array=1024, sampling_method="sobol")
+    assert np.all((draws >= 1) & (draws <= 4))
+    assert abs(np.mean(draws) - 7 / 3) < 0.01
+
+
+def test_antithetic_draws_are_mirrored():
+    set_random_seed(42)
+    draws = get_distribution_draws(range_dist_maker(0, 10), length_array=100, antithetic=True)
+    assert np.allclose(draws[:50] + draws[50:], 10)
+
+
+def test_control_variate_mean_reduces_variance():
+    estimates = []
+    control_variate_estimates = []
+    for seed in range(50):
+        with run_context(user_inputs={"general": {"record_control_variates": True}}):
+            set_random_seed(seed)
+            draws = get_distribution_draws(triangular_dist_maker(1, 2, 4), length_array=100)
+            noise = get_distribution_draws(range_dist_maker(-1, 1), length_array=100, sampling_method="random")
+            results = Results(GWP_distribution=list(3 * draws + noise), control_variates=get_control_variates()[:1])
+        estimates.append(np.mean(results.GWP_distribution))
+        control_variate_estimates.append(results.get_control_variate_mean("GWP")[0])
+    assert abs(np.mean(control_variate_estimates) - 7) < 0.05
+    assert np.var(control_variate_estimates) < np.var(estimates) / 5
+
+
+def test_control_variates_only_recorded_when_requested():
+    set_random_seed(42)
+    get_distribution_draws(triangular_dist_maker(1, 2, 4), length_array=100)
+    assert get_control_variates() == []
+
+
+def test_control_variate_mean_no_worse_without_predictive_inputs():
+    # Inputs which do not predict the results must not make the estimate worse than the plain sample mean
+    rng = np.random.default_rng(42)
+    estimates = []
+    control_variate_estimates = []
+    covered = 0
+    for _ in range(500):
+        control_variates = [(rng.random(100), 0.5) for _ in range(40)]
+        results = Results(GWP_distribution=list(1 + rng.normal(size=100)), control_variates=control_variates)
+        estimate, standard_error = results.get_control_variate_mean("GWP")
+        estimates.append(np.mean(results.GWP_distribution))
+        control_variate_estimates.append(estimate)
+        covered += abs(estimate - 1) < 1.96 * standard_error
+    assert np.std(control_variate_estimates) <= 1.02 * np.std(estimates)
+    assert covered / 500 > 0.92
+
+
+def test_process_graph_nodes_use_own_sampling_plans():
+    # Sobol dimensions and control variates of each node do not depend on the order in which nodes are evaluated
+    def draw():
+        return [get_distribution_draws(triangular_dist_maker(1, 2, 4), length_array=16, sampling_method="sobol")
+                for _ in range(3)]
+
+    graph_1 = ProcessGraph()
+    graph_1.add_node("a", draw)
+    graph_1.add_node("b", draw)
+    graph_2 = ProcessGraph()
+    graph_2.add_node("b", draw)
+    graph_2.add_node("a", draw)
+    with run_context(user_inputs={"general": {"record_control_variates": True}}):
+        set_random_seed(42)
+        results_1 = graph_1.evaluate(max_workers=1)
+        control_variates_1 = get_control_variates()
+        set_random_seed(42)
+        results_2 = graph_2.evaluate(max_workers=2)
+        control_variates_2 = get_control_variates()
+
+    assert np.array_equal(results_1["a"], results_2["a"]) and np.array_equal(results_1["b"], results_2["b"])
+    assert len(control_variates_1) == len(control_variates_2) == 6
+    for (draws_1, _), (draws_2, _) in zip(control_variates_1, control_variates_2):
+        assert np.array_equal(draws_1, draws_2)
@@ -1,7 +1,5 @@
-import os
 import warnings
 
-import pandas as pd
 import numpy as np
 
 from scipy.optimize import curve_fit
@@ -10,9 +8,10 @@ from config import settings
 from functions.MonteCarloSimulation import get_distribution_draws
 from functions.general import MAPE
 from functions.general.curve_fitting import func_power_curve, func_straight_line
-from functions.general.utility import get_project_root
-from functions.TEA import convert_currency_annual_average
+from functions.general.utility import load_table
+from functions.TEA import convert_currency_annual_average_bulk
 from functions.TEA.scaling import CEPCI_scale
+from functions.TEA.CAPEX_estimation.CAPEX_curve_cache import get_CAPEX_curve_fit
 from objects import triangular_dist_maker, PresentValue
 
 
@@ -48,26 +47,76 @@ def get_CHP_CAPEX_distribution(system_size_MWel=None, currency=None, CEPCI_year=
     if CEPCI_year is None:
         CEPCI_year = settings.user_inputs.economic.CEPCI_year
 
+    # Define thresholds to split data set into small scale and medium scale plants and max allowable system size.
+    threshold_small_scale_system = 5  # MW
+    max_system_size = 500  # MW
+
+    # Get fitted model and its error metrics, and make prediction
+    if system_size_MWel <= threshold_small_scale_system:  # small scale
+        # Power function based on previous analysis
+        CAPEX_curve = get_CAPEX_curve_fit(_fit_CHP_CAPEX_curve,
+                                          data_file_names=["CAPEX_CHP.csv"],
+                                          currency=currency,
+                                          CEPCI_year=CEPCI_year,
+                                          size_regime="small scale")
+        prediction = func_power_curve(system_size_MWel, *CAPEX_curve["popt"])
+
+    else:  # medium scale
+        # Linear function based on previous analysis
+        CAPEX_curve = get_CAPEX_curve_fit(_fit_CHP_CAPEX_curve,
+                                          data_file_names=["CAPEX_CHP.csv"],
+                                          currency=currency,
+                                          CEPCI_year=CEPCI_year,
+                                          size_regime="medium scale")
+        prediction = func_straight_line(system_size_MWel, *CAPEX_curve["popt"])
+
+        if system_size_MWel >= max_system_size:
+            # Note: Currently allowed - could also raise Error and not allow this - (same model as the one above for
+            # medium-sized systems)
+            warnings.warn("CHP size very large - supported size exceeded which may lead to errors.")
+
+    mape_decimal = CAPEX_curve["MAPE"]
+
+    # Raise warnings if necessary
+    if system_size_MWel < 0.05:
+        warnings.warn("CHP size very small - this might lead to unexpected behaviour")
+
+    if 5 < system_size_MWel < 10:
+        warnings.warn("Region of great uncertainty "
+                      "- 5MWel is the current cut off from small-scale to medium-scale system model.")
+
+    # Get lower and upper bounds of distribution based on the distributions MAPE
+    lower_bound = prediction - (prediction * mape_decimal)
+    upper_bound = prediction + (prediction * mape_decimal)
+
+    distribution = triangular_dist_maker(lower=lower_bound, mode=prediction, upper=upper_bound)
+
+    distribution_draws = np.multiply(get_distribution_draws(distribution, input_name="CAPEX CHP"), -1)  # turn -ve as they are a cost
+
+    CAPEX = PresentValue(values=distribution_draws,
+                         name="CAPEX CHP",
+                         short_label="CAPEX CHP",
+                         tag="CAPEX")
+
+    return CAPEX
+
+
+def _fit_CHP_CAPEX_curve(currency, CEPCI_year, size_regime):
+    """
+    Fits the CAPEX curve of CHP plants of a given size regime ("small scale" or "medium scale") to the CAPEX data
+    (see get_CAPEX_curve_fit).
+    """
     # Load data
-    root_dir = get_project_root()
-    data_file = "CAPEX_CHP.csv"
-    data_file_path = os.path.join(root_dir, "data", data_file)
-    df = pd.read_csv(data_file_path)
+    df = load_table("CAPEX_CHP.csv")
 
     # Convert all values to same currency and update to most recent CEPCI value
-    CAPEX_currency_scaled = []
-    CAPEX_currency_CEPCI_scaled = []
-
-    for row_no in df.index:
-        CAPEX_currency_scaled.append(convert_currency_annual_average(value=df["CAPEX"][row_no],
-                                                                     year=df["Reference Year"][row_no],
-                                                                     base_currency=df["Currency"][row_no],
-                                                                     converted_currency=currency,
-                                                                     approximate_rate=False,
-                                                                     method="yfinance"))
-        CAPEX_currency_CEPCI_scaled.append(CEPCI_scale(base_year=df["Reference Year"][row_no],
-                                                       design_year=CEPCI_year,
-                                                       value=CAPEX_currency_scaled[row_no]))
+    CAPEX_currency_scaled = convert_currency_annual_average_bulk(values=df["CAPEX"],
+                                                                 years=df["Reference Year"],
+                                                                 base_currencies=df["Currency"],
+                                                                 converted_currency=currency)
+    CAPEX_currency_CEPCI_scaled = CEPCI_scale(base_year=df["Reference Year"],
+                                              design_year=CEPCI_year,
+                                              value=CAPEX_currency_scaled)
 
     # Add (i) currency and (ii) currency + CEPCI scaled values to dataframe
     currency_scaled_label = "CAPEX_" + currency
@@ -85,8 +134,8 @@ def get_CHP_CAPEX_distribution(system_size_MWel=None, currency=None, CEPCI_year=
     threshold_small_scale_system = 5  # MW
     max_system_size = 500  # MW
 
-    # Fit models, get performance metric, and make prediction
-    if system_size_MWel <= threshold_small_scale_system:  # small scale
+    # Fit models and get performance metric
+    if size_regime == "small scale":
         df_small = df[df["Plant size [MWel]"] <= threshold_small_scale_system]
         df_small = df_small.dropna(subset=[currency_and_CEPCI_scaled_label])
 
@@ -106,72 +155,28 @@ def get_CHP_CAPEX_distribution(system_size_MWel=None, currency=None, CEPCI_year=
                             func_power_curve(df_small["Plant size [MWel]"], *popt),
                             return_as_decimal=True)
 
-        prediction = func_power_curve(system_size_MWel, *popt)
-
-    else:  # medium scale
-        if system_size_MWel < max_system_size:
-            df_medium = df[(df["Plant size [MWel]"] > threshold_small_scale_system) &
-                           (df["Plant size [MWel]"] <= max_system_size)]
-            df_medium = df_medium.dropna(subset=[currency_and_CEPCI_scaled_label])
-
-            # Fit linear function based on previous analysis
-            popt, _ = curve_fit(func_straight_line,
-                                df_medium["Plant size [MWel]"],
-                                df_medium[currency_and_CEPCI_scaled_label],
-                                maxfev=10000)
-
-            # Performance metrics
-            # r2 = r2_score(df_medium[currency_and_CEPCI_scaled_label],
-            #               func_straight_line(df_medium["Plant size [MWel]"], *popt))
-            # rmse = mean_squared_error(df_medium[currency_and_CEPCI_scaled_label],
-            #                           func_straight_line(df_medium["Plant size [MWel]"], *popt),
-            #                           squared=False)
-            mape_decimal = MAPE(df_medium[currency_and_CEPCI_scaled_label],
-                                func_straight_line(df_medium["Plant size [MWel]"], *popt),
-                                return_as_decimal=True)
-
-            prediction = func_straight_line(system_size_MWel, *popt)
-
-        else:
-            # Note: Currently allowed - could also raise Error and not allow this - (same model as the one above for
-            # medium-sized systems)
-
-            df_medium = df[(df["Plant size [MWel]"] > threshold_small_scale_system) &
-                           (df["Plant size [MWel]"] <= max_system_size)]
-            df_medium = df_medium.dropna(subset=[currency_and_CEPCI_scaled_label])
-
-            # Fit linear function based on previous analysis
-            popt, _ = curve_fit(func_straight_line,
-                                df_medium["Plant size [MWel]"],
-                                df_medium[currency_and_CEPCI_scaled_label],
-                                maxfev=10000)
-
-            mape_decimal = MAPE(df_medium[currency_and_CEPCI_scaled_label],
-                                func_straight_line(df_medium["Plant size [MWel]"], *popt),
-                                return_as_decimal=True)
-
-            prediction = func_straight_line(system_size_MWel, *popt)
-            warnings.warn("CHP size very large - supported size exceeded which may lead to errors.")
-
-    # Raise warnings if necessary
-    if system_size_MWel < 0.05:
-        warnings.warn("CHP size very small - this might lead to unexpected behaviour")
-
-    if 5 < system_size_MWel < 10:
-        warnings.warn("Region of great uncertainty "
-                      "- 5MWel is the current cut off from small-scale to medium-scale system model.")
+    elif size_regime == "medium scale":
+        df_medium = df[(df["Plant size [MWel]"] > threshold_small_scale_system) &
+                       (df["Plant size [MWel]"] <= max_system_size)]
+        df_medium = df_medium.dropna(subset=[currency_and_CEPCI_scaled_label])
 
-    # Get lower and upper bounds of distribution based on the distributions MAPE
-    lower_bound = prediction - (prediction * mape_decimal)
-    upper_bound = prediction + (prediction * mape_decimal)
-
-    distribution = triangular_dist_maker(lower=lower_bound, mode=prediction, upper=upper_bound)
+        # Fit linear function based on previous analysis
+        popt, _ = curve_fit(func_straight_line,
+                            df_medium["Plant size [MWel]"],
+                            df_medium[currency_and_CEPCI_scaled_label],
+                            maxfev=10000)
 
-    distribution_draws = list(np.multiply(get_distribution_draws(distribution), -1))  # turn -ve as they are a cost
+        # Performance metrics
+        # r2 = r2_score(df_medium[currency_and_CEPCI_scaled_label],
+        #               func_straight_line(df_medium["Plant size [MWel]"], *popt))
+        # rmse = mean_squared_error(df_medium[currency_and_CEPCI_scaled_label],
+        #                           func_straight_line(df_medium["Plant size [MWel]"], *popt),
+        #                           squared=False)
+        mape_decimal = MAPE(df_medium[currency_and_CEPCI_scaled_label],
+                            func_straight_line(df_medium["Plant size [MWel]"], *popt),
+                            return_as_decimal=True)
 
-    CAPEX = PresentValue(values=distribution_draws,
-                         name="CAPEX CHP",
-                         short_label="CAPEX CHP",
-                         tag="CAPEX")
+    else:
+        raise ValueError(f"Invalid size regime '{size_regime}'. Expected one of: ['small scale', 'medium scale']")
 
-    return CAPEX
+    return {"popt": popt, "MAPE": mape_decimal}
@@ -1,10 +1,9 @@
-import os
 import functions
 
-import pandas as pd
 import numpy as np
 
 from config import settings
+from functions.TEA.CAPEX_estimation.CAPEX_curve_cache import get_CAPEX_curve_fit
 from objects import PresentValue, triangular_dist_maker
 from scipy.optimize import curve_fit
 from sklearn.metrics import mean_squared_error
@@ -43,27 +42,56 @@ def get_boiler_CAPEX_distribution(unit_steam_requirement, currency=None, CEPCI_y
     unit_steam_requirement *= 1000  # update to [kg steam/tonne feedstock wb]
     steam_requirement = unit_steam_requirement * system_size_tonnes_per_hour  # [kg steam/hour]
 
+    # Get fitted model and its error metrics
+    CAPEX_curve = get_CAPEX_curve_fit(_fit_boiler_CAPEX_curve,
+                                      data_file_names=["CAPEX_boiler.csv"],
+                                      currency=currency,
+                                      CEPCI_year=CEPCI_year)
+    popt, mape_decimal = CAPEX_curve["popt"], CAPEX_curve["MAPE"]
+
+    prediction = functions.general.curve_fitting.func_straight_line(steam_requirement, *popt)
+
+    if steam_requirement < 2000:
+        # Overwrite prediction if system is very small scale - use power scaling approach instead
+        prediction = float(functions.TEA.power_scale(baseline_size=CAPEX_curve["smallest_system_size"],
+                                                     design_size=steam_requirement,
+                                                     baseline_cost=CAPEX_curve["smallest_system_cost"],
+                                                     scaling_factor=0.8))
+        mape_decimal = 0.30  # Add significant uncertainty to model - since reliant on individual data point here.
+
+    # Get lower and upper bounds of distribution based on the distributions MAPE
+    lower_bound = prediction - (prediction * mape_decimal)
+    upper_bound = prediction + (prediction * mape_decimal)
+
+    distribution = triangular_dist_maker(lower=lower_bound, mode=prediction, upper=upper_bound)
+
+    distribution_draws = np.multiply(
+        functions.MonteCarloSimulation.get_distribution_draws(distribution, input_name="CAPEX boiler"), -1)  # turn -ve as they are a cost
+
+    CAPEX = PresentValue(values=distribution_draws,
+                         name="CAPEX Boiler for Steam Generation",
+                         short_label="CAPEX Stm",
+                         tag="CAPEX")
+
+    return CAPEX
+
+
+def _fit_boiler_CAPEX_curve(currency, CEPCI_year, size_regime=None):
+    """
+    Fits the CAPEX curve of boilers to the CAPEX data (see get_CAPEX_curve_fit). The size and cost of the smallest
+    boiler in the data are returned as well to scale the cost of very small systems.
+    """
     # Load data
-    root_dir = functions.general.utility.get_project_root()
-    data_file = "CAPEX_boiler.csv"
-    data_file_path = os.path.join(root_dir, "data", data_file)
-    df = pd.read_csv(data_file_path)
+    df = functions.general.utility.load_table("CAPEX_boiler.csv")
 
     # Convert all values to same currency and update to most recent CEPCI value
-    CAPEX_currency_scaled = []
-    CAPEX_currency_CEPCI_scaled = []
-
-    for row_no in df.index:
-        CAPEX_currency_scaled.append(functions.TEA.convert_currency_annual_average(value=df["CAPEX"][row_no],
-                                                                                   year=df["Reference Year"][row_no],
-                                                                                   base_currency=df["Currency"][row_no],
-                                                                                   converted_currency=currency,
-                                                                                   approximate_rate=False,
-                                                                                   method="yfinance")
-                                     )
-        CAPEX_currency_CEPCI_scaled.append(functions.TEA.CEPCI_scale(base_year=df["Reference Year"][row_no],
-                                                                     design_year=CEPCI_year,
-                                                                     value=CAPEX_currency_scaled[row_no]))
+    CAPEX_currency_scaled = functions.TEA.convert_currency_annual_average_bulk(values=df["CAPEX"],
+                                                                               years=df["Reference Year"],
+                                                                               base_currencies=df["Currency"],
+                                                                               converted_currency=currency)
+    CAPEX_currency_CEPCI_scaled = functions.TEA.CEPCI_scale(base_year=df["Reference Year"],
+                                                            design_year=CEPCI_year,
+                                                            value=CAPEX_currency_scaled)
 
     # Add (i) currency and (ii) currency + CEPCI scaled values to dataframe
     currency_scaled_label = "CAPEX_" + currency
@@ -74,7 +102,7 @@ def get_boiler_CAPEX_distribution(unit_steam_requirement, currency=None, CEPCI_y
     # Discard outliers
     df = df[df["CAPEX"] < 500000]
 
-    # Fit model, get error metrics, and prediction.
+    # Fit model and get error metrics
     popt, _ = curve_fit(f=functions.general.curve_fitting.func_straight_line,
                         xdata=df["Plant size [kg steam/hour]"],
                         ydata=df[currency_and_CEPCI_scaled_label],
@@ -85,32 +113,10 @@ def get_boiler_CAPEX_distribution(unit_steam_requirement, currency=None, CEPCI_y
                                               df["Plant size [kg steam/hour]"], *popt),
                                           return_as_decimal=True)
 
-    prediction = functions.general.curve_fitting.func_straight_line(steam_requirement, *popt)
-
-    if steam_requirement < 2000:
-        # Overwrite prediction if system is very small scale - use power scaling approach instead
-        smallest_system_data = (df[df["Plant size [kg steam/hour]"] == df["Plant size [kg steam/hour]"].min()])
-        smallest_system_cost = smallest_system_data[currency_and_CEPCI_scaled_label]
-        smallest_system_size = smallest_system_data["Plant size [kg steam/hour]"]
-
-        prediction = float(functions.TEA.power_scale(baseline_size=float(smallest_system_size),
-                                                     design_size=steam_requirement,
-                                                     baseline_cost=float(smallest_system_cost),
-                                                     scaling_factor=0.8))
-        mape_decimal = 0.30  # Add significant uncertainty to model - since reliant on individual data point here.
+    # Get smallest system in the data
+    smallest_system_data = (df[df["Plant size [kg steam/hour]"] == df["Plant size [kg steam/hour]"].min()])
+    smallest_system_cost = float(smallest_system_data[currency_and_CEPCI_scaled_label].iloc[0])
+    smallest_system_size = float(smallest_system_data["Plant size [kg steam/hour]"].iloc[0])
 
-    # Get lower and upper bounds of distribution based on the distributions MAPE
-    lower_bound = prediction - (prediction * mape_decimal)
-    upper_bound = prediction + (prediction * mape_decimal)
-
-    distribution = triangular_dist_maker(lower=lower_bound, mode=prediction, upper=upper_bound)
-
-    distribution_draws = list(np.multiply(
-        functions.MonteCarloSimulation.get_distribution_draws(distribution), -1))  # turn -ve as they are a cost
-
-    CAPEX = PresentValue(values=distribution_draws,
-                         name="CAPEX Boiler for Steam Generation",
-                         short_label="CAPEX Stm",
-                         tag="CAPEX")
-
-    return CAPEX
+    return {"popt": popt, "MAPE": mape_decimal,
+            "smallest_system_size": smallest_system_size, "smallest_system_cost": smallest_system_cost}
@@ -42,13 +42,14 @@ def get_carbon_capture_CAPEX_distribution(CO2_capture_rate, currency=None, CEPCI
         annual_operating_hours_array = functions.MonteCarloSimulation.to_fixed_MC_array(
             value=settings.user_inputs.general.annual_operating_hours)
     else:
-        annual_operating_hours_array = np.array(functions.TEA.get_annual_operating_hours_draws())
+        annual_operating_hours_array = np.array(functions.TEA.get_annual_operating_hours_draws(
+            input_name="annual operating hours carbon capture CAPEX"))
 
     system_size_tonnes_per_year_array = system_size_tonnes_per_hour * annual_operating_hours_array
 
     # Get flue gas available for capture
     # Convert from [kg CO2/FU] to [tonnes CO2/FU] i.e. [tonne CO2/tonne feedstock]
-    flue_gas_CO2_array = list(np.divide(CO2_capture_rate, 1000) * -1)
+    flue_gas_CO2_array = np.divide(CO2_capture_rate, 1000) * -1
 
     # Capture only cost
     # Prices currency/tonne CO2
@@ -67,14 +68,15 @@ def get_carbon_capture_CAPEX_distribution(CO2_capture_rate, currency=None, CEPCI
 
     prices_array_capture = functions.MonteCarloSimulation.get_distribution_draws(
         distribution_maker=price_distribution_capture,
-        length_array=len(flue_gas_CO2_array))  # [currency/tonne CO2]
+        length_array=len(flue_gas_CO2_array),
+        input_name="carbon capture CAPEX price")  # [currency/tonne CO2]
 
     costs_benefits_per_FU_capture = np.multiply(flue_gas_CO2_array, prices_array_capture)  # currency/FU
 
     # Convert per FU units to life cycle costs/benefits
     annuity_cash_flow_array_capture = costs_benefits_per_FU_capture * system_size_tonnes_per_year_array
 
-    CAPEX = AnnualValue(values=list(annuity_cash_flow_array_capture),
+    CAPEX = AnnualValue(values=annuity_cash_flow_array_capture,
                         name="Carbon Capture CAPEX",
                         short_label="CAPEX CC",
                         tag="CAPEX")
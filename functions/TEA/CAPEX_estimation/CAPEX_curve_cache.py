@@ -0,0 +1,162 @@
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+import functions.general.utility
+from config import settings
+from functions.TEA.currency_conversion import get_exchange_rates_version
+
+# Version of the cache format - entries written with a different version are ignored
+CAPEX_CURVE_CACHE_VERSION = 1
+
+# Serialises updates of the cache file (e.g. by CAPEX estimators evaluated concurrently in a process graph)
+_cache_lock = threading.Lock()
+
+
+def get_CAPEX_curve_cache_path():
+    """
+    Gets the path of the file in which fitted CAPEX curves are stored. Defaults to ".cache/CAPEX_curves.json" in the
+    project root - can be changed via settings.user_inputs.general.CAPEX_curve_cache_path.
+
+    Returns
+    -------
+    str
+        Path to the cache file.
+    """
+    cache_path = settings.user_inputs.general.get("CAPEX_curve_cache_path", None)
+    if cache_path is None:
+        cache_path = os.path.join(functions.general.utility.get_project_root(), ".cache", "CAPEX_curves.json")
+
+    return str(cache_path)
+
+
+def _hash_file(full_file_path):
+    with open(full_file_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _read_cache_file(full_file_path):
+    with open(full_file_path, "r") as f:
+        cache = json.load(f)
+
+    if cache.get("version") != CAPEX_CURVE_CACHE_VERSION:
+        return {}
+
+    return cache["curves"]
+
+
+def _load_cache():
+    cache_path = get_CAPEX_curve_cache_path()
+    if not os.path.exists(cache_path):
+        return {}
+
+    try:
+        return functions.general.utility.load_data(cache_path, loader=_read_cache_file)
+    except (ValueError, KeyError):  # corrupted cache file - curves are refitted and the file is rewritten
+        return {}
+
+
+def _write_cache(curves):
+    cache_path = get_CAPEX_curve_cache_path()
+    cache_directory = os.path.dirname(cache_path)
+    os.makedirs(cache_directory, exist_ok=True)
+
+    # Keep cache directory out of version control
+    gitignore_path = os.path.join(cache_directory, ".gitignore")
+    if not os.path.exists(gitignore_path):
+        with open(gitignore_path, "w") as f:
+            f.write("*\n")
+
+    # Write to temporary file first and replace cache file, so that the cache file is never left half written
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=cache_directory, suffix=".tmp")
+    with os.fdopen(file_descriptor, "w") as f:
+        json.dump({"version": CAPEX_CURVE_CACHE_VERSION, "curves": curves}, f, indent=1)
+    os.replace(temporary_path, cache_path)
+
+
+def _get_cache_key(fit_curve, data_file_names, currency, CEPCI_year, size_regime, key_parts):
+    """
+    Gets the key identifying a fitted curve - it covers everything the fit depends on, i.e. the data tables, the
+    exchange rates, the CEPCI values, the fitting code, and the inputs of the fit.
+    """
+    CEPCI_values = dict(settings.data.economic.CEPCI)
+    key = {"fit": fit_curve.__module__ + "." + fit_curve.__qualname__,
+           "source": functions.general.utility.load_data(inspect.getsourcefile(fit_curve), loader=_hash_file),
+           "data": {file_name: functions.general.utility.get_data_hash(file_name) for file_name in data_file_names},
+           "exchange_rates_version": get_exchange_rates_version(),
+           "CEPCI": hashlib.sha256(json.dumps(CEPCI_values, sort_keys=True, default=str).encode()).hexdigest(),
+           "currency": currency,
+           "CEPCI_year": int(CEPCI_year),
+           "size_regime": size_regime,
+           **key_parts}
+
+    return key, hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def get_CAPEX_curve_fit(fit_curve, data_file_names, currency, CEPCI_year, size_regime=None, key_parts=None):
+    """
+    Gets the parameters and error metrics of a fitted CAPEX curve. Fits are stored on disk, so that the data is only
+    loaded, converted, and fitted (fit_curve called) the first time a curve is used. Fits are refitted automatically
+    if the data, exchange rates, CEPCI values, or the fitting code change.
+    Caching can be switched off via settings.user_inputs.general.cache_CAPEX_curves.
+
+    Parameters
+    ----------
+    fit_curve: Callable
+        Function fitting the curve - called with the keyword arguments currency, CEPCI_year, and size_regime and
+        returning a dictionary of fitted values (e.g. {"popt": popt, "MAPE": mape_decimal}).
+    data_file_names: list[str]
+        Names of the data files (in the data directory) the fit is based on.
+    currency: str
+        Currency that is to be used for analysis.
+    CEPCI_year: int
+        Reference CEPCI year that is to be used for analysis.
+    size_regime: str | None
+        Size regime (i.e. subset of the data) the curve is fitted to - e.g. "small scale".
+    key_parts: dict | None
+        Further inputs the fit depends on (e.g. feedstock properties used to convert data).
+
+    Returns
+    -------
+    dict
+        Fitted values - arrays are returned as lists and scalars as floats.
+    """
+    # Get defaults
+    if key_parts is None:
+        key_parts = {}
+
+    if not settings.user_inputs.general.get("cache_CAPEX_curves", True):
+        return _to_serialisable(fit_curve(currency=currency, CEPCI_year=CEPCI_year, size_regime=size_regime))
+
+    key, key_hash = _get_cache_key(fit_curve, data_file_names, currency, CEPCI_year, size_regime, key_parts)
+    cached_curve = _load_cache().get(key_hash)
+    if cached_curve is not None:
+        return cached_curve["fit"]
+
+    fit = _to_serialisable(fit_curve(currency=currency, CEPCI_year=CEPCI_year, size_regime=size_regime))
+
+    with _cache_lock:
+        curves = dict(_load_cache())  # reload to keep curves added by other runs since the cache was last read
+        curves[key_hash] = {"key": key, "fit": fit}
+        _write_cache(curves)
+
+    return fit
+
+
+def _to_serialisable(fit):
+    return {name: np.asarray(value, dtype=float).tolist() for name, value in fit.items()}
+
+
+def clear_CAPEX_curve_cache():
+    """
+    Deletes all stored CAPEX curve fits, so that curves are refitted on their next use.
+    """
+    with _cache_lock:
+        cache_path = get_CAPEX_curve_cache_path()
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
@@ -1,9 +1,7 @@
 import math
-import os
 import warnings
 
 import numpy as np
-import pandas as pd
 
 from typing import Literal
 from scipy.optimize import curve_fit
@@ -11,13 +9,18 @@ from config import settings
 from functions.MonteCarloSimulation import get_distribution_draws
 from functions.general import MAPE, convert_system_size
 from functions.general.curve_fitting import func_power_curve, func_straight_line
-from functions.general.utility import get_project_root
-from functions.TEA import convert_currency_annual_average
+from functions.general.utility import load_table
+from functions.TEA import convert_currency_annual_average_bulk
 from functions.TEA.scaling import CEPCI_scale
+from functions.TEA.CAPEX_estimation.CAPEX_curve_cache import get_CAPEX_curve_fit
 from objects import triangular_dist_maker, PresentValue
 
 _system_size_unit_types = Literal[None, "tonnes/hour", "MW_feedstock_LHV", "MWel"]
 
+# Mode of the fraction of the overall gasification scheme's CAPEX attributed to gas cleaning (see notes in
+# _fit_gasification_CAPEX_curve)
+_gas_cleaning_fraction_of_total_CAPEX_mode = 0.24
+
 
 def get_gasification_and_gas_cleaning_CAPEX_distributions(system_size=None,
                                                           system_size_units: _system_size_unit_types = None,
@@ -90,27 +93,111 @@ def get_gasification_and_gas_cleaning_CAPEX_distributions(system_size=None,
     if reactor_type is None:
         reactor_type = settings.user_inputs.process_conditions.reactor_type
 
+    # Define thresholds to split data set into small scale and medium scale plants and max allowable system size.
+    threshold_small_scale_system = 5  # MWel
+    max_fluidised_bed_size = 70  # MWel
+    max_fixed_bed_size = 15  # MWel
+
+    # Select model based on system size and reactor type
+    # Small-scale fluidised bed (or type "Other") reactor
+    if system_size_MWel <= threshold_small_scale_system and reactor_type in ["Other", "Fluidised bed"]:
+        size_regime = "small scale"
+
+    # Medium to large scale fluidised bed (or type "Other") reactor
+    elif (threshold_small_scale_system < system_size_MWel < max_fluidised_bed_size
+            and reactor_type in ["Other", "Fluidised bed"]):
+        size_regime = "medium scale fluidised bed"
+    else:
+        # Note: Currently allowed - could also raise Error and not allow this - (same model as the one above for
+        # medium-sized systems)
+        size_regime = "medium scale fluidised bed"
+        warnings.warn("Gasifier size very large - supported size exceeded which may lead to errors.")
+
+    # Fixed bed reactor smaller than 15MWel
+    if system_size_MWel <= max_fixed_bed_size and reactor_type == "Fixed bed":
+        size_regime = "fixed bed"
+
+    # Fixed bed reactor larger than 15MWel - default to same model as fluidised bed reactor and display warning
+    if max_fixed_bed_size < system_size_MWel < max_fluidised_bed_size and reactor_type == "Fixed bed":
+        warnings.warn("Fixed bed gasifier only supported up to a rating of 15 MWel - defaulted to fluidised bed gasifier "
+                      "CAPEX model.")
+        size_regime = "medium scale fluidised bed"
+
+    # Get fitted model and its error metrics, and make prediction
+    CAPEX_curve = get_CAPEX_curve_fit(_fit_gasification_CAPEX_curve,
+                                      data_file_names=["CAPEX_Gasification.csv", "system_size_data.csv"],
+                                      currency=currency,
+                                      CEPCI_year=CEPCI_year,
+                                      size_regime=size_regime,
+                                      key_parts={"feedstock_LHV": settings.user_inputs.feedstock.LHV})
+    mape_decimal = CAPEX_curve["MAPE"]
+
+    if size_regime == "fixed bed":
+        prediction = func_straight_line(system_size_MWel, *CAPEX_curve["popt"])
+    else:
+        prediction = func_power_curve(system_size_MWel, *CAPEX_curve["popt"])
+
+    # Raise warnings if necessary
+    if system_size_MWel > max_fluidised_bed_size:
+        warnings.warn("System size very large - supported size of 70 MWel exceeded which may lead to errors.")
+
+    # Gasification costs
+    # Get lower and upper bounds of distribution based on the distributions MAPE
+    lower_bound_gasification = prediction - (prediction * mape_decimal)
+    upper_bound_gasification = prediction + (prediction * mape_decimal)
+
+    dist_draws_gasification = get_distribution_draws(triangular_dist_maker(lower=lower_bound_gasification,
+                                                                           mode=prediction,
+                                                                           upper=upper_bound_gasification),
+                                                     input_name="CAPEX gasification")
+    # Gas cleaning costs
+
+    # Gas cleaning cost fractions of total cost. See notes at the start of script more information.
+    gas_cleaning_fraction_of_total_CAPEX_lower = 0.17
+    gas_cleaning_fraction_of_total_CAPEX_upper = 0.33
+    # mode value = 0.24 (defined above)
+
+    # Gas cleaning fraction distribution and draws
+    dist_draws_gas_cleaning_fraction_decimal = get_distribution_draws(
+        triangular_dist_maker(lower=gas_cleaning_fraction_of_total_CAPEX_lower,
+                              mode=_gas_cleaning_fraction_of_total_CAPEX_mode,
+                              upper=gas_cleaning_fraction_of_total_CAPEX_upper),
+        input_name="gas cleaning fraction of CAPEX")
+
+    dist_draws_gas_cleaning = ((dist_draws_gasification / (1-_gas_cleaning_fraction_of_total_CAPEX_mode)) *
+                               dist_draws_gas_cleaning_fraction_decimal)
+
+    # Store CAPEX distributions in PresentValue objects.
+    CAPEX_gasification = PresentValue(values=np.multiply(dist_draws_gasification, -1),
+                                      name="CAPEX gasification",
+                                      short_label="CAPEX Gas.",
+                                      tag="CAPEX")
+
+    CAPEX_gas_cleaning = PresentValue(values=np.multiply(dist_draws_gas_cleaning, -1),
+                                      name="CAPEX gas cleaning",
+                                      short_label="CAPEX Gas Clean.",
+                                      tag="CAPEX")
+
+    return CAPEX_gasification, CAPEX_gas_cleaning
+
+
+def _fit_gasification_CAPEX_curve(currency, CEPCI_year, size_regime):
+    """
+    Fits the CAPEX curve (excluding gas cleaning) of gasification plants of a given size regime ("small scale",
+    "medium scale fluidised bed", or "fixed bed") to the CAPEX data (see get_CAPEX_curve_fit).
+    """
     # Load data
-    root_dir = get_project_root()
-    data_file = "CAPEX_Gasification.csv"
-    data_file_path = os.path.join(root_dir, "data", data_file)
-    df_source = pd.read_csv(data_file_path)
+    df_source = load_table("CAPEX_Gasification.csv")
     df = df_source.copy()  # working copy of df
 
     # Convert all values to same currency and update to most recent CEPCI value
-    CAPEX_currency_scaled = []
-    CAPEX_currency_CEPCI_scaled = []
-
-    for row_no in df.index:
-        CAPEX_currency_scaled.append(convert_currency_annual_average(value=df["CAPEX"][row_no],
-                                                                     year=df["Reference Year"][row_no],
-                                                                     base_currency=df["Currency"][row_no],
-                                                                     converted_currency=currency,
-                                                                     approximate_rate=False,
-                                                                     method="yfinance"))
-        CAPEX_currency_CEPCI_scaled.append(CEPCI_scale(base_year=df["Reference Year"][row_no],
-                                                       design_year=CEPCI_year,
-                                                       value=CAPEX_currency_scaled[row_no]))
+    CAPEX_currency_scaled = convert_currency_annual_average_bulk(values=df["CAPEX"],
+                                                                 years=df["Reference Year"],
+                                                                 base_currencies=df["Currency"],
+                                                                 converted_currency=currency)
+    CAPEX_currency_CEPCI_scaled = CEPCI_scale(base_year=df["Reference Year"],
+                                              design_year=CEPCI_year,
+                                              value=CAPEX_currency_scaled)
 
     # Add (i) currency and (ii) currency + CEPCI scaled values to dataframe
     currency_scaled_label = "CAPEX_" + currency
@@ -197,10 +284,9 @@ def get_gasification_and_gas_cleaning_CAPEX_distributions(system_size=None,
 
     # Add additional cost column which excludes cleaning cost if cleaning was included in cost
     label_CAPEX_scaled_without_cleaning = "CAPEX_scaled_without_cleaning"
-    gas_cleaning_fraction_of_total_CAPEX_mode = 0.24
     df[label_CAPEX_scaled_without_cleaning] = np.array(np.where(df["Cleaning and Power Generation"] != "Gasification only",
                                                                 df[currency_and_CEPCI_scaled_label] *
-                                                                (1-gas_cleaning_fraction_of_total_CAPEX_mode),
+                                                                (1-_gas_cleaning_fraction_of_total_CAPEX_mode),
                                                                 df[currency_and_CEPCI_scaled_label]))
     """
     Note: 
@@ -218,139 +304,34 @@ def get_gasification_and_gas_cleaning_CAPEX_distributions(system_size=None,
     # Introduce limits to main data frame - i.e. discard very large data/region where data gets too sparse
     df = df[df["Plant size [MWel]"] < 100].copy()
 
-    # Define thresholds to split data set into small scale and medium scale plants and max allowable system size.
+    # Define thresholds to split data set into small scale and medium scale plants.
     threshold_small_scale_system = 5  # MWel
-    max_fluidised_bed_size = 70  # MWel
-    max_fixed_bed_size = 15  # MWel
 
     # Get dataframes for fixed bed and fluidised bed data only
     df_fluidised = df[df["Type"] == "fluidised bed"]
     df_fixed = df[df["Type"] == "fixed bed"]
 
-    # Fit models, get performance metric, and make prediction
-    # Small-scale fluidised bed (or type "Other") reactor
-    if system_size_MWel <= threshold_small_scale_system and reactor_type in ["Other", "Fluidised bed"]:
+    # Fit models and get performance metric
+    if size_regime == "small scale":
         df_selected = df[df["Plant size [MWel]"] < threshold_small_scale_system]
-
-        # Fit power function based on previous analysis
-        popt, _ = curve_fit(f=func_power_curve,
-                            xdata=df_selected["Plant size [MWel]"],
-                            ydata=df_selected[label_CAPEX_scaled_without_cleaning],
-                            maxfev=10000)
-
-        mape_decimal = MAPE(df_selected[label_CAPEX_scaled_without_cleaning],
-                            func_power_curve(df_selected["Plant size [MWel]"], *popt),
-                            return_as_decimal=True)
-
-        prediction = func_power_curve(system_size_MWel, *popt)
-
-    # Medium to large scale fluidised bed (or type "Other") reactor
-    elif (threshold_small_scale_system < system_size_MWel < max_fluidised_bed_size
-            and reactor_type in ["Other", "Fluidised bed"]):
-        df_selected = df_fluidised[df_fluidised["Plant size [MWel]"] > threshold_small_scale_system]
-
-        # Fit power function based on previous analysis
-        popt, _ = curve_fit(f=func_power_curve,
-                            xdata=df_selected["Plant size [MWel]"],
-                            ydata=df_selected[label_CAPEX_scaled_without_cleaning],
-                            maxfev=10000)
-
-        mape_decimal = MAPE(df_selected[label_CAPEX_scaled_without_cleaning],
-                            func_power_curve(df_selected["Plant size [MWel]"], *popt),
-                            return_as_decimal=True)
-
-        prediction = func_power_curve(system_size_MWel, *popt)
-    else:
-        # Note: Currently allowed - could also raise Error and not allow this - (same model as the one above for
-        # medium-sized systems)
+        curve_function = func_power_curve  # power function based on previous analysis
+    elif size_regime == "medium scale fluidised bed":
         df_selected = df_fluidised[df_fluidised["Plant size [MWel]"] > threshold_small_scale_system]
-
-        # Fit power function based on previous analysis
-        popt, _ = curve_fit(f=func_power_curve,
-                            xdata=df_selected["Plant size [MWel]"],
-                            ydata=df_selected[label_CAPEX_scaled_without_cleaning],
-                            maxfev=10000)
-
-        mape_decimal = MAPE(df_selected[label_CAPEX_scaled_without_cleaning],
-                            func_power_curve(df_selected["Plant size [MWel]"], *popt),
-                            return_as_decimal=True)
-
-        prediction = func_power_curve(system_size_MWel, *popt)
-        warnings.warn("Gasifier size very large - supported size exceeded which may lead to errors.")
-
-    # Fixed bed reactor smaller than 15MWel
-    if system_size_MWel <= max_fixed_bed_size and reactor_type == "Fixed bed":
+        curve_function = func_power_curve  # power function based on previous analysis
+    elif size_regime == "fixed bed":
         df_selected = df_fixed
+        curve_function = func_straight_line
+    else:
+        raise ValueError(f"Invalid size regime '{size_regime}'. Expected one of: "
+                         f"['small scale', 'medium scale fluidised bed', 'fixed bed']")
 
-        # Fit power function based on previous analysis
-        popt, _ = curve_fit(f=func_straight_line,
-                            xdata=df_selected["Plant size [MWel]"],
-                            ydata=df_selected[label_CAPEX_scaled_without_cleaning],
-                            maxfev=10000)
-
-        mape_decimal = MAPE(df_selected[label_CAPEX_scaled_without_cleaning],
-                            func_straight_line(df_selected["Plant size [MWel]"], *popt),
-                            return_as_decimal=True)
-
-        prediction = func_straight_line(system_size_MWel, *popt)
-
-    # Fixed bed reactor larger than 15MWel - default to same model as fluidised bed reactor and display warning
-    if max_fixed_bed_size < system_size_MWel < max_fluidised_bed_size and reactor_type == "Fixed bed":
-        warnings.warn("Fixed bed gasifier only supported up to a rating of 15 MWel - defaulted to fluidised bed gasifier "
-                      "CAPEX model.")
-        df_selected = df_fluidised[df_fluidised["Plant size [MWel]"] > threshold_small_scale_system]
-
-        # Fit power function based on previous analysis
-        popt, _ = curve_fit(f=func_power_curve,
-                            xdata=df_selected["Plant size [MWel]"],
-                            ydata=df_selected[label_CAPEX_scaled_without_cleaning],
-                            maxfev=10000)
-
-        mape_decimal = MAPE(df_selected[label_CAPEX_scaled_without_cleaning],
-                            func_power_curve(df_selected["Plant size [MWel]"], *popt),
-                            return_as_decimal=True)
-
-        prediction = func_power_curve(system_size_MWel, *popt)
-
-    # Raise warnings if necessary
-    if system_size_MWel > max_fluidised_bed_size:
-        warnings.warn("System size very large - supported size of 70 MWel exceeded which may lead to errors.")
-
-    # Gasification costs
-    # Get lower and upper bounds of distribution based on the distributions MAPE
-    lower_bound_gasification = prediction - (prediction * mape_decimal)
-    upper_bound_gasification = prediction + (prediction * mape_decimal)
-
-    dist_draws_gasification = list(get_distribution_draws(triangular_dist_maker(lower=lower_bound_gasification,
-                                                                                mode=prediction,
-                                                                                upper=upper_bound_gasification)))
-    # Gas cleaning costs
-
-    # Gas cleaning cost fractions of total cost. See notes at the start of script more information.
-    gas_cleaning_fraction_of_total_CAPEX_lower = 0.17
-    gas_cleaning_fraction_of_total_CAPEX_upper = 0.33
-    # mode value = 0.24 (defined above)
-
-    # Gas cleaning fraction distribution and draws
-    dist_draws_gas_cleaning_fraction_decimal = list(get_distribution_draws(
-        triangular_dist_maker(lower=gas_cleaning_fraction_of_total_CAPEX_lower,
-                              mode=gas_cleaning_fraction_of_total_CAPEX_mode,
-                              upper=gas_cleaning_fraction_of_total_CAPEX_upper)))
-
-    dist_draws_gas_cleaning = []
-    for count, gasification_CAPEX_draw in enumerate(dist_draws_gasification):
-        dist_draws_gas_cleaning.append((gasification_CAPEX_draw / (1-gas_cleaning_fraction_of_total_CAPEX_mode)) *
-                                       dist_draws_gas_cleaning_fraction_decimal[count])
-
-    # Store CAPEX distributions in PresentValue objects.
-    CAPEX_gasification = PresentValue(values=list(np.multiply(dist_draws_gasification, -1)),
-                                      name="CAPEX gasification",
-                                      short_label="CAPEX Gas.",
-                                      tag="CAPEX")
+    popt, _ = curve_fit(f=curve_function,
+                        xdata=df_selected["Plant size [MWel]"],
+                        ydata=df_selected[label_CAPEX_scaled_without_cleaning],
+                        maxfev=10000)
 
-    CAPEX_gas_cleaning = PresentValue(values=list(np.multiply(dist_draws_gas_cleaning, -1)),
-                                      name="CAPEX gas cleaning",
-                                      short_label="CAPEX Gas Clean.",
-                                      tag="CAPEX")
+    mape_decimal = MAPE(df_selected[label_CAPEX_scaled_without_cleaning],
+                        curve_function(df_selected["Plant size [MWel]"], *popt),
+                        return_as_decimal=True)
 
-    return CAPEX_gasification, CAPEX_gas_cleaning
+    return {"popt": popt, "MAPE": mape_decimal}
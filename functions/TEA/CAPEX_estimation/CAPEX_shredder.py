@@ -1,14 +1,12 @@
-import os
-
 from scipy.optimize import curve_fit
 from sklearn.metrics import mean_squared_error
 
 import functions
 
-import pandas as pd
 import numpy as np
 
 from config import settings
+from functions.TEA.CAPEX_estimation.CAPEX_curve_cache import get_CAPEX_curve_fit
 from objects import PresentValue, triangular_dist_maker
 
 
@@ -42,27 +40,46 @@ def get_shredding_CAPEX_distribution(currency=None, CEPCI_year=None):
     # Get system size
     system_size_tonnes_per_hour = settings.user_inputs.system_size.mass_basis_tonnes_per_hour
 
+    # Get fitted model and its error metrics
+    CAPEX_curve = get_CAPEX_curve_fit(_fit_shredding_CAPEX_curve,
+                                      data_file_names=["CAPEX_grinder_shredder.csv"],
+                                      currency=currency,
+                                      CEPCI_year=CEPCI_year)
+    popt, mape_decimal = CAPEX_curve["popt"], CAPEX_curve["MAPE"]
+
+    prediction = functions.general.curve_fitting.func_straight_line(system_size_tonnes_per_hour, *popt)
+
+    # Get lower and upper bounds of distribution based on the distributions MAPE
+    lower_bound = prediction - (prediction * mape_decimal)
+    upper_bound = prediction + (prediction * mape_decimal)
+
+    distribution = triangular_dist_maker(lower=lower_bound, mode=prediction, upper=upper_bound)
+
+    distribution_draws = np.multiply(functions.MonteCarloSimulation.get_distribution_draws(
+        distribution, input_name="CAPEX shredder"), -1)  # turn -ve as they are a cost
+
+    CAPEX = PresentValue(values=distribution_draws,
+                         name="CAPEX Feedstock Shredder/Primary Grinder",
+                         short_label="CAPEX Shred",
+                         tag="CAPEX")
+    return CAPEX
+
+
+def _fit_shredding_CAPEX_curve(currency, CEPCI_year, size_regime=None):
+    """
+    Fits the CAPEX curve of feedstock shredders/primary grinders to the CAPEX data (see get_CAPEX_curve_fit).
+    """
     # Load data
-    root_dir = functions.general.utility.get_project_root()
-    data_file = "CAPEX_grinder_shredder.csv"
-    data_file_path = os.path.join(root_dir, "data", data_file)
-    df = pd.read_csv(data_file_path)
+    df = functions.general.utility.load_table("CAPEX_grinder_shredder.csv")
 
     # Convert all values to same currency and update to most recent CEPCI value
-    CAPEX_currency_scaled = []
-    CAPEX_currency_CEPCI_scaled = []
-
-    for row_no in df.index:
-        CAPEX_currency_scaled.append(functions.TEA.convert_currency_annual_average(value=df["CAPEX"][row_no],
-                                                                                   year=df["Reference Year"][row_no],
-                                                                                   base_currency=df["Currency"][row_no],
-                                                                                   converted_currency=currency,
-                                                                                   approximate_rate=False,
-                                                                                   method="yfinance")
-                                     )
-        CAPEX_currency_CEPCI_scaled.append(functions.TEA.CEPCI_scale(base_year=df["Reference Year"][row_no],
-                                                                     design_year=CEPCI_year,
-                                                                     value=CAPEX_currency_scaled[row_no]))
+    CAPEX_currency_scaled = functions.TEA.convert_currency_annual_average_bulk(values=df["CAPEX"],
+                                                                               years=df["Reference Year"],
+                                                                               base_currencies=df["Currency"],
+                                                                               converted_currency=currency)
+    CAPEX_currency_CEPCI_scaled = functions.TEA.CEPCI_scale(base_year=df["Reference Year"],
+                                                            design_year=CEPCI_year,
+                                                            value=CAPEX_currency_scaled)
 
     # Add (i) currency and (ii) currency + CEPCI scaled values to dataframe
     currency_scaled_label = "CAPEX_" + currency
@@ -73,7 +90,7 @@ def get_shredding_CAPEX_distribution(currency=None, CEPCI_year=None):
     # Remove data points which should be ignored
     df = df[df["Ignore"] != True].copy()
 
-    # Fit model, get error metrics, and prediction.
+    # Fit model and get error metrics
     popt, _ = curve_fit(f=functions.general.curve_fitting.func_straight_line,
                         xdata=df["Plant size [tonnes/hour]"],
                         ydata=df[currency_and_CEPCI_scaled_label],
@@ -89,18 +106,4 @@ def get_shredding_CAPEX_distribution(currency=None, CEPCI_year=None):
                                               df["Plant size [tonnes/hour]"], *popt),
                                           return_as_decimal=True)
 
-    prediction = functions.general.curve_fitting.func_straight_line(system_size_tonnes_per_hour, *popt)
-
-    # Get lower and upper bounds of distribution based on the distributions MAPE
-    lower_bound = prediction - (prediction * mape_decimal)
-    upper_bound = prediction + (prediction * mape_decimal)
-
-    distribution = triangular_dist_maker(lower=lower_bound, mode=prediction, upper=upper_bound)
-
-    distribution_draws = list(np.multiply(functions.MonteCarloSimulation.get_distribution_draws(distribution), -1))  # turn -ve as they are a cost
-
-    CAPEX = PresentValue(values=distribution_draws,
-                         name="CAPEX Feedstock Shredder/Primary Grinder",
-                         short_label="CAPEX Shred",
-                         tag="CAPEX")
-    return CAPEX
+    return {"popt": popt, "MAPE": mape_decimal}
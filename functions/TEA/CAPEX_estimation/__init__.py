@@ -6,3 +6,4 @@ from .CAPEX_hammermill import get_milling_CAPEX_distribution
 from .CAPEX_shredder import get_shredding_CAPEX_distribution
 from .CAPEX_pellet_mill import get_pellet_mill_and_cooler_CAPEX_distribution
 from .CAPEX_boiler import get_boiler_CAPEX_distribution
+from .CAPEX_curve_cache import get_CAPEX_curve_fit, clear_CAPEX_curve_cache
@@ -1,4 +1,6 @@
-from .cash_flow_conversion import get_present_value, get_annual_value
-from .scaling import power_scale, CEPCI_scale, get_most_recent_available_CEPCI_year
-from .currency_conversion import convert_currency_simple, convert_currency_annual_average
+from .cash_flow_conversion import get_present_value, get_annual_value, get_present_value_factor, get_annual_value_factor
+from .scaling import power_scale, CEPCI_scale, get_most_recent_available_CEPCI_year, get_CEPCI_table
+from .currency_conversion import (convert_currency_simple, convert_currency_annual_average,
+                                  convert_currency_annual_average_bulk, get_exchange_rates,
+                                  get_exchange_rates_version, refresh_exchange_rates)
 from .annual_operating_hours import get_annual_operating_hours_draws
@@ -1,28 +1,27 @@
-import os
-
-import pandas as pd
 import numpy as np
 
 import functions
 
 
-def get_annual_operating_hours_draws():
+def get_annual_operating_hours_draws(input_name="annual operating hours"):
     """
     Get distribution draws of annual operating hours based on empirical model.
 
+    Parameters
+    ----------
+    input_name: str
+        Name of the uncertain input the draws are used for - identifies its random number stream when common random
+        numbers are used.
+
     Returns
     -------
-    list
+    np.ndarray
         Distribution draws [hours/year].
     """
     from objects import triangular_dist_maker  # import here to avoid circular import error
 
     # Load and display data
-    root_dir = functions.general.utility.get_project_root()
-
-    data_file = "annual_operating_hours.csv"
-    data_file_path = os.path.join(root_dir, "data", data_file)
-    df_source = pd.read_csv(data_file_path)
+    df_source = functions.general.utility.load_table("annual_operating_hours.csv")
     df = df_source.copy()  # working copy of original dataframe
 
     # Hours before rejecting outliers
@@ -35,6 +34,7 @@ def get_annual_operating_hours_draws():
                                        mode=np.mean(hours_array_after_rejecting_outliers),
                                        upper=hours_array_after_rejecting_outliers.max())
 
-    distribution = list(functions.MonteCarloSimulation.get_distribution_draws(distribution_maker=dist_maker))
+    distribution = functions.MonteCarloSimulation.get_distribution_draws(distribution_maker=dist_maker,
+                                                                         input_name=input_name)
 
     return distribution
@@ -1,6 +1,8 @@
 import functools
 import inspect
 
+import numpy as np
+
 from config import settings
 from typing import Literal
 
@@ -29,6 +31,106 @@ def check_args_for_percentage(*args):
     return decorator
 
 
+def _get_default_economic_parameters(interest_rate=None, discount_period=None):
+    """
+    Fills in the default interest rate and discount period defined in settings and checks the interest rate.
+
+    Parameters
+    ----------
+    interest_rate: float | int | ArrayLike | None
+        Interest rate given as a decimal (e.g. 5 % should be entered as 0.05).
+    discount_period: float | int | ArrayLike | None
+        Discount period given in years.
+
+    Returns
+    -------
+    tuple
+        Interest rate and discount period.
+    """
+    # Get defaults
+    if interest_rate is None:
+        interest_rate = settings.data.economic.interest_rate.year_2023[settings.user_inputs.general.currency]
+    if discount_period is None:
+        discount_period = settings.data.economic.system_lifecycle
+
+    if not np.isscalar(interest_rate):
+        interest_rate = np.asarray(interest_rate, dtype=float)
+    if not np.isscalar(discount_period):
+        discount_period = np.asarray(discount_period, dtype=float)
+
+    # Run check
+    if np.any(interest_rate > 1):
+        raise ValueError("Interest rate should be given as a decimal.")
+
+    return interest_rate, discount_period
+
+
+def get_present_value_factor(value_type: _value_type_options_pv, interest_rate=None, discount_period=None):
+    """
+    Gets the factor converting future values or annual values to present values.
+
+    Parameters
+    ----------
+    value_type: str
+        Defines if the known values are given as annual value (AV) or future value (FV).
+    interest_rate: float | int | ArrayLike
+        Interest rate given as a decimal (e.g. 5 % should be entered as 0.05). An array gives one factor per rate
+        (e.g. per Monte Carlo iteration).
+    discount_period: float | int | ArrayLike
+        Discount period given in years.
+
+    Returns
+    -------
+    float | ArrayLike
+        Present value factor(s).
+    """
+    if value_type not in ["FV", "AV"]:
+        raise ValueError(r"Warning: This type of reference value is not supported. Only 'FV' or 'AV' supported.")
+
+    interest_rate, discount_period = _get_default_economic_parameters(interest_rate, discount_period)
+    compounding = (1 + interest_rate) ** discount_period
+
+    if value_type == "FV":
+        factor = 1 / compounding
+    else:
+        factor = (compounding - 1) / (interest_rate * compounding)
+
+    return factor
+
+
+def get_annual_value_factor(value_type: _value_type_options_av, interest_rate=None, discount_period=None):
+    """
+    Gets the factor converting present values or future values to annual values (also called annuity).
+
+    Parameters
+    ----------
+    value_type: str
+        Defines if the known values are given as present value (PV) or future value (FV).
+    interest_rate: float | int | ArrayLike
+        Interest rate given as a decimal (e.g. 5 % should be entered as 0.05). An array gives one factor per rate
+        (e.g. per Monte Carlo iteration).
+    discount_period: float | int | ArrayLike
+        Discount period given in years.
+
+    Returns
+    -------
+    float | ArrayLike
+        Annual value factor(s).
+    """
+    if value_type not in ["PV", "FV"]:
+        raise ValueError(r"Warning: This type of reference value is not supported. Only 'PV' or 'FV' supported.")
+
+    interest_rate, discount_period = _get_default_economic_parameters(interest_rate, discount_period)
+    compounding = (1 + interest_rate) ** discount_period
+
+    if value_type == "PV":
+        factor = (interest_rate * compounding) / (compounding - 1)
+    else:
+        factor = interest_rate / (compounding - 1)
+
+    return factor
+
+
 # @check_args_for_percentage("interest_rate")
 def get_present_value(values, value_type: _value_type_options_pv, interest_rate=None, discount_period=None):
     """
@@ -36,75 +138,27 @@ def get_present_value(values, value_type: _value_type_options_pv, interest_rate=
 
     Parameters
     ----------
-    values : float | int | list[float] | list[int]
+    values : float | int | ArrayLike
         Defines the original values given as its FV or AV.
     value_type: str
         Defines if the known values are given as annual value (AV) or future value (FV).
-    interest_rate: float | int
-        Interest rate given as a decimal (e.g. 5 % should be entered as 0.05).
-    discount_period: float | int
+    interest_rate: float | int | ArrayLike
+        Interest rate given as a decimal (e.g. 5 % should be entered as 0.05). An array of the same length as values
+        applies one rate per value (e.g. per Monte Carlo iteration).
+    discount_period: float | int | ArrayLike
         Discount period given in years.
 
     Returns
     -------
-    float | list[float]
+    float | ArrayLike
         Present value of imputed cost or benefit object
     """
+    factor = get_present_value_factor(value_type, interest_rate, discount_period)
 
-    # Helper function for single value
-    def _get_single_present_value(_value, _value_type: _value_type_options_pv, _interest_rate=None,
-                                  _discount_period=None):
-        """
-        Convert future value or annual value to present value.
-        Expanded by get_present_value function to extend to list and numpy arrays.
-
-        Parameters
-        ----------
-        _value : float | int
-            Defines the original value given as its FV or AV.
-        _value_type: str
-            Defines if the known value is the annual value (AV) or future value (FV).
-        _interest_rate: float | int
-            Interest rate given as a decimal (e.g. 5 % should be entered as 0.05).
-        _discount_period: float | int
-            Discount period given in years.
-
-        Returns
-        -------
-        float
-            Present value of imputed cost or benefit object
-        """
-        if _interest_rate is None:
-            _interest_rate = settings.data.economic.interest_rate.year_2023[settings.user_inputs.general.currency]
-        if _discount_period is None:
-            _discount_period = settings.data.economic.system_lifecycle
-
-        if _value_type == "FV":
-            _pv = _value / ((1 + _interest_rate) ** _discount_period)
-
-        elif _value_type == "AV":
-            _pv = _value * ((((1 + _interest_rate) ** _discount_period) - 1) / (
-                    _interest_rate * ((1 + _interest_rate) ** _discount_period)))
-        else:
-            raise ValueError(r"Warning: This type of reference value is not supported. Only 'FV' or 'AV' supported.")
-
-        # Run check
-        if _interest_rate > 1:
-            raise ValueError("Interest rate should be given as a decimal.")
-
-        return _pv
-
-    # Extension of inner function to lists and numpy arrays if required.
     if isinstance(values, int) or isinstance(values, float):  # single value case
-        pv = _get_single_present_value(values, value_type, interest_rate, discount_period)
-    else:  # list or other iterable of values case
-        partial_function = functools.partial(_get_single_present_value,
-                                             _value_type=value_type,
-                                             _interest_rate=interest_rate,
-                                             _discount_period=discount_period)
-        pv = [partial_function(_value=x) for x in values]
+        return values * factor
 
-    return pv
+    return np.asarray(values, dtype=float) * factor  # array of values case
 
 
 # @check_args_for_percentage("interest_rate")
@@ -114,70 +168,24 @@ def get_annual_value(values, value_type: _value_type_options_av, interest_rate=N
 
     Parameters
     ----------
-    values : float | int | list[float] | list[int]
+    values : float | int | ArrayLike
         Defines the original values given as its PV or FV.
     value_type: str
         Defines if the known values are given as present value (PV) or future value (FV).
-    interest_rate: float | int
-        Interest rate given as a decimal (e.g. 5 % should be entered as 0.05).
-    discount_period: float | int
+    interest_rate: float | int | ArrayLike
+        Interest rate given as a decimal (e.g. 5 % should be entered as 0.05). An array of the same length as values
+        applies one rate per value (e.g. per Monte Carlo iteration).
+    discount_period: float | int | ArrayLike
         Discount period given in years.
 
     Returns
     -------
-    float | list[float]
+    float | ArrayLike
         Annual value (also called annuity) of imputed cost or benefit object
     """
+    factor = get_annual_value_factor(value_type, interest_rate, discount_period)
 
-    def _get_single_annual_value(_value, _value_type: _value_type_options_av, _interest_rate=None,
-                                 _discount_period=None):
-        """
-        Convert present value or present value to annual value (also called annuity).
-
-        Parameters
-        ----------
-        _value : float | int
-            Defines the original value given as its PV or FV.
-        _value_type: str
-            Defines if the known value is the present value (PV) or future value (FV).
-        _interest_rate: float | int
-            Interest rate given as a decimal (e.g. 5 % should be entered as 0.05).
-        _discount_period: float | int
-            Discount period given in years.
-
-        Returns
-        -------
-        float
-            Annual value (also called annuity) of imputed cost or benefit object
-        """
-        if _interest_rate is None:
-            _interest_rate = settings.data.economic.interest_rate.year_2023[settings.user_inputs.general.currency]
-        if _discount_period is None:
-            _discount_period = settings.data.economic.system_lifecycle
-
-        if _value_type == "PV":
-            _av = _value * ((_interest_rate * ((1 + _interest_rate) ** _discount_period)) / (
-                        ((1 + _interest_rate) ** _discount_period) - 1))
-
-        elif _value_type == "FV":
-            _av = _value * (_interest_rate / (((1 + _interest_rate) ** _discount_period) - 1))
-        else:
-            raise ValueError(r"Warning: This type of reference value is not supported. Only 'PV' or 'FV' supported.")
-
-        # Run check
-        if _interest_rate > 1:
-            raise ValueError("Interest rate should be given as a decimal.")
-
-        return _av
-
-    # Extension of inner function to lists and numpy arrays if required.
     if isinstance(values, int) or isinstance(values, float):  # single value case
-        av = _get_single_annual_value(values, value_type, interest_rate, discount_period)
-    else:  # list or other iterable of values case
-        partial_function = functools.partial(_get_single_annual_value,
-                                             _value_type=value_type,
-                                             _interest_rate=interest_rate,
-                                             _discount_period=discount_period)
-        av = [partial_function(_value=x) for x in values]
-
-    return av
+        return values * factor
+
+    return np.asarray(values, dtype=float) * factor  # array of values case
@@ -6,12 +6,14 @@ import numpy as np
 from config import settings
 
 
-def biochar_sale_cost_benefit():
+def biochar_sale_cost_benefit(biochar_yield_predictions=None):
     """
     Calculates benefits (or costs) resulting from the sale of biochar.
 
     Parameters
     ----------
+    biochar_yield_predictions: list | None
+        Monte Carlo predictions of biochar yield [g/kg wb].
 
     Returns
     -------
@@ -21,7 +23,8 @@ def biochar_sale_cost_benefit():
     """
 
     # Get biochar production
-    biochar_yield_predictions = functions.general.predictions_to_distributions.get_all_prediction_distributions()["Char yield [g/kg wb]"]  # [kg/tonne feedstock]
+    if biochar_yield_predictions is None:
+        biochar_yield_predictions = functions.general.predictions_to_distributions.get_all_prediction_distributions()["Char yield [g/kg wb]"]  # [kg/tonne feedstock]
 
     # Calculate biochar yield
     biochar_yield_array = (np.array(biochar_yield_predictions) / 1000)  # [tonnes biochar/tonne feedstock]
@@ -44,7 +47,8 @@ def biochar_sale_cost_benefit():
 
     # Prices [currency/tonne biochar]
     prices_array = functions.MonteCarloSimulation.get_distribution_draws(distribution_maker=price_distribution,
-                                                                         length_array=len(biochar_yield_array))
+                                                                         length_array=len(biochar_yield_array),
+                                                                         input_name="biochar price")
 
     costs_benefits_per_FU = np.multiply(biochar_yield_array, prices_array)  # currency/FU
 
@@ -58,13 +62,14 @@ def biochar_sale_cost_benefit():
         annual_operating_hours_array = functions.MonteCarloSimulation.to_fixed_MC_array(
             value=settings.user_inputs.general.annual_operating_hours)
     else:
-        annual_operating_hours_array = np.array(functions.TEA.get_annual_operating_hours_draws())
+        annual_operating_hours_array = np.array(functions.TEA.get_annual_operating_hours_draws(
+            input_name="annual operating hours biochar sale"))
 
     system_size_tonnes_per_year_array = system_size_tonnes_per_hour * annual_operating_hours_array
 
     annuity_cash_flow_array = costs_benefits_per_FU * system_size_tonnes_per_year_array
 
-    output_cost_benefit = objects.AnnualValue(values=list(annuity_cash_flow_array),
+    output_cost_benefit = objects.AnnualValue(values=annuity_cash_flow_array,
                                               name="Biochar Sale",
                                               short_label="BC",
                                               tag="Sale of products")
@@ -26,7 +26,7 @@ def carbon_capture_amine_consumption_cost_benefit(CO2_capture_rate):
     """
     # Check that right type of carbon capture process is defined in user inputs
     if settings.user_inputs.processes.carbon_capture.method != "Amine post comb":
-        output_cost_benefit = AnnualValue(values=list(np.zeros(settings.user_inputs.general.MC_iterations)),
+        output_cost_benefit = AnnualValue(values=np.zeros(settings.user_inputs.general.MC_iterations),
                                           name="Amine requirements for carbon capture",
                                           short_label="CC MEA")
         warnings.warn("Carbon capture process is not amine-based - hence not MEA should be consumed.")
@@ -40,13 +40,14 @@ def carbon_capture_amine_consumption_cost_benefit(CO2_capture_rate):
             annual_operating_hours_array = functions.MonteCarloSimulation.to_fixed_MC_array(
                 value=settings.user_inputs.general.annual_operating_hours)
         else:
-            annual_operating_hours_array = np.array(functions.TEA.get_annual_operating_hours_draws())
+            annual_operating_hours_array = np.array(functions.TEA.get_annual_operating_hours_draws(
+                input_name="annual operating hours amine consumption"))
 
         system_size_tonnes_per_year_array = system_size_tonnes_per_hour * annual_operating_hours_array
 
         # Get flue gas available for capture
         # Convert from [kg CO2/FU] to [tonnes CO2/FU] i.e. [tonne CO2/tonne feedstock]
-        flue_gas_CO2_array = list(np.divide(CO2_capture_rate, 1000))
+        flue_gas_CO2_array = np.divide(CO2_capture_rate, 1000)
 
         # Define MEA degradation rate and MEA price
         amine_degradation_rate = triangular_dist_maker(lower=0.3, mode=0.7, upper=2.2)  # [kg MEA/tonne CO2]
@@ -68,11 +69,13 @@ def carbon_capture_amine_consumption_cost_benefit(CO2_capture_rate):
 
         amine_degradation_rate_array = functions.MonteCarloSimulation.get_distribution_draws(
             distribution_maker=amine_degradation_rate,
-            length_array=len(flue_gas_CO2_array))  # [kg MEA/tonne CO2]
+            length_array=len(flue_gas_CO2_array),
+            input_name="amine degradation rate")  # [kg MEA/tonne CO2]
 
         amine_price_array = functions.MonteCarloSimulation.get_distribution_draws(
             distribution_maker=amine_price,
-            length_array=len(flue_gas_CO2_array))  # [currency/kg MEA]
+            length_array=len(flue_gas_CO2_array),
+            input_name="amine price")  # [currency/kg MEA]
 
         # Calculate costs/benefits
         amine_consumption_per_FU = np.multiply(amine_degradation_rate_array, flue_gas_CO2_array)  # [kg MEA/FU]
@@ -83,7 +86,7 @@ def carbon_capture_amine_consumption_cost_benefit(CO2_capture_rate):
                                                      system_size_tonnes_per_year_array)  # [currency/year]
 
         # Get final annual value objects
-        output_cost_benefit = AnnualValue(values=list(annuity_cash_flow_array_amine_consumption),
+        output_cost_benefit = AnnualValue(values=annuity_cash_flow_array_amine_consumption,
                                           name="Amine requirements for carbon capture",
                                           short_label="CC MEA",
                                           tag="Other operational expenses")
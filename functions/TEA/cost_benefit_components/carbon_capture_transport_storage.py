@@ -29,13 +29,14 @@ def carbon_capture_transport_storage_cost_benefit(CO2_capture_rate):
     if settings.user_inputs.general.annual_operating_hours_user_imputed:
         annual_operating_hours_array = functions.MonteCarloSimulation.to_fixed_MC_array(value=settings.user_inputs.general.annual_operating_hours)
     else:
-        annual_operating_hours_array = np.array(functions.TEA.get_annual_operating_hours_draws())
+        annual_operating_hours_array = np.array(functions.TEA.get_annual_operating_hours_draws(
+            input_name="annual operating hours CO2 transport and storage"))
 
     system_size_tonnes_per_year_array = system_size_tonnes_per_hour * annual_operating_hours_array
 
     # Get flue gas available for capture
     # Convert from [kg CO2/FU] to [tonnes CO2/FU] i.e. [tonne CO2/tonne feedstock]
-    flue_gas_CO2_array = list(np.divide(CO2_capture_rate, 1000))
+    flue_gas_CO2_array = np.divide(CO2_capture_rate, 1000)
 
     # Get CO2 transport prices [currency/tonne CO2]
     if settings.user_inputs.economic.CO2_transport_price_choice == "default":
@@ -54,7 +55,8 @@ def carbon_capture_transport_storage_cost_benefit(CO2_capture_rate):
         # Get distribution draws
         price_array_transport = functions.MonteCarloSimulation.get_distribution_draws(
             distribution_maker=price_transport,
-            length_array=len(flue_gas_CO2_array))  # [currency/tonne CO2]
+            length_array=len(flue_gas_CO2_array),
+            input_name="CO2 transport price")  # [currency/tonne CO2]
 
     elif settings.user_inputs.economic.CO2_transport_price_choice == "user selected":
         price_array_transport = functions.MonteCarloSimulation.dist_maker_from_settings(
@@ -80,7 +82,8 @@ def carbon_capture_transport_storage_cost_benefit(CO2_capture_rate):
         # Get distribution draws
         price_array_storage = functions.MonteCarloSimulation.get_distribution_draws(
             distribution_maker=price_storage,
-            length_array=len(flue_gas_CO2_array))  # [currency/tonne CO2]
+            length_array=len(flue_gas_CO2_array),
+            input_name="CO2 storage price")  # [currency/tonne CO2]
 
     elif settings.user_inputs.economic.CO2_storage_price_choice == "user selected":
         price_array_storage = functions.MonteCarloSimulation.dist_maker_from_settings(
@@ -98,11 +101,11 @@ def carbon_capture_transport_storage_cost_benefit(CO2_capture_rate):
     annuity_cash_flow_array_storage = costs_benefits_per_FU_storage * system_size_tonnes_per_year_array
 
     # Get final annual value objects
-    output_cost_benefit_transport = AnnualValue(values=list(annuity_cash_flow_array_transport),
+    output_cost_benefit_transport = AnnualValue(values=annuity_cash_flow_array_transport,
                                                 name="CO2 transport cost",
                                                 short_label="CO2-T",
                                                 tag="Other operational expenses")
-    output_cost_benefit_storage = AnnualValue(values=list(annuity_cash_flow_array_storage),
+    output_cost_benefit_storage = AnnualValue(values=annuity_cash_flow_array_storage,
                                               name="CO2 storage cost",
                                               short_label="CO2-S",
                                               tag="Other operational expenses")
@@ -34,7 +34,8 @@ def carbon_price_cost_benefit(total_GWP_per_FU):
         annual_operating_hours_array = functions.MonteCarloSimulation.to_fixed_MC_array(
             value=settings.user_inputs.general.annual_operating_hours)
     else:
-        annual_operating_hours_array = np.array(functions.TEA.get_annual_operating_hours_draws())
+        annual_operating_hours_array = np.array(functions.TEA.get_annual_operating_hours_draws(
+            input_name="annual operating hours carbon price"))
 
     system_size_tonnes_per_year_array = system_size_tonnes_per_hour * annual_operating_hours_array
 
@@ -59,7 +60,8 @@ def carbon_price_cost_benefit(total_GWP_per_FU):
 
         # Prices currency/tonne CO2eq.
         prices_array = functions.MonteCarloSimulation.get_distribution_draws(distribution_maker=price_distribution,
-                                                                             length_array=len(GWP_tonnes_per_FU))
+                                                                             length_array=len(GWP_tonnes_per_FU),
+                                                                             input_name="carbon price")
 
         costs_benefits_per_FU = np.multiply(GWP_tonnes_per_FU, prices_array)  # currency/FU
         costs_benefits_per_FU *= -1  # turn prices negative - i.e. neg. carbon emissions would lead to pos. cash flow
@@ -69,7 +71,7 @@ def carbon_price_cost_benefit(total_GWP_per_FU):
     # Convert per FU units to life cycle costs/benefits
     annuity_cash_flow_array = costs_benefits_per_FU * system_size_tonnes_per_year_array
 
-    output_cost_benefit = AnnualValue(values=list(annuity_cash_flow_array),
+    output_cost_benefit = AnnualValue(values=annuity_cash_flow_array,
                                       name="Carbon tax",
                                       short_label="CT",
                                       tag="Other")
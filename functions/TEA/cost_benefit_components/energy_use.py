@@ -4,7 +4,7 @@ import numpy as np
 from config import settings
 
 
-def heat_cost_benefit(heat_array):
+def heat_cost_benefit(heat_array, input_name="heat price"):
     """
     Applies electricity price to an array of electricity requirements (i.e. generation or consumption).
 
@@ -12,6 +12,9 @@ def heat_cost_benefit(heat_array):
     ----------
     heat_array: ArrayLike
         List or array of heat requirements in [kWh] or [kWh/FU].
+    input_name: str
+        Name of the uncertain input the price draws are used for - identifies its random number stream when common
+        random numbers are used.
 
     Returns
     -------
@@ -26,13 +29,14 @@ def heat_cost_benefit(heat_array):
             location=settings.data.economic.natural_gas_price[settings.user_inputs.general.country])
 
         prices = functions.MonteCarloSimulation.get_distribution_draws(distribution_maker=price_distribution,
-                                                                       length_array=len(heat_array))
+                                                                       length_array=len(heat_array),
+                                                                       input_name=input_name)
         # Convert prices from thm to kWh if necessary
         if settings.data.economic.natural_gas_price[settings.user_inputs.general.country].units.split("/")[1]:
-            prices = functions.general.utility.therm_to_kWh(np.array(prices), reverse=True)
+            prices = functions.general.utility.therm_to_kWh(prices, reverse=True)
 
         costs_benefits = np.multiply(heat_array, prices)
-        costs_benefits = list(costs_benefits / 0.9)  # scale due to inefficiencies in conversion to heat
+        costs_benefits = costs_benefits / 0.9  # scale due to inefficiencies in conversion to heat
 
         # Check if currencies match up
         if settings.user_inputs.general.currency != \
@@ -44,9 +48,10 @@ def heat_cost_benefit(heat_array):
             location=settings.user_inputs.economic.heat_price_parameters)
 
         prices = functions.MonteCarloSimulation.get_distribution_draws(distribution_maker=price_distribution,
-                                                                       length_array=len(heat_array))
+                                                                       length_array=len(heat_array),
+                                                                       input_name=input_name)
 
-        costs_benefits = list(np.multiply(heat_array, prices))
+        costs_benefits = np.multiply(heat_array, prices)
 
     else:
         raise ValueError("Heat price option not supported.")
@@ -54,7 +59,7 @@ def heat_cost_benefit(heat_array):
     return costs_benefits
 
 
-def electricity_cost_benefit(electricity_array):
+def electricity_cost_benefit(electricity_array, input_name="electricity price"):
     """
     Applies electricity price to an array of electricity requirements (i.e. generation or consumption).
 
@@ -62,6 +67,9 @@ def electricity_cost_benefit(electricity_array):
     ----------
     electricity_array: ArrayLike
         List or array of electricity requirements in [kWh].
+    input_name: str
+        Name of the uncertain input the price draws are used for - identifies its random number stream when common
+        random numbers are used.
 
     Returns
     -------
@@ -88,8 +96,9 @@ def electricity_cost_benefit(electricity_array):
         raise ValueError("Electricity price option not supported.")
 
     prices = functions.MonteCarloSimulation.get_distribution_draws(distribution_maker=price_distribution,
-                                                                   length_array=len(electricity_array))
+                                                                   length_array=len(electricity_array),
+                                                                   input_name=input_name)
 
-    costs_benefits = list(np.multiply(electricity_array, prices))
+    costs_benefits = np.multiply(electricity_array, prices)
 
     return costs_benefits
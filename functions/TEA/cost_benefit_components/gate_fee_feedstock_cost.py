@@ -29,7 +29,8 @@ def gate_fee_or_feedstock_cost_benefit():
         annual_operating_hours_array = functions.MonteCarloSimulation.to_fixed_MC_array(
             value=settings.user_inputs.general.annual_operating_hours)
     else:
-        annual_operating_hours_array = np.array(functions.TEA.get_annual_operating_hours_draws())
+        annual_operating_hours_array = np.array(functions.TEA.get_annual_operating_hours_draws(
+            input_name="annual operating hours gate fee or feedstock cost"))
 
     system_size_tonnes_per_year_array = system_size_tonnes_per_hour * annual_operating_hours_array
 
@@ -47,7 +48,8 @@ def gate_fee_or_feedstock_cost_benefit():
 
     # Prices [currency/tonne feedstock]
     prices_array = functions.MonteCarloSimulation.get_distribution_draws(distribution_maker=price_distribution,
-                                                                         length_array=len(annual_operating_hours_array))
+                                                                         length_array=len(annual_operating_hours_array),
+                                                                         input_name="gate fee or feedstock price")
 
     # Gate fee case (i.e. +ve cash flows)
     annuity_cash_flow_array = np.multiply(system_size_tonnes_per_year_array, prices_array)  # currency/year
@@ -62,7 +64,7 @@ def gate_fee_or_feedstock_cost_benefit():
         short_label = "Feed"
         tag = "Other operational expenses"
 
-    output_cost_benefit = objects.AnnualValue(values=list(annuity_cash_flow_array),
+    output_cost_benefit = objects.AnnualValue(values=annuity_cash_flow_array,
                                               name=name,
                                               short_label=short_label,
                                               tag=tag)
@@ -28,7 +28,8 @@ def oxygen_consumption_cost_benefit(unit_oxygen_requirement):
     oxygen_requirement = unit_oxygen_requirement * system_size_tonnes_per_hour  # [tonne O2/hour]
 
     # Get annual oxygen requirement
-    annual_operating_hours_array = functions.TEA.get_annual_operating_hours_draws()  # [hours/year]
+    annual_operating_hours_array = functions.TEA.get_annual_operating_hours_draws(
+        input_name="annual operating hours oxygen consumption")  # [hours/year]
     annual_oxygen_requirements_array = np.multiply(oxygen_requirement, annual_operating_hours_array)  # [tonne O2/year]
 
     # Set oxygen price
@@ -50,14 +51,15 @@ def oxygen_consumption_cost_benefit(unit_oxygen_requirement):
 
     # Get price draws
     oxygen_price_array = functions.MonteCarloSimulation.get_distribution_draws(distribution_maker=oxygen_price,
-                                                                               length_array=settings.user_inputs.general.MC_iterations)  # [currency/tonne O2]
+                                                                               length_array=settings.user_inputs.general.MC_iterations,
+                                                                               input_name="oxygen price")  # [currency/tonne O2]
 
     # Convert per FU units to life cycle costs/benefits
     annuity_cash_flow_array_oxygen_consumption = np.multiply(annual_oxygen_requirements_array, oxygen_price_array)  # [currency/year]
     annuity_cash_flow_array_oxygen_consumption = np.multiply(annuity_cash_flow_array_oxygen_consumption, -1)  # Convert values to -ve as they are a cost
 
     # Get final annual value objects
-    output_cost_benefit = AnnualValue(values=list(annuity_cash_flow_array_oxygen_consumption),
+    output_cost_benefit = AnnualValue(values=annuity_cash_flow_array_oxygen_consumption,
                                       name="Oxygen as gasifying agent",
                                       short_label="O2 Ag",
                                       tag="Other operational expenses")
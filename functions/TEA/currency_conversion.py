@@ -1,14 +1,23 @@
 import functools
+import itertools
 import cachetools.func
 import warnings
 import datetime
 
+import functions.general.utility
 import numpy as np
+import pandas as pd
+import toml
 import yfinance as yf
 
 from config import settings
 from forex_python.converter import CurrencyRates, RatesNotAvailableError
 
+# Offline exchange rate table (data directory) - annual average rates keyed by year, base and target currency - and
+# its metadata (version and source)
+_exchange_rate_file = "exchange_rates.csv"
+_exchange_rate_metadata_file = "exchange_rates.toml"
+
 
 def convert_currency_simple(base_currency, output_currency, amounts, date_obj=2022):
     """
@@ -139,7 +148,9 @@ def get_average_annual_exchange_rate(year, base_currency, converted_currency, ap
         Calculates the approximate average exchange rate for a given year instead (only takes 1 values every 2 weeks).
         This significantly speeds up the calculations but may be less accurate.
     method: str
-        Determines which method (or api) should be used to fetch exchange rates from.
+        Determines which method (or api) should be used to fetch exchange rates from - "offline" (default) looks the
+        rate up in the exchange rate table shipped in the data directory without any network access, "yfinance" and
+        "forex_python" fetch it online.
 
     Returns
     -------
@@ -148,7 +159,10 @@ def get_average_annual_exchange_rate(year, base_currency, converted_currency, ap
     """
     # Get defaults
     if method is None:
-        method = "yfinance"
+        method = "offline"
+
+    if method == "offline":
+        return _get_offline_exchange_rate(year, base_currency, converted_currency)
 
     start_date, end_date = get_year_start_end_date(year)
 
@@ -201,7 +215,8 @@ def get_average_annual_exchange_rate(year, base_currency, converted_currency, ap
             else:
                 yahoo_finance_code = base_currency + converted_currency + "=X"
 
-            historic_rates_array = list(yf.download(yahoo_finance_code, start=start_date, end=end_date).Close)
+            closing_rates = np.ravel(yf.download(yahoo_finance_code, start=start_date, end=end_date).Close)
+            historic_rates_array = list(closing_rates[~np.isnan(closing_rates)])
         if len(historic_rates_array) == 0:
             raise RatesNotAvailableError("Rates are not available for the given year.")
         return historic_rates_array
@@ -247,7 +262,8 @@ def convert_currency_annual_average(value, year, base_currency, converted_curren
         Calculates the approximate average exchange rate for a given year instead (only takes 1 values every 2 weeks).
         This significantly speeds up the calculations but may be less accurate.
     method: str
-        Determines which method (or api) should be used to fetch exchange rates from.
+        Determines which method (or api) should be used to fetch exchange rates from. Defaults to the offline exchange
+        rate table (see get_average_annual_exchange_rate).
     Returns
     -------
     float
@@ -261,3 +277,146 @@ def convert_currency_annual_average(value, year, base_currency, converted_curren
         converted_value = value
 
     return converted_value
+
+
+def _load_exchange_rates(full_file_path):
+    """
+    Loads the exchange rate table as a series of rates indexed by (year, base currency, target currency). Rates of
+    each currency to itself are added for every year.
+    """
+    df = functions.general.utility.load_table(_exchange_rate_file)
+    currencies = sorted(set(df["Base Currency"]) | set(df["Target Currency"]))
+    years = sorted(set(df["Year"]))
+    df_same_currency = pd.DataFrame([{"Year": year, "Base Currency": currency, "Target Currency": currency,
+                                      "Exchange Rate": 1.0} for year, currency in itertools.product(years, currencies)])
+    df = pd.concat([df, df_same_currency], ignore_index=True)
+
+    return df.set_index(["Year", "Base Currency", "Target Currency"])["Exchange Rate"]
+
+
+def get_exchange_rates():
+    """
+    Gets the offline exchange rate table, which is loaded from the data directory once and kept in memory.
+
+    Returns
+    -------
+    pd.Series
+        Annual average exchange rates indexed by (year, base currency, target currency).
+    """
+    return functions.general.utility.load_data(functions.general.utility.get_data_path(_exchange_rate_file),
+                                               loader=_load_exchange_rates)
+
+
+def get_exchange_rates_version():
+    """
+    Gets the version of the offline exchange rate table (increased every time the table is refreshed) - e.g. to key
+    caches of results derived from converted values.
+
+    Returns
+    -------
+    int
+        Version of the exchange rate table.
+    """
+    metadata = functions.general.utility.load_data(
+        functions.general.utility.get_data_path(_exchange_rate_metadata_file), loader=toml.load)
+
+    return metadata["version"]
+
+
+def _get_offline_exchange_rate(year, base_currency, converted_currency):
+    key = (int(year), base_currency, converted_currency)
+    exchange_rates = get_exchange_rates()
+    if key not in exchange_rates.index:
+        raise ValueError(f"No exchange rate from {base_currency} to {converted_currency} available for {year} - "
+                         f"add it to the exchange rate table using refresh_exchange_rates.")
+
+    return float(exchange_rates[key])
+
+
+def convert_currency_annual_average_bulk(values, years, base_currencies, converted_currency):
+    """
+    Converts several values (e.g. a column of a dataframe) from their original currencies to a new currency, each
+    using the average exchange rate of its year. Rates are taken from the offline exchange rate table in a single
+    lookup, so no network access is required.
+
+    Parameters
+    ----------
+    values: float | list[float] | np.ndarray | pd.Series
+        Values to be converted from their base currencies to the desired currency.
+    years: int | list[int] | np.ndarray | pd.Series
+        The year of each value (or a single year for all values).
+    base_currencies: str | list[str] | np.ndarray | pd.Series
+        String indicating the base currency of each value (or a single currency for all values).
+    converted_currency: str
+        String indicating the currency which to convert to.
+
+    Returns
+    -------
+    np.ndarray
+        Converted values in desired currency.
+    """
+    values, years, base_currencies = np.broadcast_arrays(np.asarray(values, dtype=float), np.asarray(years),
+                                                         np.asarray(base_currencies))
+    exchange_rates = get_exchange_rates()
+    keys = pd.MultiIndex.from_arrays([years.ravel().astype(int), base_currencies.ravel(),
+                                      np.full(values.size, converted_currency)])
+    positions = exchange_rates.index.get_indexer(keys)
+
+    if np.any(positions == -1):
+        missing_keys = sorted(set(keys[positions == -1]))
+        raise ValueError(f"No exchange rates to {converted_currency} available for (year, base currency) "
+                         f"{[key[:2] for key in missing_keys]} - add them to the exchange rate table using "
+                         f"refresh_exchange_rates.")
+
+    return values * exchange_rates.to_numpy()[positions].reshape(values.shape)
+
+
+def refresh_exchange_rates(years=None, currencies=None, method=None):
+    """
+    Fetches the annual average exchange rates online and rewrites the offline exchange rate table (and the data bundle)
+    with them. The version of the table is increased.
+    This is the only function which requires network access - run it explicitly whenever rates should be updated or
+    added.
+
+    Parameters
+    ----------
+    years: list[int] | None
+        Years for which rates are fetched. Defaults to the years in the current table.
+    currencies: list[str] | None
+        Currencies between which rates are fetched. Defaults to the currencies in the current table.
+    method: str | None
+        Determines which api should be used to fetch exchange rates from ("yfinance" (default) or "forex_python").
+    """
+    # Get defaults
+    current_rates = functions.general.utility.load_table(_exchange_rate_file)
+    if years is None:
+        years = sorted(set(current_rates["Year"]))
+
+    if currencies is None:
+        currencies = sorted(set(current_rates["Base Currency"]) | set(current_rates["Target Currency"]))
+
+    if method is None:
+        method = "yfinance"
+
+    if method == "offline":
+        raise ValueError("Exchange rates can only be refreshed with an online method.")
+
+    # Fetch all rates before writing anything, so that the table is not left incomplete if a request fails
+    rows = []
+    for year in years:
+        for base_currency, converted_currency in itertools.permutations(sorted(currencies), 2):
+            rows.append({"Year": year, "Base Currency": base_currency, "Target Currency": converted_currency,
+                         "Exchange Rate": round(get_average_annual_exchange_rate(year, base_currency,
+                                                                                 converted_currency,
+                                                                                 method=method), 6)})
+
+    metadata_path = functions.general.utility.get_data_path(_exchange_rate_metadata_file)
+    metadata = {"version": get_exchange_rates_version() + 1,
+                "source": method,
+                "retrieved": datetime.date.today().isoformat()}
+
+    pd.DataFrame(rows).to_csv(functions.general.utility.get_data_path(_exchange_rate_file), index=False)
+    with open(metadata_path, "w") as f:
+        toml.dump(metadata, f)
+
+    functions.general.utility.build_data_bundle()
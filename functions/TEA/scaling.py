@@ -1,5 +1,8 @@
+import functools
 import warnings
 
+import numpy as np
+
 from config import settings
 
 
@@ -35,6 +38,64 @@ def power_scale(baseline_size, design_size, baseline_cost, scaling_factor=0.7):
     return scaled_cost
 
 
+def _get_CEPCI_values():
+    CEPCI_values = dict(settings.data.economic.CEPCI)
+    CEPCI_values.pop("sources", None)
+
+    return tuple(sorted((int(year), value) for year, value in CEPCI_values.items()))
+
+
+@functools.lru_cache(maxsize=8)
+def _build_CEPCI_table(CEPCI_values):
+    """
+    Builds the dense CEPCI table for the given (year, value) pairs - see get_CEPCI_table.
+    """
+    years = np.array([year for year, _ in CEPCI_values])
+    first_year = int(years.min())
+    n_years = int(years.max()) - first_year + 1
+
+    values = np.full(n_years, np.nan)
+    available = np.zeros(n_years, dtype=bool)
+    for year, value in CEPCI_values:
+        if value != "unavailable":
+            values[year - first_year] = value
+            available[year - first_year] = True
+
+    if not available.any():
+        raise ValueError("No CEPCI values available.")
+
+    # Resolve missing values up front - revert to most recent available CEPCI value
+    most_recent_year = first_year + int(np.flatnonzero(available)[-1])
+    values[~available] = values[most_recent_year - first_year]
+
+    defined = np.isin(np.arange(first_year, first_year + n_years), years)
+
+    for array in [values, available, defined]:
+        array.flags.writeable = False
+
+    return {"first_year": first_year,
+            "values": values,
+            "available": available,
+            "defined": defined,
+            "most_recent_year": most_recent_year}
+
+
+def get_CEPCI_table():
+    """
+    Gets the CEPCI values as a dense table indexed by year (i.e. the value of a year is found at position
+    year - first_year). Years without an available value are set to the most recent available value. The table is only
+    built once for the CEPCI values in the settings.
+
+    Returns
+    -------
+    dict
+        Table with keys "first_year" (int), "values" (np.ndarray of CEPCI values), "available" (np.ndarray of bools
+        indicating whether a value was available or reverted to the most recent value), "defined" (np.ndarray of bools
+        indicating whether the year is listed in the settings), and "most_recent_year" (int).
+    """
+    return _build_CEPCI_table(_get_CEPCI_values())
+
+
 def get_most_recent_available_CEPCI_year():
     """
     Helper function to be used with CEPCI_scale.
@@ -42,59 +103,61 @@ def get_most_recent_available_CEPCI_year():
 
     Returns
     -------
-
+    int
+        Most recent year with an available CEPCI value.
     """
-    CEPCI_values = dict(settings.data.economic.CEPCI)
-    CEPCI_values.pop("sources")
+    return get_CEPCI_table()["most_recent_year"]
+
 
-    count = 0
-    while True:
-        dict_key = str(int(max(CEPCI_values)) - count)
-        count += 1
-        dict_value = CEPCI_values[dict_key]
-        if dict_value != "unavailable":
-            break
+def _get_CEPCI_positions(CEPCI_table, years, year_description):
+    years = np.asarray(years)
+    positions = years.astype(int) - CEPCI_table["first_year"]
+    in_table = (positions >= 0) & (positions < len(CEPCI_table["values"]))
+    if not np.all(in_table) or not np.all(CEPCI_table["defined"][positions]):
+        raise ValueError(f"CEPCI value not defined for {year_description}.")
 
-    return int(dict_key)
+    return positions
 
 
 def CEPCI_scale(base_year, design_year, value):
     """
     Converts a value from a base year to a design year using the Chemical Engineering Plant Cost Index (CEPCI).
+    Base years and values can also be supplied as arrays (e.g. columns of a dataframe), which are scaled at once.
 
     Parameters
     ----------
-    base_year: int
+    base_year: int | list[int] | np.ndarray | pd.Series
         Base or reference year of the system.
     design_year: int
         Year the system is supposed to be updated to.
-    value: float | int
+    value: float | int | list[float] | np.ndarray | pd.Series
         Value of the reference or base year.
 
     Returns
     -------
-    float
-        CEPCI scaled value.
+    float | np.ndarray
+        CEPCI scaled value (array if base years or values are supplied as arrays).
     """
-
     # Get CEPCI values
-    CEPCI_data = settings.data.economic.CEPCI
-    design_CEPCI = CEPCI_data[str(design_year)]
-    base_CEPCI = CEPCI_data[str(base_year)]
+    CEPCI_table = get_CEPCI_table()
+    base_positions = _get_CEPCI_positions(CEPCI_table, base_year, year_description="base year")
+    design_position = _get_CEPCI_positions(CEPCI_table, design_year, year_description="design year")
 
     # Raise Error/Warning if CEPCI value unavailable.
-    if base_CEPCI == "unavailable":
-        if base_year < 2020:
+    base_unavailable = ~CEPCI_table["available"][base_positions]
+    if np.any(base_unavailable):
+        if np.any(np.asarray(base_year)[base_unavailable] < 2020):
             raise ValueError("CEPCI value not available for base year.")
         else:
-            base_CEPCI = CEPCI_data[str(get_most_recent_available_CEPCI_year())]
             warnings.warn("CEPCI value not available for base year. Reverted to most recent available CEPCI value.")
 
-    if design_CEPCI == "unavailable":
-        design_CEPCI = CEPCI_data[str(get_most_recent_available_CEPCI_year())]
+    if not CEPCI_table["available"][design_position]:
         warnings.warn("CEPCI value not available for design year. Reverted to most recent available CEPCI value.")
 
     # Convert value
-    scaled_value = value * (design_CEPCI / base_CEPCI)
+    scaled_value = np.multiply(value, CEPCI_table["values"][design_position] / CEPCI_table["values"][base_positions])
+
+    if np.ndim(scaled_value) == 0:
+        return float(scaled_value)
 
     return scaled_value
@@ -0,0 +1,32 @@
+import functions.MonteCarloSimulation  # imported first to avoid circular import of CAPEX estimators
+
+from config import settings
+from functions.TEA.CAPEX_estimation import get_CAPEX_curve_fit, clear_CAPEX_curve_cache
+
+def _fit_test_curve(currency, CEPCI_year, size_regime):
+    _fit_test_curve.calls += 1
+    return {"popt": [1.0, 2.0] if currency == "GBP" else [3.0, 4.0], "MAPE": 0.1}
+
+def test_CAPEX_curve_fit_is_stored_on_disk(tmp_path):
+    settings.user_inputs.general.CAPEX_curve_cache_path = str(tmp_path / "CAPEX_curves.json")
+    try:
+        _fit_test_curve.calls = 0
+        fit = get_CAPEX_curve_fit(_fit_test_curve, data_file_names=["CAPEX_boiler.csv"], currency="GBP",
+                                  CEPCI_year=2020, size_regime="small scale")
+        assert fit == {"popt": [1.0, 2.0], "MAPE": 0.1}
+        assert (tmp_path / "CAPEX_curves.json").exists()
+
+        # Same key is loaded from disk, a different key is fitted
+        assert get_CAPEX_curve_fit(_fit_test_curve, data_file_names=["CAPEX_boiler.csv"], currency="GBP",
+                                   CEPCI_year=2020, size_regime="small scale") == fit
+        assert _fit_test_curve.calls == 1
+        assert get_CAPEX_curve_fit(_fit_test_curve, data_file_names=["CAPEX_boiler.csv"], currency="USD",
+                                   CEPCI_year=2020, size_regime="small scale")["popt"] == [3.0, 4.0]
+        assert _fit_test_curve.calls == 2
+
+        clear_CAPEX_curve_cache()
+        get_CAPEX_curve_fit(_fit_test_curve, data_file_names=["CAPEX_boiler.csv"], currency="GBP",
+                            CEPCI_year=2020, size_regime="small scale")
+        assert _fit_test_curve.calls == 3
+    finally:
+        settings.user_inputs.general.CAPEX_curve_cache_path = None
@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from functions.TEA import CEPCI_scale, get_most_recent_available_CEPCI_year
+
+def test_CEPCI_scale_column_matches_single_values():
+    base_years = np.array([2003, 2010, 2019, 2023])
+    values = np.array([100.0, 200.0, 300.0, 400.0])
+    scaled_values = CEPCI_scale(base_year=base_years, design_year=2022, value=values)
+    assert isinstance(scaled_values, np.ndarray)
+    assert scaled_values == pytest.approx([CEPCI_scale(base_year=int(base_year), design_year=2022, value=float(value))
+                                           for base_year, value in zip(base_years, values)])
+    assert CEPCI_scale(base_year=2022, design_year=2022, value=100) == 100
+
+def test_CEPCI_scale_unavailable_design_year_case():
+    most_recent_year = get_most_recent_available_CEPCI_year()
+    with pytest.warns(UserWarning):
+        scaled_value = CEPCI_scale(base_year=2010, design_year=most_recent_year + 1, value=100)
+    assert scaled_value == pytest.approx(CEPCI_scale(base_year=2010, design_year=most_recent_year, value=100))
+
+def test_CEPCI_scale_undefined_year_case():
+    with pytest.raises(ValueError):
+        CEPCI_scale(base_year=[2010, 1900], design_year=2022, value=[1.0, 1.0])
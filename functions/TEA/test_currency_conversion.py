@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from functions.TEA import convert_currency_annual_average, convert_currency_annual_average_bulk
+
+def test_convert_currency_offline_case():
+    assert convert_currency_annual_average(value=100, year=2019, base_currency="USD",
+                                           converted_currency="GBP") == pytest.approx(78.4073)
+    assert convert_currency_annual_average(value=100, year=2019, base_currency="GBP",
+                                           converted_currency="GBP") == 100
+
+def test_convert_currency_bulk_matches_single_values():
+    df = pd.DataFrame({"CAPEX": [1000.0, 2000.0, 3000.0],
+                       "Currency": ["EUR", "USD", "GBP"],
+                       "Reference Year": [2003, 2019, 2022]})
+    converted = convert_currency_annual_average_bulk(values=df["CAPEX"], years=df["Reference Year"],
+                                                     base_currencies=df["Currency"], converted_currency="USD")
+    assert isinstance(converted, np.ndarray)
+    assert converted == pytest.approx([convert_currency_annual_average(value=row["CAPEX"], year=row["Reference Year"],
+                                                                       base_currency=row["Currency"],
+                                                                       converted_currency="USD")
+                                       for _, row in df.iterrows()])
+
+def test_convert_currency_bulk_missing_rate_case():
+    with pytest.raises(ValueError):
+        convert_currency_annual_average_bulk(values=[1.0], years=[1990], base_currencies="USD",
+                                             converted_currency="GBP")
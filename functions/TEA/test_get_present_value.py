@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from functions.TEA import get_present_value
@@ -13,3 +14,9 @@ def test_get_pv_fv_case():
 def test_get_pv_other_str_case():
     with pytest.raises(ValueError):
         get_present_value(value=3000, value_type="Wrong String")
+
+def test_get_pv_per_iteration_interest_rates():
+    values_PV = get_present_value(values=[1234, 1234], value_type="AV",
+                                  interest_rate=np.array([0.05, 0.1]), discount_period=20)
+    assert values_PV == pytest.approx([get_present_value(values=1234.0, value_type="AV",
+                                                         interest_rate=rate, discount_period=20) for rate in [0.05, 0.1]])
@@ -1,7 +1,7 @@
 import pickle
 
 from config import settings
-from functions.general.utility import get_project_root
+from functions.general.utility import get_data_path, load_data
 
 # Function that fetches models
 def get_models():
@@ -17,11 +17,10 @@ def get_models():
     # %% Load dataframe with models stored
 
     # Get file path to GBR data
-    project_root = get_project_root()
-    full_file_path = str(project_root) + r"\data\GBR_performance_summary"
+    full_file_path = get_data_path("GBR_performance_summary")
 
     # Load performance summary object
-    perf_summary = pickle.load(open(full_file_path, "rb"))
+    perf_summary = load_data(full_file_path)
 
     # %% Extract models for all outputs
 
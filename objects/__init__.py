@@ -1,5 +1,8 @@
-from .generic_objects import gaussian_dist_maker, triangular_dist_maker, fixed_dist_maker, range_dist_maker
+from .generic_objects import (gaussian_dist_maker, triangular_dist_maker, fixed_dist_maker, range_dist_maker,
+                              to_float_array)
 from .process_objects import GlobalWarmingPotential, CostBenefit, Process
 from .requirement_objects import (Electricity, Heat, FossilGWP, BiogenicGWP, PresentValue, FutureValue, AnnualValue,
                                   Oxygen, Steam, Requirements)
 from .result_objects import Results
+from .statistics_objects import OnlineStatistics, StreamedResults
+from .matrix_objects import ResultsMatrix
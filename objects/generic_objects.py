@@ -1,3 +1,8 @@
+import itertools
+import uuid
+
+import numpy as np
+
 from collections import namedtuple
 
 
@@ -6,3 +11,43 @@ fixed_dist_maker = namedtuple("fixed_dist_maker", "value")
 range_dist_maker = namedtuple("range_dist_maker", "low high")  # i.e. uniform distribution
 triangular_dist_maker = namedtuple("triangular_dist_maker", "lower mode upper")
 gaussian_dist_maker = namedtuple("gaussian_dist_maker", "mean std")
+
+# Version counter used for change tracking. Starts at a random offset, so that versions of objects loaded from another
+# session (e.g. pickled results) do not collide with versions assigned in this session.
+_version_counter = itertools.count(uuid.uuid4().int << 64)
+
+
+def get_new_version():
+    """
+    Gets a new version number for change tracking. Every change of a tracked object (e.g. requirements or process
+    results) is assigned a new version, so that a version identifies both the object and its state. Versions are stored
+    on the objects and therefore remain valid when objects are pickled and loaded again.
+
+    Returns
+    -------
+    int
+        Unique version number.
+    """
+    return next(_version_counter)
+
+
+def to_float_array(values):
+    """
+    Converts Monte Carlo values (e.g. a list of floats) into a contiguous one-dimensional float64 array. Arrays which
+    are already in this format are passed through without a copy.
+
+    Parameters
+    ----------
+    values: ArrayLike | float
+        Monte Carlo values.
+
+    Returns
+    -------
+    np.ndarray
+        Contiguous one-dimensional float64 array of the values.
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if values.ndim != 1:
+        values = values.reshape(-1)
+
+    return values
@@ -0,0 +1,232 @@
+import numpy as np
+
+from dataclasses import dataclass
+
+from objects.generic_objects import to_float_array
+
+# Attributes of the result objects of a process holding the components of each metric
+_process_metric_attributes = {"GWP": ("GWP_results", "values"),
+                              "PV": ("CBA_results", "values_PV"),
+                              "AV": ("CBA_results", "values_AV")}
+
+
+@dataclass
+class ResultsMatrix:
+    """
+    Columnar store of the Monte Carlo distributions of all components (e.g. GWP or CostBenefit objects) of a metric.
+    All distributions are held in a single contiguous (components x iterations) matrix together with an index
+    describing each component, so that totals and sums by process or tag are single reductions.
+
+    Attributes
+    ----------
+    metric: str
+        Metric stored in the matrix - e.g. "GWP", "PV", "AV", "electricity", or "heat".
+    values: np.ndarray
+        Monte Carlo distribution of each component - shaped (n_components, n_iterations).
+    processes: np.ndarray
+        Name of the process each component belongs to.
+    process_short_labels: np.ndarray
+        Short label of the process each component belongs to.
+    names: np.ndarray
+        Name of each component.
+    short_labels: np.ndarray
+        Short label of each component.
+    tags: np.ndarray
+        Tag of each component (None if not applicable).
+    cost: np.ndarray
+        Determines whether each component is a cost.
+    benefit: np.ndarray
+        Determines whether each component is a benefit.
+
+    Methods
+    -------
+    from_components(metric, components, n_iterations)
+        Builds the matrix from a list of components and their distributions.
+    from_processes(processes, metric)
+        Builds the matrix of a metric ("GWP", "PV", or "AV") from the result objects of a number of processes.
+    total()
+        Sums the distributions of all components.
+    component_means()
+        Mean of each component.
+    select(**criteria)
+        Selects the components matching all given index values.
+    group_sum(by)
+        Sums the distributions of the components within each group of an index column.
+    """
+    metric: str
+    values: np.ndarray
+    processes: np.ndarray
+    process_short_labels: np.ndarray
+    names: np.ndarray
+    short_labels: np.ndarray
+    tags: np.ndarray
+    cost: np.ndarray
+    benefit: np.ndarray
+
+    @classmethod
+    def from_components(cls, metric, components, n_iterations):
+        """
+        Builds the matrix from a list of components and their distributions.
+
+        Parameters
+        ----------
+        metric: str
+            Metric stored in the matrix.
+        components: list[dict]
+            Index entries ("process", "process_short_label", "name", "short_label", "tag", "cost", "benefit") and
+            Monte Carlo distribution ("values") of each component.
+        n_iterations: int
+            Number of Monte Carlo iterations.
+
+        Returns
+        -------
+        ResultsMatrix
+            Matrix of the given components.
+        """
+        values = np.empty((len(components), n_iterations))
+        for row, component in enumerate(components):
+            values[row] = to_float_array(component["values"])
+
+        def _index_column(key, dtype=object):
+            return np.array([component.get(key) for component in components], dtype=dtype)
+
+        return cls(metric=metric,
+                   values=values,
+                   processes=_index_column("process"),
+                   process_short_labels=_index_column("process_short_label"),
+                   names=_index_column("name"),
+                   short_labels=_index_column("short_label"),
+                   tags=_index_column("tag"),
+                   cost=_index_column("cost", dtype=bool),
+                   benefit=_index_column("benefit", dtype=bool))
+
+    @classmethod
+    def from_processes(cls, processes, metric):
+        """
+        Builds the matrix of a metric from the GWP or CostBenefit objects of a number of processes. The distribution
+        of each object (and of the requirement it shares its buffer with) is replaced by a view of its row of the
+        matrix, so that the values are only held once.
+
+        Parameters
+        ----------
+        processes: tuple[Process]
+            Processes whose results are to be stored.
+        metric: str
+            "GWP", "PV", or "AV".
+
+        Returns
+        -------
+        ResultsMatrix
+            Matrix of all components of the given metric.
+        """
+        if metric not in _process_metric_attributes:
+            raise ValueError(f"Metric '{metric}' not supported. Use one of {tuple(_process_metric_attributes)}.")
+        results_attribute, values_attribute = _process_metric_attributes[metric]
+
+        components = []
+        results = []
+        for process in processes:
+            for result in getattr(process, results_attribute):
+                results.append(result)
+                components.append({"process": process.name,
+                                   "process_short_label": process.short_label,
+                                   "name": result.name,
+                                   "short_label": result.short_label,
+                                   "tag": getattr(result, "tag", None),
+                                   "cost": bool(getattr(result, "cost", False)),
+                                   "benefit": bool(getattr(result, "benefit", False)),
+                                   "values": getattr(result, values_attribute)})
+
+        # Get number of iterations from the process totals (also defined for processes without any components)
+        n_iterations = len(to_float_array(getattr(processes[0], f"{metric}_distribution"))) if processes else 0
+
+        matrix = cls.from_components(metric, components, n_iterations)
+
+        # Share value buffers with the matrix
+        for row, result in enumerate(results):
+            shared_values = matrix.values[row]
+            requirement = getattr(result, "requirement", None)
+            if requirement is not None and requirement.values is getattr(result, values_attribute):
+                object.__setattr__(requirement, "values", shared_values)  # same values - keeps requirement's version
+            setattr(result, values_attribute, shared_values)
+
+        return matrix
+
+    @property
+    def n_iterations(self):
+        return self.values.shape[1]
+
+    def total(self):
+        """
+        Sums the distributions of all components.
+
+        Returns
+        -------
+        np.ndarray
+            Total Monte Carlo distribution.
+        """
+        return self.values.sum(axis=0)
+
+    def component_means(self):
+        """
+        Mean of each component.
+
+        Returns
+        -------
+        np.ndarray
+            Mean of each component's distribution.
+        """
+        return self.values.mean(axis=1)
+
+    def select(self, **criteria):
+        """
+        Selects the components matching all given index values (e.g. select(processes="Gasification", cost=True)).
+
+        Parameters
+        ----------
+        criteria:
+            Index column names - "processes", "process_short_labels", "names", "short_labels", "tags", "cost",
+            "benefit" - and the values to match.
+
+        Returns
+        -------
+        ResultsMatrix
+            Matrix of the selected components.
+        """
+        mask = np.ones(len(self.values), dtype=bool)
+        for column, value in criteria.items():
+            mask &= getattr(self, column) == value
+
+        return ResultsMatrix(metric=self.metric,
+                             values=self.values[mask],
+                             processes=self.processes[mask],
+                             process_short_labels=self.process_short_labels[mask],
+                             names=self.names[mask],
+                             short_labels=self.short_labels[mask],
+                             tags=self.tags[mask],
+                             cost=self.cost[mask],
+                             benefit=self.benefit[mask])
+
+    def group_sum(self, by="processes"):
+        """
+        Sums the distributions of the components within each group of an index column, using a single matrix
+        product.
+
+        Parameters
+        ----------
+        by: str
+            Index column to group by - e.g. "processes" or "tags".
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Group labels in order of first appearance and the summed distribution of each group - shaped
+            (n_groups, n_iterations).
+        """
+        column = getattr(self, by)
+        labels = list(dict.fromkeys(column))
+        group_index = np.array([labels.index(label) for label in column], dtype=int)
+        membership = np.zeros((len(labels), len(column)))
+        membership[group_index, np.arange(len(column))] = 1
+
+        return np.array(labels, dtype=object), membership @ self.values
@@ -1,3 +1,5 @@
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -5,77 +7,93 @@ import functions
 
 from config import settings
 from dynaconf.utils.boxing import DynaBox
-from dataclasses import dataclass, InitVar
+from dataclasses import dataclass, field
 from typing import Type, TypeVar, Literal
 
 from objects.requirement_objects import _Requirement, Requirements
 from objects.requirement_objects import Heat, Electricity, Steam, Oxygen, FossilGWP, BiogenicGWP
 from objects.requirement_objects import PresentValue, AnnualValue, FutureValue
+from objects.generic_objects import to_float_array, get_new_version
 from functions.LCA import electricity_GWP, thermal_energy_GWP
 from functions.TEA import get_present_value, get_annual_value, get_annual_operating_hours_draws
 from processes.general import oxygen_rng_elect_req, steam_rng_heat_req
 
 
 # Prerequisite and utility functions and objects
-@dataclass
+@dataclass(slots=True)
 class GlobalWarmingPotential:
     """
     Global Warming Potential (GWP) of a process.
 
     Attributes
     ----------
-    requirement : InitVar[Type[_Requirement]]
-        A "_Requirement" child object which is to be converted to its equivalent GWP.
+    requirement : Type[_Requirement]
+        A "_Requirement" child object which is to be converted to its equivalent GWP. Stored, so that values of direct
+        emissions share its buffer.
+    values: np.ndarray
+        GWP distribution - shares its buffer with the requirement's values where no conversion is needed.
+    mean: float
+        Mean value of all GWP values.
     """
     # TODO: Update type hint, so it properly shows children of _Requirement class.
 
     # Update defaults
-    requirement: InitVar[Type[_Requirement]]
+    requirement: Type[_Requirement] = field(repr=False, compare=False)
+
+    # Taken from requirement object or calculated
+    name: str = field(default=None, init=False)
+    short_label: str = field(default=None, init=False)
+    description: str = field(default=None, init=False)
+    source: str = field(default=None, init=False)
+    units: str = field(default=None, init=False)
+    requirement_type: str = field(default=None, init=False)
+    values: np.ndarray = field(default=None, init=False)
+    mean: float = field(default=None, init=False)
 
-    def __post_init__(self, requirement):
+    def __post_init__(self):
         # Take values from requirement object
-        self.values = []
+        requirement = self.requirement
         self.name = requirement.name
         self.short_label = requirement.short_label
         self.description = requirement.description
         self.source = requirement.source
         self.units = "kg CO2eq." + "/" + settings.general.FU_label  # Update units
-        self.requirement_type = str(type(requirement))  # to remember where the GWP is coming from
+        self.requirement_type = sys.intern(str(type(requirement)))  # to remember where the GWP is coming from
 
-        # Calculate GWP and store as object attribute
+        # Calculate GWP of the whole distribution at once and store as object attribute
         if isinstance(requirement, Electricity):
-            for value in requirement.values:
-                self.values.append(electricity_GWP(amount=value, source=requirement.source, units=requirement.units))
+            self.values = electricity_GWP(amount=requirement.values, source=requirement.source,
+                                          units=requirement.units)
             if requirement.generated:  # i.e. leading to displacement of energy
-                if all(val >= 0 for val in requirement.values):  # Check that values are not already negative.
-                    self.values = list(np.array(self.values) * -1)
+                if np.all(requirement.values >= 0):  # Check that values are not already negative.
+                    self.values = -self.values
 
         elif isinstance(requirement, Heat):
-            for value in requirement.values:
-                self.values.append(thermal_energy_GWP(amount=value, source=requirement.source, units=requirement.units))
+            self.values = thermal_energy_GWP(amount=requirement.values, source=requirement.source,
+                                             units=requirement.units)
             if requirement.generated:  # i.e. leading to displacement of energy
-                if all(val >= 0 for val in requirement.values):  # Check that values are not already negative.
-                    self.values = list(np.array(self.values) * -1)
+                if np.all(requirement.values >= 0):  # Check that values are not already negative.
+                    self.values = -self.values
 
         elif isinstance(requirement, FossilGWP):
             self.values = requirement.values
 
         elif isinstance(requirement, BiogenicGWP):
-            self.values = list(np.array(requirement.values) * requirement.biogenic_fraction)
+            self.values = requirement.values * requirement.biogenic_fraction
 
         elif isinstance(requirement, Oxygen):
-            for value in requirement.values:
-                self.values.append(electricity_GWP(amount=oxygen_rng_elect_req(mass_oxygen=value)))
-                # i.e. effectively electricity requirement
+            self.values = electricity_GWP(amount=oxygen_rng_elect_req(mass_oxygen=requirement.values))
+            # i.e. effectively electricity requirement
 
         elif isinstance(requirement, Steam):
-            for value in requirement.values:
-                self.values.append(thermal_energy_GWP(amount=steam_rng_heat_req(mass_steam=value)))
-                # i.e. effectively heat requirement
+            self.values = thermal_energy_GWP(amount=steam_rng_heat_req(mass_steam=requirement.values))
+            # i.e. effectively heat requirement
 
         else:
             raise ValueError("Wrong requirement object supplied. Ensure supported type is used.")
 
+        # Store values as flat float64 array
+        self.values = to_float_array(self.values)
         self.mean = np.mean(self.values)
 
 
@@ -83,7 +101,7 @@ _tag_options = Literal[None, "CAPEX", "O&M", "Other operational expenses", "Sale
                        "Transport", "Other", "Not classified"]
 
 
-@dataclass
+@dataclass(slots=True)
 class CostBenefit:
     """
     Cost or benefit item of a process.
@@ -91,11 +109,12 @@ class CostBenefit:
 
     Attributes
     ----------
-    requirement : InitVar[Type[_Requirement]]
-        A "_Requirement" child object which is to be converted to its cost or benefit.
-    values_PV: list[float]
+    requirement : Type[_Requirement]
+        A "_Requirement" child object which is to be converted to its cost or benefit. Stored, so that values of cash
+        flows share its buffer.
+    values_PV: np.ndarray
         Present value equivalent of the cost or benefit.
-    values_AV: list[float]
+    values_AV: np.ndarray
         Present value equivalent of the cost or benefit.
     values_PV_mean: float
         Mean value of all PV values.
@@ -116,9 +135,9 @@ class CostBenefit:
         Updates the CostBenefit object's tag.
     """
     # Update defaults
-    requirement: InitVar[Type[_Requirement]]
-    values_PV: float | list[float] = None
-    values_AV: float | list[float] = None
+    requirement: Type[_Requirement] = field(repr=False, compare=False)
+    values_PV: np.ndarray = None
+    values_AV: np.ndarray = None
     values_PV_mean: float = None
     values_AV_mean: float = None
     currency: str = None
@@ -126,9 +145,14 @@ class CostBenefit:
     benefit: bool = None
     tag: _tag_options = None
 
-    def __post_init__(self, requirement):
-        # Store requirement object and other information.
-        self.requirement = requirement
+    # Taken from requirement object
+    name: str = field(default=None, init=False)
+    short_label: str = field(default=None, init=False)
+    description: str = field(default=None, init=False)
+
+    def __post_init__(self):
+        # Store other information from requirement object.
+        requirement = self.requirement
         self.name = requirement.name
         self.short_label = requirement.short_label
         self.description = requirement.description
@@ -179,7 +203,8 @@ class CostBenefit:
                 annual_operating_hours_array = functions.MonteCarloSimulation.to_fixed_MC_array(
                     value=settings.user_inputs.general.annual_operating_hours)
             else:
-                annual_operating_hours_array = np.array(get_annual_operating_hours_draws())
+                annual_operating_hours_array = np.array(get_annual_operating_hours_draws(
+                    input_name=f"annual operating hours {requirement.name}"))
 
             system_size_tonnes_per_year_array = system_size_tonnes_per_hour * annual_operating_hours_array
 
@@ -191,29 +216,35 @@ class CostBenefit:
                 # Calculate AV and PV resulting from requirement.
                 if isinstance(requirement, Electricity):
                     self.values_AV = functions.TEA.cost_benefit_components.electricity_cost_benefit(
-                        requirement_value_per_year)
+                        requirement_value_per_year, input_name=f"electricity price {requirement.name}")
                 else:
-                    self.values_AV = functions.TEA.cost_benefit_components.heat_cost_benefit(requirement_value_per_year)
+                    self.values_AV = functions.TEA.cost_benefit_components.heat_cost_benefit(
+                        requirement_value_per_year, input_name=f"heat price {requirement.name}")
+                self.values_AV = to_float_array(self.values_AV)
                 self.values_PV = get_present_value(values=self.values_AV, value_type="AV")
 
                 # Check that values are right sign
                 if requirement.generated:  # i.e. leading to sale of electricity
-                    if all(val <= 0 for val in self.values_AV):  # Check that values are not already positive.
-                        self.values_AV = list(np.array(self.values_AV) * -1)
-                        self.values_PV = list(np.array(self.values_PV) * -1)
+                    if np.all(self.values_AV <= 0):  # Check that values are not already positive.
+                        self.values_AV = -self.values_AV
+                        self.values_PV = -self.values_PV
                     self.cost = False
                     self.benefit = True
                 else:
-                    if all(val >= 0 for val in self.values_AV):  # Check that values are not already negative.
-                        self.values_AV = list(np.array(self.values_AV) * -1)
-                        self.values_PV = list(np.array(self.values_PV) * -1)
+                    if np.all(self.values_AV >= 0):  # Check that values are not already negative.
+                        self.values_AV = -self.values_AV
+                        self.values_PV = -self.values_PV
                     self.cost = True
                     self.benefit = False
 
                 # Set tag
                 self.tag = "Other operational expenses"
 
-        # Store mean values
+        # Store values as flat float64 arrays and their mean values
+        if self.values_PV is not None:
+            self.values_PV = to_float_array(self.values_PV)
+        if self.values_AV is not None:
+            self.values_AV = to_float_array(self.values_AV)
         if self.values_PV is not None:
             self.values_PV_mean = np.mean(self.values_PV)
         if self.values_AV is not None:
@@ -222,9 +253,9 @@ class CostBenefit:
         # Assign cost or benefit values to object if not done so when object was initiated.
         if self.values_PV is not None:
             if self.cost is None and self.benefit is None:
-                if all(i > 0 for i in self.values_PV):
+                if np.all(self.values_PV > 0):
                     self.benefit = True
-                if all(i < 0 for i in self.values_PV):
+                if np.all(self.values_PV < 0):
                     self.cost = True
 
         # Run some checks
@@ -291,6 +322,14 @@ class Process:
     AV_distribution: list[float] = None
     AV_mean: float = None
 
+    # Change tracking - converted results of each requirements object (keyed by their versions), the inputs the stored
+    # GWP and CBA results were calculated from, and the versions of the stored results (a new version is assigned
+    # whenever they are calculated). Versions are stored on the objects, so that tracking survives pickling.
+    _requirements_results: dict = field(default_factory=dict, init=False, repr=False)
+    _results_inputs: dict = field(default_factory=dict, init=False, repr=False)
+    _results_versions: dict = field(default_factory=lambda: {"GWP": get_new_version(), "CBA": get_new_version()},
+                                    init=False, repr=False)
+
     def __post_init__(self):
         if self.short_label is None:
             self.short_label = self.name  # set short_label to name if not given.
@@ -312,16 +351,130 @@ class Process:
         subprocess: Type[Process]
             Process object which is to be added as a subprocess.
         update_results: bool
-            Determines whether results should be updated based on newly added subprocess.
+            Determines whether results should be updated based on newly added subprocess. Only the new subprocess is
+            calculated (if required) - stored results of the process' requirements and other subprocesses are reused.
         """
         self.subprocesses += (subprocess, )
 
         if update_results:
-            self.calculate_GWP()
-            self.calculate_TEA()
+            self.update_results()
         else:
             raise Warning("Recalculate GWP and TEA results for main process to take into account subprocesses.")
 
+    def replace_subprocess(self, old_subprocess, new_subprocess, update_results=True):
+        """
+        Replaces a subprocess of current process object (e.g. to try an alternative technology).
+
+        Parameters
+        ----------
+        old_subprocess: Type[Process]
+            Subprocess which is to be replaced.
+        new_subprocess: Type[Process]
+            Process object which replaces the old subprocess.
+        update_results: bool
+            Determines whether results should be updated. Only the new subprocess is calculated (if required).
+        """
+        if not any(subprocess is old_subprocess for subprocess in self.subprocesses):
+            raise ValueError("Subprocess to be replaced is not a subprocess of this process.")
+        self.subprocesses = tuple(new_subprocess if subprocess is old_subprocess else subprocess
+                                  for subprocess in self.subprocesses)
+
+        if update_results:
+            self.update_results()
+
+    def update_results(self):
+        """
+        Recalculates the GWP and TEA results of the process only if its requirements or subprocesses (at any depth)
+        have changed since they were last calculated. Stored results of unchanged requirements and subprocesses are
+        reused.
+        """
+        if not self.is_up_to_date("GWP"):
+            self.calculate_GWP(consider_subprocesses=self._considers_subprocesses("GWP"), reuse_stored_results=True)
+        if not self.is_up_to_date("CBA"):
+            self.calculate_TEA(consider_subprocesses=self._considers_subprocesses("CBA"), reuse_stored_results=True)
+
+    def _get_results_inputs(self, results_type, consider_subprocesses=True):
+        """
+        Gets the state of the requirements and subprocesses which GWP ("GWP") or cost and benefit ("CBA") results are
+        calculated from.
+        """
+        requirements_inputs = tuple(requirements.version for requirements in self.requirements)
+        if not consider_subprocesses and self.subprocesses:
+            return requirements_inputs, None
+
+        subprocess_inputs = tuple(subprocess._results_versions[results_type] for subprocess in self.subprocesses)
+
+        return requirements_inputs, subprocess_inputs
+
+    def _considers_subprocesses(self, results_type):
+        """
+        Checks whether the stored GWP ("GWP") or cost and benefit ("CBA") results include the results of the
+        subprocesses, i.e. whether they were calculated with consider_subprocesses. True if no results are stored.
+        """
+        return results_type not in self._results_inputs or self._results_inputs[results_type][1] is not None
+
+    def _store_results_inputs(self, results_type, consider_subprocesses):
+        """
+        Records the state of the inputs of newly calculated GWP ("GWP") or cost and benefit ("CBA") results.
+        """
+        self._results_inputs[results_type] = self._get_results_inputs(results_type, consider_subprocesses)
+        self._results_versions[results_type] = get_new_version()
+
+    def is_up_to_date(self, results_type, consider_subprocesses=None):
+        """
+        Checks whether the stored GWP ("GWP") or cost and benefit ("CBA") results reflect the current requirements and
+        subprocesses of the process' whole subtree.
+
+        Parameters
+        ----------
+        results_type: str
+            "GWP" or "CBA".
+        consider_subprocesses: bool | None
+            Determines whether results are required to include the subprocesses. Defaults to whether the stored results
+            were calculated with consider_subprocesses.
+
+        Returns
+        -------
+        bool
+            True if the stored results are up to date.
+        """
+        if results_type not in ["GWP", "CBA"]:
+            raise ValueError("Results type not supported. Use 'GWP' or 'CBA'.")
+
+        if (self.GWP_results if results_type == "GWP" else self.CBA_results) is None:
+            return False
+        if results_type not in self._results_inputs:  # results were assigned directly
+            return True
+
+        # Get defaults
+        if consider_subprocesses is None:
+            consider_subprocesses = self._considers_subprocesses(results_type)
+
+        if consider_subprocesses and not all(subprocess.is_up_to_date(results_type, consider_subprocesses=True)
+                                             for subprocess in self.subprocesses):
+            return False
+
+        return self._results_inputs[results_type] == self._get_results_inputs(results_type, consider_subprocesses)
+
+    def _get_requirements_results(self, results_type, requirements_to_results, reuse_stored_results):
+        """
+        Converts the process' requirements to GWP ("GWP") or cost and benefit ("CBA") results. Stored results of
+        requirements objects which have not changed since their last conversion are reused if reuse_stored_results.
+        """
+        results = []
+        requirements_results = {key: stored for key, stored in self._requirements_results.items()
+                                if key[0] != results_type}  # drop results of replaced or changed requirements
+        for requirements in self.requirements:
+            key = (results_type, requirements.version)
+            stored = self._requirements_results.get(key) if reuse_stored_results else None
+            if stored is None:
+                stored = requirements_to_results((requirements, ))
+            requirements_results[key] = stored
+            results.extend(stored)
+        self._requirements_results = requirements_results
+
+        return results
+
     def add_requirements(self, requirements):
         """
         Add a new "Requirements" object to current process object.
@@ -347,7 +500,7 @@ class Process:
         """
         pass
 
-    def calculate_GWP(self, consider_subprocesses=True):
+    def calculate_GWP(self, consider_subprocesses=True, reuse_stored_results=False):
         """
         Convert a process' requirements to their corresponding Global Warming Potential (GWP).
 
@@ -355,6 +508,9 @@ class Process:
         ----------
         consider_subprocesses: bool
             Indicates whether subprocess requirements should be considered too.
+        reuse_stored_results: bool
+            Determines whether stored GWP results of unchanged requirements objects are reused instead of converting
+            them again.
 
         Returns
         -------
@@ -374,62 +530,52 @@ class Process:
 
             Returns
             -------
-            tuple[GlobalWarmingPotential]
+            list[GlobalWarmingPotential]
                 Global warming potentials resulting from process requirements.
             """
 
-            GWP_results = ()
+            GWP_results = []
             for requirement_no in range(len(requirements)):  # iterate through requirements objects
                 for fossil_GWP_requirements in requirements[requirement_no].fossil_GWP:
-                    GWP_results += (GlobalWarmingPotential(fossil_GWP_requirements),)
+                    GWP_results.append(GlobalWarmingPotential(fossil_GWP_requirements))
                 for biogenic_GWP_requirements in requirements[requirement_no].biogenic_GWP:
-                    GWP_results += (GlobalWarmingPotential(biogenic_GWP_requirements),)
+                    GWP_results.append(GlobalWarmingPotential(biogenic_GWP_requirements))
                 for electricity_requirements in requirements[requirement_no].electricity:
-                    GWP_results += (GlobalWarmingPotential(electricity_requirements),)
+                    GWP_results.append(GlobalWarmingPotential(electricity_requirements))
                 for heat_requirements in requirements[requirement_no].heat:
-                    GWP_results += (GlobalWarmingPotential(heat_requirements),)
+                    GWP_results.append(GlobalWarmingPotential(heat_requirements))
                 for steam_requirements in requirements[requirement_no].steam:
-                    GWP_results += (GlobalWarmingPotential(steam_requirements),)
+                    GWP_results.append(GlobalWarmingPotential(steam_requirements))
                 for oxygen_requirements in requirements[requirement_no].oxygen:
-                    GWP_results += (GlobalWarmingPotential(oxygen_requirements),)
+                    GWP_results.append(GlobalWarmingPotential(oxygen_requirements))
 
             return GWP_results
 
-        # Employ helper function
-        self.GWP_results = process_requirements_to_GWP(self.requirements)  # calculate GWP for process' requirements.
-
-        if consider_subprocesses:  # add requirements in subprocess.
-            # Consider subprocesses
-            for subprocess_no in range(len(self.subprocesses)):
-                if self.subprocesses[subprocess_no].GWP_results is None:  # Calculate from requirements
-                    self.GWP_results += process_requirements_to_GWP(self.subprocesses[subprocess_no].requirements)
-                else:  # add if already calculated
-                    self.GWP_results += self.subprocesses[subprocess_no].GWP_results
-                # Consider sub-subprocesses
-                for sub_subprocess_no in range(len(self.subprocesses[subprocess_no].subprocesses)):
-                    if self.subprocesses[subprocess_no].subprocesses[sub_subprocess_no].GWP_results is None:
-                        self.GWP_results += process_requirements_to_GWP(self.subprocesses[subprocess_no].
-                                                                        subprocesses[sub_subprocess_no].requirements)
-                    else:
-                        self.GWP_results += self.subprocesses[subprocess_no].subprocesses[sub_subprocess_no].GWP_results
-
-                    # Check that no deeper nested subprocesses exist
-                    if self.subprocesses[subprocess_no].subprocesses[sub_subprocess_no].subprocesses != ():
-                        raise NotImplementedError("Deeper nested subprocesses may exist and have not been considered.")
+        # Employ helper function on process' requirements and reuse the stored results of each subprocess' subtree
+        GWP_results = self._get_requirements_results("GWP", process_requirements_to_GWP, reuse_stored_results)
+        GWP_components = [GWP_obj.values for GWP_obj in GWP_results]
+
+        if consider_subprocesses:  # add results of subprocesses.
+            for subprocess in self.subprocesses:
+                subprocess._ensure_subtree_results("GWP")
+                GWP_results.extend(subprocess.GWP_results)
+                if subprocess.GWP_results:
+                    GWP_components.append(subprocess.GWP_distribution)
+
+        self.GWP_results = tuple(GWP_results)
+        self._store_results_inputs("GWP", consider_subprocesses)
 
         # Calculate total GWP
-        GWP_lists = []
-        for GWP_obj in self.GWP_results:
-            GWP_lists.append(GWP_obj.values)
-        self.GWP_distribution = list(np.array([sum(x) for x in zip(*GWP_lists)]).flatten())
-        self.GWP_mean = float(np.mean(self.GWP_distribution))
+        if self.GWP_results:
+            self.GWP_distribution = np.sum(GWP_components, axis=0)
+            self.GWP_mean = float(np.mean(self.GWP_distribution))
 
         # Set GWP to zero if no requirements led to a GWP
-        if len(self.GWP_distribution) == 0 and np.isnan(self.GWP_mean):
+        else:
             self.GWP_mean = 0
-            self.GWP_distribution = list(np.zeros(settings.user_inputs.general.MC_iterations))
+            self.GWP_distribution = np.zeros(settings.user_inputs.general.MC_iterations)
 
-    def calculate_TEA(self, consider_subprocesses=True):
+    def calculate_TEA(self, consider_subprocesses=True, reuse_stored_results=False):
         """
         Convert a process' requirements to their corresponding Costs and Benefits.
 
@@ -437,6 +583,9 @@ class Process:
         ----------
         consider_subprocesses: bool
             Indicates whether subprocess requirements should be considered too.
+        reuse_stored_results: bool
+            Determines whether stored costs and benefits of unchanged requirements objects are reused instead of
+            converting them again.
 
         Returns
         -------
@@ -454,66 +603,87 @@ class Process:
 
             Returns
             -------
-            tuple[CostBenefit]
+            list[CostBenefit]
                 Costs/Benefits resulting from process requirements.
             """
-            CBA_results = ()
+            CBA_results = []
             for requirement_no in range(len(requirements)):  # iterate through requirements objects
                 for electricity_requirements in requirements[requirement_no].electricity:
-                    CBA_results += (CostBenefit(electricity_requirements),)
+                    CBA_results.append(CostBenefit(electricity_requirements))
                 for heat_requirements in requirements[requirement_no].heat:
-                    CBA_results += (CostBenefit(heat_requirements),)
+                    CBA_results.append(CostBenefit(heat_requirements))
                 for cash_flow_pv_requirements in requirements[requirement_no].cash_flow_pv:
-                    CBA_results += (CostBenefit(cash_flow_pv_requirements),)
+                    CBA_results.append(CostBenefit(cash_flow_pv_requirements))
                 for cash_flow_av_requirements in requirements[requirement_no].cash_flow_av:
-                    CBA_results += (CostBenefit(cash_flow_av_requirements),)
+                    CBA_results.append(CostBenefit(cash_flow_av_requirements))
                 for cash_flow_fv_requirements in requirements[requirement_no].cash_flow_fv:
-                    CBA_results += (CostBenefit(cash_flow_fv_requirements),)
+                    CBA_results.append(CostBenefit(cash_flow_fv_requirements))
 
             return CBA_results
 
-        # Employ helper function
-        self.CBA_results = process_requirements_to_CBA(self.requirements)  # calculate GWP for process' requirements.
-
-        if consider_subprocesses:  # add requirements in subprocess.
-            # Consider subprocesses
-            for subprocess_no in range(len(self.subprocesses)):
-                if self.subprocesses[subprocess_no].CBA_results is None:  # Calculate from requirements
-                    self.CBA_results += process_requirements_to_CBA(self.subprocesses[subprocess_no].requirements)
-                else:  # add if already calculated
-                    self.CBA_results += self.subprocesses[subprocess_no].CBA_results
-                # Consider sub-subprocesses
-                for sub_subprocess_no in range(len(self.subprocesses[subprocess_no].subprocesses)):
-                    if self.subprocesses[subprocess_no].subprocesses[sub_subprocess_no].CBA_results is None:
-                        self.CBA_results += process_requirements_to_CBA(self.subprocesses[subprocess_no].
-                                                                        subprocesses[
-                                                                            sub_subprocess_no].requirements)
-                    else:
-                        self.CBA_results += self.subprocesses[subprocess_no].subprocesses[
-                            sub_subprocess_no].CBA_results
-
-                    # Check that no deeper nested subprocesses exist
-                    if self.subprocesses[subprocess_no].subprocesses[sub_subprocess_no].subprocesses != ():
-                        raise NotImplementedError("Deeper nested subprocesses may exist and have not been considered.")
+        # Employ helper function on process' requirements and reuse the stored results of each subprocess' subtree
+        CBA_results = self._get_requirements_results("CBA", process_requirements_to_CBA, reuse_stored_results)
+        PV_components = [cost_benefit_object.values_PV for cost_benefit_object in CBA_results]
+        AV_components = [cost_benefit_object.values_AV for cost_benefit_object in CBA_results]
+
+        if consider_subprocesses:  # add results of subprocesses.
+            for subprocess in self.subprocesses:
+                subprocess._ensure_subtree_results("CBA")
+                CBA_results.extend(subprocess.CBA_results)
+                if subprocess.CBA_results:
+                    PV_components.append(subprocess.PV_distribution)
+                    AV_components.append(subprocess.AV_distribution)
+
+        self.CBA_results = tuple(CBA_results)
+        self._store_results_inputs("CBA", consider_subprocesses)
 
         # Calculate total PV and AV
-        pv_values_list = []
-        av_values_list = []
-        for cost_benefit_object in self.CBA_results:
-            pv_values_list.append(cost_benefit_object.values_PV)
-            av_values_list.append(cost_benefit_object.values_AV)
-        self.PV_distribution = list(np.array([sum(x) for x in zip(*pv_values_list)]).flatten())
-        self.PV_mean = float(np.mean(self.PV_distribution))
-        self.AV_distribution = list(np.array([sum(x) for x in zip(*av_values_list)]).flatten())
-        self.AV_mean = float(np.mean(self.AV_distribution))
+        if self.CBA_results:
+            self.PV_distribution = np.sum(PV_components, axis=0)
+            self.PV_mean = float(np.mean(self.PV_distribution))
+            self.AV_distribution = np.sum(AV_components, axis=0)
+            self.AV_mean = float(np.mean(self.AV_distribution))
 
         # Set values to zero if no requirements led to a av or pv
-        if len(self.PV_distribution) == 0 and np.isnan(self.PV_mean):
+        else:
             self.PV_mean = 0
-            self.PV_distribution = list(np.zeros(settings.user_inputs.general.MC_iterations))
-        if len(self.AV_distribution) == 0 and np.isnan(self.AV_mean):
+            self.PV_distribution = np.zeros(settings.user_inputs.general.MC_iterations)
             self.AV_mean = 0
-            self.AV_distribution = list(np.zeros(settings.user_inputs.general.MC_iterations))
+            self.AV_distribution = np.zeros(settings.user_inputs.general.MC_iterations)
+
+    def _ensure_subtree_results(self, results_type):
+        """
+        Ensures that the GWP ("GWP") or cost and benefit ("CBA") results of the process' whole subtree are stored and up
+        to date, so that they can be reused by its parent process. Only changed parts of the subtree are recalculated.
+
+        Parameters
+        ----------
+        results_type: str
+            "GWP" or "CBA".
+        """
+        if not self.is_up_to_date(results_type, consider_subprocesses=True):
+            if results_type == "GWP":
+                self.calculate_GWP(reuse_stored_results=True)
+            else:
+                self.calculate_TEA(reuse_stored_results=True)
+
+    def get_subtree_processes(self):
+        """
+        Gets the process and all its (arbitrarily deeply nested) subprocesses in depth-first order.
+
+        Returns
+        -------
+        list[Process]
+            Processes of the subtree starting with the process itself.
+        """
+        subtree_processes = []
+        stack = [self]
+        while stack:
+            process = stack.pop()
+            subtree_processes.append(process)
+            stack.extend(reversed(process.subprocesses))
+
+        return subtree_processes
 
     def update_plot_style(self, style=None, style_box=None):
         """
@@ -2,21 +2,23 @@ import warnings
 
 import numpy as np
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from config import settings
 from typing import Literal
+from objects.generic_objects import to_float_array, get_new_version
 
 
 # Define requirement parent class
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class _Requirement:
     """
     Requirements parent class used to instantiate new requirement subclasses.
 
     Attributes
     ----------
-    values: list[float]
-        The actual requirements where the list is the length of Monte Carlo iterations.
+    values: ArrayLike
+        The actual requirements where the array is the length of Monte Carlo iterations. Lists are accepted and stored
+        as float64 arrays.
     name : str
         The name of the requirement.
     short_label : str
@@ -27,28 +29,44 @@ class _Requirement:
         Optional description can be added here.
     source: str
         Used to define the source of the requirement. E.g. is electricity coming from the grid or another source.
+    version: int
+        Version of the requirement - a new version is assigned whenever an attribute is set (e.g. new values), so that
+        processes can detect changed requirements. Values changed in place (e.g. values[0] = 1) are not detected -
+        assign a new array instead.
     """
 
-    values: list[float]
+    values: np.ndarray
     name: str
     short_label: str = None
     units: str = None
     description: str = None
     source: str = None
 
+    # Change tracking
+    version: int = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         # Set short_label to name if not given.
         if self.short_label is None:
             self.short_label = self.name
 
-        # Flatten values if required
-        if len(self.values) == 1 and settings.user_inputs.general.MC_iterations != 1:
-            self.values = list(np.array(self.values).flatten())
+    def __setattr__(self, name, value):
+        if name == "values":  # also when values are replaced after initialisation
+            value = to_float_array(value)
+        object.__setattr__(self, name, value)
+        if name != "version":
+            object.__setattr__(self, "version", get_new_version())
+
+    def __setstate__(self, state):
+        # Restore attributes as stored - loading (e.g. unpickling) does not change the requirement or its version
+        _, slots_state = state
+        for name, value in slots_state.items():
+            object.__setattr__(self, name, value)
 
 
 # Define requirement child classes
 # Energy Use
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Electricity(_Requirement):
     # Update defaults
     name: str = "Electricity consumption"
@@ -58,7 +76,7 @@ class Electricity(_Requirement):
     generated: bool = False
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Heat(_Requirement):
     # Update defaults
     name: str = "Heat use"
@@ -69,14 +87,14 @@ class Heat(_Requirement):
 
 
 # Direct environmental factors
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FossilGWP(_Requirement):
     """
     Fossil carbon emissions or global warming potential impact.
 
     Attributes
     ----------
-    values: list[float]
+    values: ArrayLike
         Carbon emissions before accounting for biogenic nature of carbon.
     name : str
     short_label : str
@@ -94,19 +112,19 @@ class FossilGWP(_Requirement):
 
     def __post_init__(self):
         if self.negative_emissions is True:
-            if all(x >= 0 for x in self.values):  # check if values given as positives
-                self.values = [-x for x in self.values]  # turn into negatives
+            if np.all(self.values >= 0):  # check if values given as positives
+                self.values = -self.values  # turn into negatives
                 raise Warning("Negative emission values were given as positives - turned into negatives.")
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BiogenicGWP(_Requirement):
     """
     Biogenic carbon emissions or global warming potential impact.
 
     Attributes
     ----------
-    values: list[float]
+    values: ArrayLike
         Carbon emissions before accounting for biogenic nature of carbon.
     name : str
     short_label : str
@@ -132,8 +150,8 @@ class BiogenicGWP(_Requirement):
         if self.negative_emissions is True:
             self.biogenic_fraction = 1  # to ensure benefit is accounted for.
 
-            if all(x >= 0 for x in self.values):  # check if values given as positives
-                self.values = [-x for x in self.values]  # turn into negatives
+            if np.all(self.values >= 0):  # check if values given as positives
+                self.values = -self.values  # turn into negatives
                 warnings.warn("Negative emission values were given as positives - turned into negatives.")
 
 
@@ -142,15 +160,15 @@ _tag_options = Literal[None, "CAPEX", "O&M", "Other operational expenses", "Sale
 
 
 # Direct cash flows
-@dataclass
+@dataclass(slots=True)
 class _ParentPresentAnnualFutureValue(_Requirement):
     """
     Parent class for present, annual, and future value classes.
 
     Attributes
     ----------
-    values: list[float]
-        The cash flows distribution for Monte Carlo simulation where the list is the length of Monte Carlo iterations.
+    values: ArrayLike
+        The cash flows distribution for Monte Carlo simulation where the array is the length of Monte Carlo iterations.
     name : str
         The name of the cash flow.
     short_label : str
@@ -172,18 +190,21 @@ class _ParentPresentAnnualFutureValue(_Requirement):
     number_of_periods: int = None
     tag: _tag_options = None
 
+    # Keep track of which parameters follow the user inputs (e.g. to rerun economic scenarios)
+    uses_default_rate_of_return: bool = field(default=None, init=False, repr=False)
+    uses_default_number_of_periods: bool = field(default=None, init=False, repr=False)
+
     def __post_init__(self):
         # Set short_label to name if not given.
         if self.short_label is None:
             self.short_label = self.name
 
-        # Flatten values if required
-        if len(self.values) == 1 and settings.user_inputs.general.MC_iterations != 1:
-            self.values = list(np.array(self.values).flatten())
-
         if self.currency is None:
             self.currency = settings.user_inputs.general.currency
 
+        self.uses_default_rate_of_return = self.rate_of_return is None
+        self.uses_default_number_of_periods = self.number_of_periods is None
+
         if self.rate_of_return is None:
             self.rate_of_return = settings.user_inputs.economic.rate_of_return_decimals
 
@@ -191,19 +212,21 @@ class _ParentPresentAnnualFutureValue(_Requirement):
             self.number_of_periods = settings.user_inputs.general.system_life_span
 
 
-@dataclass
+@dataclass(slots=True)
 class PresentValue(_ParentPresentAnnualFutureValue):
     """
     Also called present worth.
     """
 
 
+@dataclass(slots=True)
 class AnnualValue(_ParentPresentAnnualFutureValue):
     """
     Also called annual worth or annuity.
     """
 
 
+@dataclass(slots=True)
 class FutureValue(_ParentPresentAnnualFutureValue):
     """
     Also called future worth.
@@ -211,7 +234,7 @@ class FutureValue(_ParentPresentAnnualFutureValue):
 
 
 # Other requirements
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Oxygen(_Requirement):
     # Update defaults
     name: str = "Oxygen"
@@ -220,7 +243,7 @@ class Oxygen(_Requirement):
     source: str = "grid"  # i.e. electricity used
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Steam(_Requirement):
     # Update defaults
     name: str = "Steam"
@@ -229,6 +252,11 @@ class Steam(_Requirement):
     source: str = "natural gas"  # i.e. heat used
 
 
+# Attributes of the Requirements class holding requirement objects
+_requirement_types = ("electricity", "heat", "fossil_GWP", "biogenic_GWP", "cash_flow_pv", "cash_flow_av", "cash_flow_fv",
+                      "steam", "oxygen")
+
+
 # Define Requirements class which all kinds of _Requirement children can be added to.
 @dataclass
 class Requirements:
@@ -248,6 +276,10 @@ class Requirements:
     cash_flow_fv: tuple[FutureValue]
     steam: tuple[Steam]
     oxygen: tuple[Oxygen]
+    version: tuple
+        Version of the requirements and of each requirement object they hold - changes whenever an attribute of either
+        is set (e.g. via add_requirement or by assigning new values), so that processes can detect changed or replaced
+        requirements.
 
     Methods
     ------
@@ -273,6 +305,19 @@ class Requirements:
     steam: tuple[Steam] = ()
     oxygen: tuple[Oxygen] = ()
 
+    # Change tracking
+    _version: int = field(default_factory=get_new_version, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_version":
+            object.__setattr__(self, "_version", get_new_version())
+
+    @property
+    def version(self):
+        return (self._version, tuple(requirement.version for requirement_type in _requirement_types
+                                     for requirement in getattr(self, requirement_type)))
+
     def add_requirement(self, requirement_object):
         """
         Adds a new "requirement" to this "Requirements" object.
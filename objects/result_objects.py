@@ -1,3 +1,4 @@
+import contextlib
 import datetime
 import math
 import os
@@ -8,12 +9,13 @@ import seaborn as sns
 
 from config import settings
 from dynaconf.utils.boxing import DynaBox
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Type, Literal
 from human_id import generate_id
 
 from objects.process_objects import Process, CostBenefit
 from objects.requirement_objects import Requirements
+from objects.matrix_objects import ResultsMatrix
 
 from matplotlib.backends.backend_pdf import PdfPages
 from functions.LCA import electricity_GWP, thermal_energy_GWP
@@ -23,6 +25,29 @@ from processes.general import oxygen_rng_elect_req, steam_rng_heat_req
 
 plot_legend_options = Literal["plot", "box"]
 
+# Results metrics which are calculated lazily on first access and the group of metrics calculated together with them
+_lazy_metric_groups = {"GWP_distribution": "GWP", "GWP_mean": "GWP",
+                       "PV_distribution": "TEA", "PV_mean": "TEA", "AV_distribution": "TEA", "AV_mean": "TEA",
+                       "BCR_distribution": "TEA", "BCR_mean": "TEA",
+                       "electricity_results": "energy", "heat_results": "energy"}
+
+
+class _LazyMetric:
+    """
+    Descriptor of a Results metric which is calculated lazily on first access and stored until the processes change.
+    Its default value as a dataclass field is None, so that metrics can still be given when initialising the object.
+    """
+    def __set_name__(self, owner, name):
+        self.metric = name
+
+    def __get__(self, results, owner=None):
+        if results is None:  # accessed on the class - default value of the dataclass field
+            return None
+        return results._get_lazy_metric(self.metric)
+
+    def __set__(self, results, value):
+        results._set_lazy_metric(self.metric, value)
+
 
 @dataclass
 class Results:
@@ -41,14 +66,22 @@ class Results:
     plot_style: str | DynaBox
         Style to be used for plotting - str loads predefined style from settings (e.g. "digital" or "poster").
         Alternatively DynaBox object can be given directly.
-    GWP_distribution: list[float]
-        GWP Monte Carlo results - populated later.
+    GWP_distribution: np.ndarray
+        GWP Monte Carlo results - calculated lazily on first access.
     GWP_mean: float
-        Average GWP - populated later.
+        Average GWP - calculated lazily on first access.
+    PV_distribution, PV_mean, AV_distribution, AV_mean, BCR_distribution, BCR_mean: np.ndarray | float
+        Present value, annual value, and benefit cost ratio results - calculated lazily on first access.
     electricity_results: dict
-        Electricity generation and use results - populated later.
+        Electricity generation and use results - calculated lazily on first access.
     heat_results: dict
-        Heat/thermal energy generation and use results - populated later.
+        Heat/thermal energy generation and use results - calculated lazily on first access.
+    control_variates: list[tuple[ArrayLike, float]]
+        Draws of the uncertain inputs of the simulation run and their expected values - populated later if
+        settings.user_inputs.general.record_control_variates is set.
+    matrices: dict[str, ResultsMatrix]
+        Columnar store of the component distributions of each metric ("GWP", "PV", "AV", "electricity", "heat") -
+        populated later.
     figures: dict
         Dictionary of figures illustrating environmental and economic results.
 
@@ -65,8 +98,29 @@ class Results:
     calculate_total_GWP():
         Calculates the overall global warming potential (GWP) of the system.
 
+    store_run_state():
+        Stores the root seed sequence of the current simulation run for lazily calculated metrics.
+
+    is_up_to_date():
+        Checks whether all lazily calculated metrics have been calculated and reflect the current processes.
+
+    build_results_matrices():
+        Rebuilds the columnar store of the GWP, PV and AV component distributions from the processes.
+
+    get_control_variate_mean(distribution, max_control_variates):
+        Estimates the mean of a results distribution using the uncertain inputs as control variates.
+
     """
     # TODO: Add other methods to docstring.
+    # Change tracking - defined first, as the lazily calculated metrics below are stored in _lazy_metrics when the
+    # object is initialised. Stores the process holding the global economic effects, the lazily calculated metrics
+    # with the state of the processes they were calculated from, the energy components of each process, and the root
+    # seed sequence of the simulation run the results are calculated in.
+    _global_economic_process: Process = field(default=None, init=False, repr=False)
+    _lazy_metrics: dict = field(default_factory=dict, init=False, repr=False)
+    _energy_components: dict = field(default_factory=dict, init=False, repr=False)
+    _root_seed_sequence: np.random.SeedSequence = field(default=None, init=False, repr=False)
+
     name: str = None
     processes: tuple[Type[Process]] = ()
     # TODO: Update type hint, so it properly shows children of _Requirement class.
@@ -76,25 +130,33 @@ class Results:
     # Define defaults which are to be populated later
 
     # Environmental
-    GWP_distribution: list[float] = None
-    GWP_mean: float = None
+    GWP_distribution: list[float] = _LazyMetric()
+    GWP_mean: float = _LazyMetric()
 
     # Economics
-    PV_distribution: list[float] | float = None
-    PV_mean: float = None
-    AV_distribution: list[float] | float = None
-    AV_mean: float = None
-    BCR_distribution: list[float] | float = None
-    BCR_mean: float = None
+    PV_distribution: list[float] | float = _LazyMetric()
+    PV_mean: float = _LazyMetric()
+    AV_distribution: list[float] | float = _LazyMetric()
+    AV_mean: float = _LazyMetric()
+    BCR_distribution: list[float] | float = _LazyMetric()
+    BCR_mean: float = _LazyMetric()
 
     # Energy
-    electricity_results: dict = None
-    heat_results: dict = None
+    electricity_results: dict = _LazyMetric()
+    heat_results: dict = _LazyMetric()
+
+    # Variance reduction
+    control_variates: list = None
+
+    # Columnar store of component distributions
+    matrices: dict = None
 
     # Other
     figures: dict = None
 
     def __post_init__(self):
+        if self.matrices is None:
+            self.matrices = {}
         self.ID: str = generate_id()
         self.date_time: str = datetime.datetime.now().strftime("%d/%m/%Y %H:%M:%S")
         if not isinstance(self.plot_style, DynaBox):
@@ -111,169 +173,360 @@ class Results:
         """
         self.processes += (process, )
 
+    def replace_process(self, old_process, new_process):
+        """
+        Replaces a process (e.g. to try an alternative technology). Only results which depend on the new process are
+        recalculated by the next call of calculate_all().
+
+        Parameters
+        ----------
+        old_process: Process
+            Process object which is to be replaced.
+        new_process: Process
+            Process object which replaces the old process.
+        """
+        if not any(process is old_process for process in self.processes):
+            raise ValueError("Process to be replaced is not part of results.")
+        self.processes = tuple(new_process if process is old_process else process for process in self.processes)
+
+    def _remove_global_economic_process(self):
+        """
+        Removes the process holding the global economic effects, so that they can be recalculated.
+        """
+        if self._global_economic_process is not None:
+            self.processes = tuple(process for process in self.processes
+                                   if process is not self._global_economic_process)
+            self._global_economic_process = None
+
+    def _get_processes_inputs(self):
+        """
+        Gets the state of the processes which the results are calculated from - the versions of their results and of
+        the requirements of their whole subtree.
+        """
+        return tuple((process._results_versions["GWP"], process._results_versions["CBA"],
+                      tuple(requirements.version for subtree_process in process.get_subtree_processes()
+                            for requirements in subtree_process.requirements))
+                     for process in self.processes if process is not self._global_economic_process)
+
+    def __copy__(self):
+        copied_results = object.__new__(type(self))
+        copied_results.__dict__.update(self.__dict__)
+        copied_results._lazy_metrics = dict(self._lazy_metrics)  # metrics can be updated independently
+
+        return copied_results
+
+    def __getstate__(self):
+        # Matrices of the process components share their buffers with the GWP and CostBenefit objects - only store
+        # the distributions once and rebuild the matrices when loading
+        state = self.__dict__.copy()
+        state["matrices"] = {metric: None if metric in ["GWP", "PV", "AV"] else matrix
+                             for metric, matrix in self.matrices.items()}
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for metric, matrix in self.matrices.items():
+            if matrix is None:
+                self.matrices[metric] = ResultsMatrix.from_processes(self.processes, metric)
+
+    def store_run_state(self):
+        """
+        Stores the root seed sequence of the current simulation run, so that lazily calculated metrics draw from the
+        random number streams of this run even if they are first accessed after the run (e.g. once a new run has
+        started). Metrics are calculated with the user inputs defined when they are accessed.
+        """
+        from functions.MonteCarloSimulation import get_root_seed_sequence
+
+        self._root_seed_sequence = get_root_seed_sequence()
+
+    def _calculate_lazy_metrics(self, metric_group):
+        """
+        Calculates a group of lazily calculated metrics ("GWP", "TEA", or "energy") in the stored simulation run.
+        """
+        from functions.MonteCarloSimulation import use_random_seed
+
+        with contextlib.ExitStack() as stack:
+            if self._root_seed_sequence is not None:
+                stack.enter_context(use_random_seed(self._root_seed_sequence))
+
+            if metric_group == "GWP":
+                self.calculate_total_GWP()
+            elif metric_group == "TEA":
+                if not self._is_lazy_metric_valid("global economic effects"):
+                    self.calculate_global_economic_effects()
+                self.calculate_total_TEA()
+            else:
+                self.calculate_electricity_heat_output()
+
+    def _is_lazy_metric_valid(self, metric):
+        """
+        Checks whether a lazily calculated metric is stored and still reflects the current processes.
+        """
+        return metric in self._lazy_metrics and self._lazy_metrics[metric][1] == self._get_processes_inputs()
+
+    def is_up_to_date(self):
+        """
+        Checks whether all lazily calculated metrics have been calculated and still reflect the current processes.
+
+        Returns
+        -------
+        bool
+            True if no metric needs to be calculated.
+        """
+        return all(self._is_lazy_metric_valid(metric) for metric in _lazy_metric_groups)
+
+    def _get_lazy_metric(self, metric):
+        if not self._is_lazy_metric_valid(metric):
+            for process in self.processes:  # recalculate processes whose requirements or subprocesses have changed
+                if process is not self._global_economic_process:
+                    process.update_results()
+            self._calculate_lazy_metrics(_lazy_metric_groups[metric])
+
+        return self._lazy_metrics[metric][0]
+
+    def _set_lazy_metric(self, metric, value):
+        if value is None:
+            self._lazy_metrics.pop(metric, None)
+        else:
+            self._lazy_metrics[metric] = (value, self._get_processes_inputs())
+
     def calculate_global_economic_effects(self):
         """
         Adds other economic factors which are process independent, such as a potential carbon tax, feedstock costs,
         or gate fees, etc.
         """
         # Set up general process which can be added to results object
+        from functions.MonteCarloSimulation import use_random_stream
         from processes.other import General
 
         general_process = General()
         economic_requirements = Requirements(name="Economic")
 
-        # Gate fee or feedstock cost
-        economic_requirements.add_requirement(gate_fee_or_feedstock_cost_benefit())
+        # Draw uncertain inputs from the process' own random number stream
+        with use_random_stream(general_process.name):
+            # Gate fee or feedstock cost
+            economic_requirements.add_requirement(gate_fee_or_feedstock_cost_benefit())
 
-        # Effects of a carbon price, due to e.g. a carbon tax or emissions trading scheme
-        if settings.user_inputs.economic.carbon_tax_included:
-            if self.GWP_distribution is None:
-                self.calculate_total_GWP()
-            economic_requirements.add_requirement(carbon_price_cost_benefit(self.GWP_distribution))
+            # Effects of a carbon price, due to e.g. a carbon tax or emissions trading scheme
+            if settings.user_inputs.economic.carbon_tax_included:
+                economic_requirements.add_requirement(carbon_price_cost_benefit(self.GWP_distribution))
 
-        # Add requirements to new process object, calculate LCA and TEA effects, and add process to results object.
-        general_process.add_requirements(economic_requirements)
-        general_process.calculate_GWP()
-        general_process.calculate_TEA()
+            # Add requirements to new process object, calculate LCA and TEA effects, and add process to results object.
+            general_process.add_requirements(economic_requirements)
+            general_process.calculate_GWP()
+            general_process.calculate_TEA()
+        self._remove_global_economic_process()  # replace previously calculated global economic effects
         self.add_process(general_process)
+        self._global_economic_process = general_process
+        self._set_lazy_metric("global economic effects", general_process)
 
     def calculate_total_TEA(self):
         """
         Calculates the overall present and annual value of the system.
         """
-        # Calculate totals for each Monte Carlo instance
-        pv_totals = []
-        av_totals = []
-        for process in self.processes:
-            pv_totals.append(np.array(process.PV_distribution).flatten())
-            av_totals.append(np.array(process.AV_distribution).flatten())
-        pv_totals = np.array(pv_totals)
-        av_totals = np.array(av_totals)
-
-        # Sum totals elementwise
-        self.PV_distribution = list(np.sum(pv_totals, axis=0))
-        self.AV_distribution = list(np.sum(av_totals, axis=0))
+        # Store component distributions and sum them for each Monte Carlo instance
+        self.matrices["PV"] = ResultsMatrix.from_processes(self.processes, "PV")
+        self.matrices["AV"] = ResultsMatrix.from_processes(self.processes, "AV")
+        self.PV_distribution = self.matrices["PV"].total()
+        self.AV_distribution = self.matrices["AV"].total()
 
         # Calculate overall sums
         self.PV_mean = float(np.mean(self.PV_distribution))
         self.AV_mean = float(np.mean(self.AV_distribution))
 
         # Calculate benefit cost ratio for each Monte Carlo instance
-        cost_distributions = []
-        benefit_distributions = []
-
-        # Fetch cost and benefit distributions
-        for process in self.processes:
-            for CBA_result in process.CBA_results:
-                if CBA_result.cost:
-                    cost_distributions.append(CBA_result.values_PV)
-                if CBA_result.benefit:
-                    benefit_distributions.append(CBA_result.values_PV)
-
-        total_costs_distribution = np.sum(np.array(cost_distributions), axis=0)
-        total_benefits_distribution = np.sum(np.array(benefit_distributions), axis=0)
+        total_costs_distribution = self.matrices["PV"].select(cost=True).total()
+        total_benefits_distribution = self.matrices["PV"].select(benefit=True).total()
 
         # Add benefit cost ratio to results
-        self.BCR_distribution = list(total_benefits_distribution / (-1 * total_costs_distribution))
+        self.BCR_distribution = total_benefits_distribution / (-1 * total_costs_distribution)
         self.BCR_mean = np.mean(self.BCR_distribution)
 
     def calculate_total_GWP(self):
         """
         Calculates the overall global warming potential (GWP) of the system.
         """
-        # Calculate totals for each Monte Carlo instance
-        GWP_totals = []
-        for process in self.processes:
-            GWP_totals.append(np.array(process.GWP_distribution).flatten())
-        GWP_totals = np.array(GWP_totals)
-        self.GWP_distribution = list(np.sum(GWP_totals, axis=0))  # sum elementwise
+        # Store component distributions and sum them for each Monte Carlo instance
+        self.matrices["GWP"] = ResultsMatrix.from_processes(self.processes, "GWP")
+        self.GWP_distribution = self.matrices["GWP"].total()
 
         # Calculate overall sum
         self.GWP_mean = float(np.mean(self.GWP_distribution))
 
+    def build_results_matrices(self):
+        """
+        Rebuilds the columnar store of the GWP, PV and AV component distributions from the processes (e.g. after the
+        distributions of the processes have been updated).
+        """
+        for metric in ["GWP", "PV", "AV"]:
+            self.matrices[metric] = ResultsMatrix.from_processes(self.processes, metric)
+
+    def get_control_variate_mean(self, distribution="GWP", max_control_variates=None):
+        """
+        Estimates the mean of a results distribution using the uncertain inputs, whose expected values are known, as
+        control variates. The part of the sampling noise which is explained by the input draws is removed by linear
+        regression. To avoid overfitting, the iterations are split into two halves (alternating iterations): control
+        variates are selected and their coefficients fitted on one half and applied to the other. The estimate is
+        therefore unbiased and its standard error is based on out-of-sample residuals, i.e. it includes the cost of
+        selecting and fitting the control variates. The plain sample mean is returned if the control variates do not
+        reduce the standard error by at least 5%.
+
+        Parameters
+        ----------
+        distribution: str
+            Distribution whose mean is to be estimated - "GWP", "PV", "AV", or "BCR".
+        max_control_variates: int | None
+            Maximum number of control variates used - those most strongly correlated with the results distribution
+            (within the half they are fitted on) are selected. Defaults to one control variate per 20 Monte Carlo
+            iterations.
+
+        Returns
+        -------
+        tuple[float, float]
+            Control variate estimate of the mean and its standard error.
+        """
+        values = np.array(getattr(self, f"{distribution}_distribution"), dtype=float).flatten()
+        n_iterations = len(values)
+
+        # Get defaults
+        if max_control_variates is None:
+            max_control_variates = max(1, n_iterations // 20)
+
+        # Plain sample mean
+        mean = float(np.mean(values))
+        standard_error = float(np.std(values, ddof=1) / np.sqrt(n_iterations)) if n_iterations > 1 else np.nan
+
+        # Centre control variates on their expected values
+        control_variates = [np.asarray(draws, dtype=float) - expected_value
+                            for draws, expected_value in (self.control_variates or [])
+                            if len(draws) == n_iterations and np.std(draws) > 0]
+
+        if len(control_variates) == 0 or n_iterations < 6:
+            return mean, standard_error
+
+        # Select and fit control variates on one half of the iterations and remove the explained sampling noise from
+        # the other half
+        control_variates = np.column_stack(control_variates)
+        halves = (np.arange(0, n_iterations, 2), np.arange(1, n_iterations, 2))
+        adjusted_values = np.empty(n_iterations)
+        for fitted_half, adjusted_half in [halves, halves[::-1]]:
+            fitted_control_variates = control_variates[fitted_half]
+            fitted_values = values[fitted_half]
+            correlations = np.nan_to_num(np.abs([np.corrcoef(control_variate, fitted_values)[0, 1]
+                                                 for control_variate in fitted_control_variates.T]))
+            selected = np.argsort(correlations)[::-1][:min(max_control_variates, len(fitted_half) - 2)]
+            centred_control_variates = (fitted_control_variates[:, selected] -
+                                        np.mean(fitted_control_variates[:, selected], axis=0))
+            coefficients, *_ = np.linalg.lstsq(centred_control_variates, fitted_values - np.mean(fitted_values),
+                                               rcond=None)
+            adjusted_control_variates = control_variates[adjusted_half][:, selected]
+            adjusted_values[adjusted_half] = values[adjusted_half] - adjusted_control_variates @ coefficients
+
+        control_variate_standard_error = float(np.std(adjusted_values, ddof=1) / np.sqrt(n_iterations))
+        if control_variate_standard_error >= 0.95 * standard_error:  # no real variance reduction
+            return mean, standard_error
+
+        return float(np.mean(adjusted_values)), control_variate_standard_error
+
     def calculate_electricity_heat_output(self):
         """
         Calculates the overall energy outputs in the form of electricity and heat of the system.
         """
-        # Storage lists
+        # Storage lists of components (index entries and distributions)
         electricity = []
-        electricity_names = []
         heat = []
-        heat_names = []
+
+        # Oxygen and steam components whose energy requirements are calculated at once for all requirements
+        oxygen_components = []
+        steam_components = []
 
         # Define helper function
-        def extract_heat_electricity_from_requirement(requirement_obj, electricity_storage_array, heat_storage_array,
-                                                      electricity_names_array, heat_names_array):
+        def extract_heat_electricity_from_requirement(requirement_obj, process, electricity_components,
+                                                      heat_components):
+            def _add_component(components, requirement_instance, values):
+                component = {"process": process.name,
+                             "process_short_label": process.short_label,
+                             "name": requirement_instance.name,
+                             "short_label": requirement_instance.short_label,
+                             "values": values}  # energy use (+ve) or generation (-ve)
+                components.append(component)
+                return component
+
             # electricity requirements
             for requirement_instance in requirement_obj.electricity:
-                electricity_names_array.append(requirement_instance.name)
                 if requirement_instance.generated:
-                    values = [-x for x in requirement_instance.values]
-                    electricity_storage_array.append(values)
+                    _add_component(electricity_components, requirement_instance, -requirement_instance.values)
                 else:
-                    electricity_storage_array.append(requirement_instance.values)
+                    _add_component(electricity_components, requirement_instance, requirement_instance.values)
 
             # oxygen requirements - also result in electricity
             for requirement_instance in requirement_obj.oxygen:
-                ele_oxygen = []
-                electricity_names_array.append(requirement_instance.name)
-                for oxygen_req_value in requirement_instance.values:
-                    ele_oxygen.append(electricity_GWP(amount=oxygen_rng_elect_req(mass_oxygen=oxygen_req_value)))
-                electricity_storage_array.append(ele_oxygen)
+                oxygen_components.append((_add_component(electricity_components, requirement_instance, None),
+                                          requirement_instance.values))
 
             # heat requirements
             for requirement_instance in requirement_obj.heat:
-                heat_names_array.append(requirement_instance.name)
                 if requirement_instance.generated:
-                    values = [-x for x in requirement_instance.values]
-                    heat_storage_array.append(values)
+                    _add_component(heat_components, requirement_instance, -requirement_instance.values)
                 else:
-                    heat_storage_array.append(requirement_instance.values)
+                    _add_component(heat_components, requirement_instance, requirement_instance.values)
 
             # steam requirements - also result in heat
             for requirement_instance in requirement_obj.steam:
-                heat_steam = []
-                heat_names_array.append(requirement_instance.name)
-                for steam_req_value in requirement_instance.values:
-                    heat_steam.append(thermal_energy_GWP(amount=steam_rng_heat_req(mass_steam=steam_req_value)))
-                heat_storage_array.append(heat_steam)
+                steam_components.append((_add_component(heat_components, requirement_instance, None),
+                                         requirement_instance.values))
 
-            return electricity_storage_array, heat_storage_array, electricity_names_array, heat_names_array
+            return electricity_components, heat_components
 
-        # Employ helper function up to the third layer of subprocesses
+        # Employ helper function on the requirements of each process' whole subtree - components of processes whose
+        # requirements have not changed since the last calculation are reused
+        energy_components = {}
         for process in self.processes:  # iterate through processes
-            for requirement in process.requirements:  # iterate through requirements of each process.
-                electricity, heat, electricity_names, heat_names = \
-                    extract_heat_electricity_from_requirement(requirement, electricity, heat,
-                                                              electricity_names, heat_names)
-            for subprocess in process.subprocesses:
-                for sub_requirement in subprocess.requirements:
-                    electricity, heat, electricity_names, heat_names = \
-                        extract_heat_electricity_from_requirement(sub_requirement, electricity, heat,
-                                                                  electricity_names, heat_names)
-
-                    for sub_sub_requirement in subprocess.subprocesses:
-                        electricity, heat, electricity_names, heat_names = \
-                            extract_heat_electricity_from_requirement(sub_sub_requirement, electricity, heat,
-                                                                      electricity_names, heat_names)
-
-        # Calculate net output in different forms
-        electricity_components = np.array(electricity) * -1
-        heat_components = np.array(heat) * -1
-        electricity_output_distribution = list(np.sum(electricity_components, axis=0))
-        heat_output_distribution = list(np.sum(heat_components, axis=0))
-
-        electricity_output = {"Total mean": np.mean(electricity_output_distribution),
-                              "Total MC distribution": electricity_output_distribution,
-                              "Component distributions": electricity_components,
-                              "Component means": np.mean(electricity_components, axis=1),
-                              "Component names": electricity_names}
-
-        heat_output = {"Total mean": np.mean(heat_output_distribution),
-                       "Total MC distribution": heat_output_distribution,
-                       "Component distributions": heat_components,
-                       "Component means": np.mean(heat_components, axis=1),
-                       "Component names": heat_names}
+            subtree_processes = process.get_subtree_processes()
+            requirements_inputs = tuple(requirements.version for subtree_process in subtree_processes
+                                        for requirements in subtree_process.requirements)
+            stored = self._energy_components.get((process.name, process.short_label, requirements_inputs))
+            if stored is None:
+                process_electricity, process_heat = [], []
+                for subtree_process in subtree_processes:
+                    for requirement in subtree_process.requirements:  # iterate through requirements of each process.
+                        process_electricity, process_heat = extract_heat_electricity_from_requirement(
+                            requirement, process, process_electricity, process_heat)
+                stored = (process_electricity, process_heat)
+            energy_components[(process.name, process.short_label, requirements_inputs)] = stored
+            electricity.extend(stored[0])
+            heat.extend(stored[1])
+        self._energy_components = energy_components
+
+        # Convert stacked oxygen and steam requirements in one operation each (loading their conversion data once)
+        if oxygen_components:
+            oxygen_matrix = np.vstack([mass_oxygen for _, mass_oxygen in oxygen_components])
+            oxygen_electricity = electricity_GWP(amount=oxygen_rng_elect_req(mass_oxygen=oxygen_matrix))
+            for (component, _), values in zip(oxygen_components, oxygen_electricity):
+                component["values"] = values
+        if steam_components:
+            steam_matrix = np.vstack([mass_steam for _, mass_steam in steam_components])
+            steam_heat = thermal_energy_GWP(amount=steam_rng_heat_req(mass_steam=steam_matrix))
+            for (component, _), values in zip(steam_components, steam_heat):
+                component["values"] = values
+
+        # Store net outputs in columnar form
+        n_iterations = len(self.GWP_distribution) if self.GWP_distribution is not None else \
+            settings.user_inputs.general.MC_iterations
+        for energy, components in [("electricity", electricity), ("heat", heat)]:
+            self.matrices[energy] = ResultsMatrix.from_components(energy, components, n_iterations)
+            self.matrices[energy].values *= -1  # net output
+
+        energy_outputs = []
+        for energy in ["electricity", "heat"]:
+            output_distribution = self.matrices[energy].total()
+            energy_outputs.append({"Total mean": np.mean(output_distribution),
+                                   "Total MC distribution": output_distribution,
+                                   "Component distributions": self.matrices[energy].values,
+                                   "Component means": self.matrices[energy].component_means(),
+                                   "Component names": list(self.matrices[energy].names)})
+        electricity_output, heat_output = energy_outputs
 
         # Store results in object
         self.electricity_results = electricity_output
@@ -281,14 +534,32 @@ class Results:
 
         return electricity_output, heat_output
 
-    def calculate_all(self):
+    def calculate_all(self, force_recalculation=False):
         """
         Convenience function which calculates all results (i.e. environmental, economic, and energy performance).
+        Processes are only recalculated if their requirements or subprocesses have changed, and the system results are
+        only recalculated if any process has changed since they were last calculated. Metrics are otherwise calculated
+        lazily on first access.
+
+        Parameters
+        ----------
+        force_recalculation: bool
+            Determines whether the system results are recalculated even if no process has changed (e.g. after user
+            inputs have been updated).
         """
-        self.calculate_total_GWP()
-        self.calculate_global_economic_effects()
-        self.calculate_total_TEA()
-        self.calculate_electricity_heat_output()
+        if force_recalculation:
+            self._lazy_metrics.clear()
+
+        for metric in ["GWP_distribution", "BCR_distribution", "electricity_results"]:
+            self._get_lazy_metric(metric)
+
+    def _get_process_short_labels(self, process_names):
+        """
+        Helper function to get the short labels of processes from their names.
+        """
+        short_labels = {process.name: process.short_label for process in self.processes}
+
+        return [short_labels[process_name] for process_name in process_names]
 
     def update_plot_style(self, style=None, style_box=None):
         """
@@ -638,23 +909,16 @@ class Results:
             Resulting matplotlib figure and axes object.
         """
         # Extract required values
-        process_names = []
-        process_short_names = []
-        GWP_matrix = []
-        for process_count, process in enumerate(self.processes):  # get distributions of each process' GWP
-            process_names.append(process.name)
-            process_short_names.append(process.short_label)
-            GWP_matrix.append(np.array(process.GWP_distribution).flatten())
+        process_names, GWP_matrix = self.matrices["GWP"].group_sum(by="processes")  # GWP distribution of processes
+        if short_labels:
+            process_names = self._get_process_short_labels(process_names)
 
         # Prepare lists for plotting
-        process_names.append("Total")
-        process_short_names.append("Total")
-        if short_labels:
-            process_names = process_short_names
+        process_names = list(process_names) + ["Total"]
 
         # Add total to matrix
-        GWP_matrix.append(np.array(self.GWP_distribution))
-        GWP_matrix = np.transpose(np.array(GWP_matrix))  # convert to right format
+        GWP_matrix = np.vstack([GWP_matrix, self.GWP_distribution])
+        GWP_matrix = np.transpose(GWP_matrix)  # convert to right format
         GWP_exc_total = GWP_matrix[:, 0:-1]  # get array without the total
         GWP_total = GWP_matrix[:, -1]  # get list of total GWP
 
@@ -917,23 +1181,16 @@ class Results:
             Resulting matplotlib figure and axes object.
         """
         # Extract required values
-        process_names = []
-        process_short_names = []
-        NPV_matrix = []
-        for process_count, process in enumerate(self.processes):  # get present value distribution of each process
-            process_names.append(process.name)
-            process_short_names.append(process.short_label)
-            NPV_matrix.append(np.array(process.PV_distribution).flatten())
+        process_names, NPV_matrix = self.matrices["PV"].group_sum(by="processes")  # present values of processes
+        if short_labels:
+            process_names = self._get_process_short_labels(process_names)
 
         # Prepare lists for plotting
-        process_names.append("Total")
-        process_short_names.append("Total")
-        if short_labels:
-            process_names = process_short_names
+        process_names = list(process_names) + ["Total"]
 
         # Add total to matrix
-        NPV_matrix.append(np.array(self.PV_distribution))
-        NPV_matrix = np.transpose(np.array(NPV_matrix))  # convert to right format
+        NPV_matrix = np.vstack([NPV_matrix, self.PV_distribution])
+        NPV_matrix = np.transpose(NPV_matrix)  # convert to right format
         NPV_exc_total = NPV_matrix[:, 0:-1]  # get array without the total
         NPV_total = NPV_matrix[:, -1]  # get array of totals
 
@@ -0,0 +1,296 @@
+import numpy as np
+
+from dataclasses import dataclass, field
+from scipy.stats import norm
+
+
+@dataclass
+class OnlineStatistics:
+    """
+    Online (streaming) summary statistics of a Monte Carlo distribution. Samples are folded in chunk by chunk and can
+    then be discarded, so memory use does not grow with the number of Monte Carlo iterations.
+
+    Attributes
+    ----------
+    name: str
+        Name of the distribution.
+    n_bins: int
+        Number of histogram bins. Must be even, as bins are merged pairwise when the histogram range is extended.
+    count: int
+        Number of samples folded in so far.
+    mean: float
+        Running mean.
+    minimum: float
+        Smallest sample seen so far.
+    maximum: float
+        Largest sample seen so far.
+    bin_counts: ArrayLike
+        Histogram counts.
+
+    Methods
+    -------
+    update(values)
+        Folds a chunk of samples into the statistics.
+    quantile(q)
+        Estimates quantiles from the histogram.
+    confidence_interval_mean(confidence_level)
+        Confidence interval of the mean.
+    confidence_interval_quantile(q, confidence_level)
+        Distribution-free confidence interval of a quantile.
+    """
+    name: str = None
+    n_bins: int = 1000
+    count: int = 0
+    mean: float = 0.0
+    minimum: float = np.inf
+    maximum: float = -np.inf
+    bin_counts: np.ndarray = None
+
+    def __post_init__(self):
+        if self.n_bins % 2 != 0:
+            raise ValueError("Number of bins must be even.")
+        if self.bin_counts is None:
+            self.bin_counts = np.zeros(self.n_bins)
+        self._sum_squared_deviations = 0.0
+        self._bin_lower = None
+        self._bin_width = None
+
+    @property
+    def variance(self):
+        """Sample variance of all samples folded in so far."""
+        if self.count < 2:
+            return 0.0
+        return self._sum_squared_deviations / (self.count - 1)
+
+    @property
+    def std(self):
+        """Sample standard deviation of all samples folded in so far."""
+        return float(np.sqrt(self.variance))
+
+    @property
+    def standard_error(self):
+        """Standard error of the mean."""
+        if self.count == 0:
+            return np.inf
+        return self.std / np.sqrt(self.count)
+
+    @property
+    def bin_edges(self):
+        """Edges of the histogram bins."""
+        if self._bin_lower is None:
+            return None
+        return self._bin_lower + self._bin_width * np.arange(self.n_bins + 1)
+
+    def update(self, values):
+        """
+        Folds a chunk of samples into the statistics.
+
+        Parameters
+        ----------
+        values: ArrayLike
+            Chunk of Monte Carlo samples.
+        """
+        values = np.asarray(values, dtype=float).flatten()
+        if len(values) == 0:
+            return
+
+        # Mean and variance - combine chunk statistics with running statistics (Chan et al. parallel algorithm)
+        chunk_count = len(values)
+        chunk_mean = float(np.mean(values))
+        chunk_sum_squared_deviations = float(np.sum((values - chunk_mean) ** 2))
+        total_count = self.count + chunk_count
+        delta = chunk_mean - self.mean
+        self._sum_squared_deviations += (chunk_sum_squared_deviations +
+                                         delta ** 2 * self.count * chunk_count / total_count)
+        self.mean += delta * chunk_count / total_count
+        self.count = total_count
+
+        # Extremes
+        self.minimum = min(self.minimum, float(np.min(values)))
+        self.maximum = max(self.maximum, float(np.max(values)))
+
+        # Histogram
+        self._extend_histogram_range()
+        chunk_bin_counts, _ = np.histogram(values, bins=self.n_bins,
+                                           range=(self._bin_lower, self._bin_lower + self._bin_width * self.n_bins))
+        self.bin_counts += chunk_bin_counts
+
+    def _extend_histogram_range(self):
+        """
+        Sets the histogram range on the first update and doubles it (merging bins pairwise) until all samples seen so
+        far are covered.
+        """
+        if self._bin_lower is None:
+            self._bin_lower = self.minimum
+            self._bin_width = (self.maximum - self.minimum) / self.n_bins
+            if self._bin_width == 0:  # constant samples
+                self._bin_width = max(abs(self.minimum), 1.0) / self.n_bins
+                self._bin_lower = self.minimum - self._bin_width * self.n_bins / 2
+            return
+
+        half_n_bins = self.n_bins // 2
+        while (self.minimum < self._bin_lower or
+               self.maximum > self._bin_lower + self._bin_width * self.n_bins):
+            merged_bin_counts = self.bin_counts.reshape(half_n_bins, 2).sum(axis=1)
+            self.bin_counts = np.zeros(self.n_bins)
+            if self.minimum < self._bin_lower:  # extend downwards
+                self._bin_lower -= self._bin_width * self.n_bins
+                self.bin_counts[half_n_bins:] = merged_bin_counts
+            else:  # extend upwards
+                self.bin_counts[:half_n_bins] = merged_bin_counts
+            self._bin_width *= 2
+
+    def quantile(self, q):
+        """
+        Estimates quantiles by linear interpolation within the histogram bins. The accuracy is limited by the bin
+        width.
+
+        Parameters
+        ----------
+        q: float | ArrayLike
+            Quantile(s) as decimals (e.g. 0.05 for the 5th percentile).
+
+        Returns
+        -------
+        float | ArrayLike
+            Estimated quantile(s).
+        """
+        if self.count == 0:
+            raise ValueError("No samples have been added yet.")
+
+        cumulative_counts = np.concatenate([[0], np.cumsum(self.bin_counts)])
+        quantiles = np.interp(np.asarray(q) * self.count, cumulative_counts, self.bin_edges)
+
+        return np.clip(quantiles, self.minimum, self.maximum)
+
+    def confidence_interval_mean(self, confidence_level=0.95):
+        """
+        Confidence interval of the mean based on the normal approximation.
+
+        Parameters
+        ----------
+        confidence_level: float
+            Confidence level as a decimal.
+
+        Returns
+        -------
+        tuple[float, float]
+            Lower and upper bound of the confidence interval.
+        """
+        half_width = norm.ppf(0.5 + confidence_level / 2) * self.standard_error
+
+        return self.mean - half_width, self.mean + half_width
+
+    def confidence_interval_quantile(self, q, confidence_level=0.95):
+        """
+        Distribution-free confidence interval of a quantile, based on the normal approximation of the binomial
+        distribution of the number of samples below the quantile.
+
+        Parameters
+        ----------
+        q: float
+            Quantile as a decimal (e.g. 0.05 for the 5th percentile).
+        confidence_level: float
+            Confidence level as a decimal.
+
+        Returns
+        -------
+        tuple[float, float]
+            Lower and upper bound of the confidence interval.
+        """
+        if self.count == 0:
+            return -np.inf, np.inf
+
+        rank_offset = norm.ppf(0.5 + confidence_level / 2) * np.sqrt(q * (1 - q) / self.count)
+
+        return (float(self.quantile(max(q - rank_offset, 0))),
+                float(self.quantile(min(q + rank_offset, 1))))
+
+
+@dataclass
+class StreamedResults:
+    """
+    Summary statistics of a simulation which has been run in chunks. Only online statistics of the Monte Carlo
+    distributions are kept, the raw samples of each chunk are discarded.
+
+    Attributes
+    ----------
+    name: str
+        Name given to the results.
+    n_bins: int
+        Number of histogram bins used for each distribution.
+    MC_iterations: int
+        Number of Monte Carlo iterations folded in so far.
+    totals: dict[str, OnlineStatistics]
+        Statistics of the system's total GWP, PV, AV, BCR, and electricity and heat output.
+    processes: dict[str, dict[str, OnlineStatistics]]
+        Statistics of each process' GWP, PV, and AV - keyed by process name.
+    converged: bool
+        Whether convergence targets were met - only populated by adaptive simulation runs.
+    convergence: dict
+        Estimate, confidence interval width, and target of each convergence metric - only populated by adaptive
+        simulation runs.
+
+    Methods
+    -------
+    update(results)
+        Folds the distributions of a chunk's results object into the statistics.
+    """
+    name: str = None
+    n_bins: int = 1000
+    MC_iterations: int = 0
+    totals: dict = field(default_factory=dict)
+    processes: dict = field(default_factory=dict)
+    converged: bool = None
+    convergence: dict = None
+
+    @property
+    def GWP_mean(self):
+        return self.totals["GWP"].mean
+
+    @property
+    def PV_mean(self):
+        return self.totals["PV"].mean
+
+    @property
+    def AV_mean(self):
+        return self.totals["AV"].mean
+
+    @property
+    def BCR_mean(self):
+        return self.totals["BCR"].mean
+
+    def _update_statistics(self, storage, key, values):
+        if key not in storage:
+            storage[key] = OnlineStatistics(name=key, n_bins=self.n_bins)
+        storage[key].update(values)
+
+    def update(self, results):
+        """
+        Folds the distributions of a chunk's results object into the statistics.
+
+        Parameters
+        ----------
+        results: Results
+            Results object of a single chunk.
+        """
+        # Totals
+        self._update_statistics(self.totals, "GWP", results.GWP_distribution)
+        self._update_statistics(self.totals, "PV", results.PV_distribution)
+        self._update_statistics(self.totals, "AV", results.AV_distribution)
+        self._update_statistics(self.totals, "BCR", results.BCR_distribution)
+        if results.electricity_results is not None:
+            self._update_statistics(self.totals, "Electricity",
+                                    results.electricity_results["Total MC distribution"])
+        if results.heat_results is not None:
+            self._update_statistics(self.totals, "Heat", results.heat_results["Total MC distribution"])
+
+        # Processes
+        for process in results.processes:
+            if process.name not in self.processes:
+                self.processes[process.name] = {}
+            self._update_statistics(self.processes[process.name], "GWP", process.GWP_distribution)
+            self._update_statistics(self.processes[process.name], "PV", process.PV_distribution)
+            self._update_statistics(self.processes[process.name], "AV", process.AV_distribution)
+
+        self.MC_iterations += len(results.GWP_distribution)
@@ -0,0 +1,43 @@
+import numpy as np
+
+from types import SimpleNamespace
+from pytest import approx
+from objects import ResultsMatrix
+
+
+def _get_test_processes():
+    def _cost_benefit(name, values, tag, cost):
+        return SimpleNamespace(name=name, short_label=name, tag=tag, cost=cost, benefit=not cost,
+                               values_PV=np.array(values), values_AV=np.array(values) / 10)
+
+    process_a = SimpleNamespace(name="A", short_label="a", PV_distribution=np.zeros(3),
+                                CBA_results=(_cost_benefit("CAPEX", [-3, -2, -1], "CAPEX", True),
+                                             _cost_benefit("Sales", [5, 5, 5], "Sale of products", False)))
+    process_b = SimpleNamespace(name="B", short_label="b", PV_distribution=np.zeros(3),
+                                CBA_results=(_cost_benefit("CAPEX", [-1, -1, -1], "CAPEX", True), ))
+
+    return process_a, process_b
+
+
+def test_results_matrix_reductions():
+    matrix = ResultsMatrix.from_processes(_get_test_processes(), "PV")
+
+    assert matrix.values.shape == (3, 3) and matrix.values.flags["C_CONTIGUOUS"]
+    assert matrix.total() == approx([1, 2, 3])
+    assert matrix.select(cost=True).total() == approx([-4, -3, -2])
+
+    processes, process_sums = matrix.group_sum(by="processes")
+    assert list(processes) == ["A", "B"]
+    assert process_sums == approx(np.array([[2, 3, 4], [-1, -1, -1]]))
+
+    tags, tag_sums = matrix.group_sum(by="tags")
+    assert list(tags) == ["CAPEX", "Sale of products"]
+    assert tag_sums[0] == approx([-4, -3, -2])
+
+
+def test_results_matrix_shares_component_buffers():
+    processes = _get_test_processes()
+    matrix = ResultsMatrix.from_processes(processes, "PV")
+
+    assert np.shares_memory(processes[0].CBA_results[1].values_PV, matrix.values)
+    assert processes[0].CBA_results[1].values_PV == approx([5, 5, 5])
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from objects import FossilGWP, Process, Requirements
+
+
+def test_nested_subprocess_results_aggregated_once():
+    def _get_process(name, value):
+        requirements = Requirements(name=name)
+        requirements.add_requirement(FossilGWP(values=np.full(4, value)))
+        process = Process(name=name, instantiate_with_default_reqs=False, requirements=(requirements, ))
+        return process
+
+    processes = [_get_process(f"Level {level}", level + 1) for level in range(4)]
+    for parent, child in zip(processes[-2::-1], processes[:0:-1]):
+        parent.add_subprocess(child)
+
+    assert len(processes[0].GWP_results) == 4
+    assert processes[0].GWP_distribution == pytest.approx(np.full(4, 10))
+    assert [process.name for process in processes[0].get_subtree_processes()] == [process.name for process in processes]
+
+
+def test_only_changed_subprocesses_recalculated():
+    def _get_process(name, value):
+        requirements = Requirements(name=name)
+        requirements.add_requirement(FossilGWP(values=np.full(4, value)))
+        return Process(name=name, instantiate_with_default_reqs=False, requirements=(requirements, ))
+
+    parent, unchanged_child, old_child, new_child = [_get_process(name, value) for name, value in
+                                                     [("Parent", 1), ("Unchanged", 2), ("Old", 3), ("New", 4)]]
+    parent.add_subprocess(unchanged_child)
+    parent.add_subprocess(old_child)
+    unchanged_GWP_results = unchanged_child.GWP_results
+    parent_GWP_result = parent.GWP_results[0]
+
+    parent.replace_subprocess(old_child, new_child)
+
+    assert unchanged_child.GWP_results is unchanged_GWP_results
+    assert parent.GWP_results[0] is parent_GWP_result
+    assert parent.GWP_distribution == pytest.approx(np.full(4, 7))
+
+    new_child.requirements[0].add_requirement(FossilGWP(values=np.full(4, 10)))
+    assert not parent.is_up_to_date("GWP")
+    parent.update_results()
+    assert parent.GWP_distribution == pytest.approx(np.full(4, 17))
+
+
+def test_assigned_requirement_values_detected():
+    requirements = Requirements(name="Test")
+    requirement = FossilGWP(values=np.full(4, 2.0))
+    requirements.add_requirement(requirement)
+    process = Process(name="Test", instantiate_with_default_reqs=False, requirements=(requirements, ))
+    process.calculate_GWP()
+    assert process.is_up_to_date("GWP")
+
+    requirement.values = np.full(4, 5.0)
+    assert not process.is_up_to_date("GWP")
+    process.update_results()
+    assert process.GWP_distribution == pytest.approx(np.full(4, 5))
+
+
+def test_results_without_subprocesses_kept_up_to_date():
+    def _get_process(name, value):
+        requirements = Requirements(name=name)
+        requirements.add_requirement(FossilGWP(values=np.full(4, value)))
+        return Process(name=name, instantiate_with_default_reqs=False, requirements=(requirements, ))
+
+    parent, child = _get_process("Parent", 1), _get_process("Child", 2)
+    parent.subprocesses = (child, )
+    parent.calculate_GWP(consider_subprocesses=False)
+    GWP_results = parent.GWP_results
+    assert parent.is_up_to_date("GWP")
+    assert not parent.is_up_to_date("GWP", consider_subprocesses=True)
+
+    parent.update_results()
+    assert parent.GWP_results is GWP_results  # not recalculated
+
+    parent.requirements[0].fossil_GWP[0].values = np.full(4, 3.0)
+    parent.update_results()
+    assert parent.GWP_distribution == pytest.approx(np.full(4, 3))  # still without the subprocess
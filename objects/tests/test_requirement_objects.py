@@ -0,0 +1,32 @@
+import numpy as np
+
+from objects import AnnualValue, Electricity, FossilGWP, to_float_array
+
+
+def test_values_stored_as_float_arrays():
+    requirement = Electricity(values=[1, 2, 3], name="Test")
+
+    assert isinstance(requirement.values, np.ndarray)
+    assert requirement.values.dtype == np.float64
+
+
+def test_float_arrays_passed_without_copy():
+    values = np.arange(5, dtype=np.float64)
+
+    assert to_float_array(values) is values
+    assert FossilGWP(values=values).values is values
+
+
+
+def test_requirements_are_slotted():
+    assert not hasattr(Electricity(values=[1, 2, 3]), "__dict__")
+    assert not hasattr(AnnualValue(values=[1, 2, 3], name="Test"), "__dict__")
+
+
+def test_assigned_values_stored_as_float_arrays_with_new_version():
+    requirement = Electricity(values=[1, 2, 3], name="Test")
+    version = requirement.version
+    requirement.values = [4, 5, 6]
+
+    assert isinstance(requirement.values, np.ndarray) and requirement.values.dtype == np.float64
+    assert requirement.version != version
@@ -0,0 +1,75 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from objects import FossilGWP, Process, Requirements, Results
+
+
+def test_metrics_calculated_lazily_and_updated_on_change():
+    requirements = Requirements(name="Test")
+    requirements.add_requirement(FossilGWP(values=np.full(4, 2.0)))
+    process = Process(name="Test", instantiate_with_default_reqs=False, requirements=(requirements, ))
+    process.calculate_GWP()
+    results = Results(processes=(process, ))
+
+    assert results.matrices == {}  # nothing calculated before first access
+    assert results.GWP_mean == pytest.approx(2)
+    assert "GWP" in results.matrices
+
+    requirements.add_requirement(FossilGWP(values=np.full(4, 3.0)))
+    assert results.GWP_mean == pytest.approx(5)
+
+
+def test_pickled_results_store_component_distributions_once():
+    requirements = Requirements(name="Test")
+    requirements.add_requirement(FossilGWP(values=np.full(1000, 2.0)))
+    process = Process(name="Test", instantiate_with_default_reqs=False, requirements=(requirements, ))
+    process.calculate_GWP()
+    results = Results(processes=(process, ))
+    assert results.GWP_mean == pytest.approx(2)
+
+    loaded_results = pickle.loads(pickle.dumps(results))
+    assert loaded_results.matrices["GWP"].total() == pytest.approx(results.GWP_distribution)
+    GWP_result = loaded_results.processes[0].GWP_results[0]
+    assert np.shares_memory(GWP_result.values, loaded_results.matrices["GWP"].values)
+    assert GWP_result.requirement.values is GWP_result.values
+
+
+def test_loaded_results_are_up_to_date():
+    child_requirements = Requirements(name="Child")
+    child_requirements.add_requirement(FossilGWP(values=np.full(4, 1.0)))
+    child = Process(name="Child", instantiate_with_default_reqs=False, requirements=(child_requirements, ))
+    requirements = Requirements(name="Test")
+    requirements.add_requirement(FossilGWP(values=np.full(4, 2.0)))
+    process = Process(name="Test", instantiate_with_default_reqs=False, requirements=(requirements, ))
+    process.add_subprocess(child)
+    results = Results(processes=(process, ))
+    results.calculate_all()
+
+    loaded_results = pickle.loads(pickle.dumps(results))
+    loaded_process = loaded_results.processes[0]
+    results_versions = dict(loaded_process._results_versions)
+    GWP_distribution = loaded_results.GWP_distribution
+    assert loaded_process.is_up_to_date("GWP") and loaded_process.is_up_to_date("CBA")
+    assert loaded_results.GWP_mean == pytest.approx(3)
+    assert loaded_results.GWP_distribution is GWP_distribution  # not recalculated
+    assert loaded_process._results_versions == results_versions
+
+    # Changes made after loading are still detected
+    loaded_process.subprocesses[0].requirements[0].add_requirement(FossilGWP(values=np.full(4, 4.0)))
+    assert loaded_results.GWP_mean == pytest.approx(7)
+
+
+def test_processes_only_updated_when_metrics_are_recalculated(monkeypatch):
+    requirements = Requirements(name="Test")
+    requirements.add_requirement(FossilGWP(values=np.full(4, 2.0)))
+    process = Process(name="Test", instantiate_with_default_reqs=False, requirements=(requirements, ))
+    results = Results(processes=(process, ))
+    assert results.GWP_mean == pytest.approx(2)
+
+    update_calls = []
+    monkeypatch.setattr(process, "update_results", lambda: update_calls.append(process))
+    assert results.GWP_mean == pytest.approx(2)
+    assert results.GWP_distribution == pytest.approx(np.full(4, 2.0))
+    assert update_calls == []
@@ -0,0 +1,43 @@
+import numpy as np
+
+from pytest import approx
+from scipy.stats import norm
+from objects import OnlineStatistics
+
+
+def test_online_statistics_match_batch_statistics():
+    values = np.random.default_rng(0).normal(loc=5, scale=2, size=(20, 500))
+    statistics = OnlineStatistics()
+    for chunk in values:
+        statistics.update(chunk)
+
+    assert statistics.count == values.size
+    assert statistics.mean == approx(np.mean(values))
+    assert statistics.variance == approx(np.var(values, ddof=1))
+    assert statistics.quantile(0.95) == approx(np.quantile(values, 0.95), rel=1e-2)
+
+
+def test_histogram_range_is_extended():
+    statistics = OnlineStatistics(n_bins=10)
+    statistics.update(np.zeros(5))
+    statistics.update([100, -100])
+
+    assert statistics.bin_counts.sum() == 7
+    assert statistics.bin_edges[0] <= -100 and statistics.bin_edges[-1] >= 100
+
+
+def test_confidence_interval_widths():
+    values = np.random.default_rng(0).normal(size=(10, 1000))
+    statistics = OnlineStatistics()
+    for chunk in values:
+        statistics.update(chunk)
+
+    lower, upper = statistics.confidence_interval_mean(0.95)
+    assert upper - lower == approx(2 * norm.ppf(0.975) * np.std(values, ddof=1) / np.sqrt(values.size))
+    assert lower < statistics.mean < upper
+
+    # Width of the quantile interval is approximately 2 z sqrt(q (1 - q) / n) / f(x_q)
+    lower, upper = statistics.confidence_interval_quantile(0.95, 0.95)
+    expected_width = 2 * norm.ppf(0.975) * np.sqrt(0.95 * 0.05 / values.size) / norm.pdf(norm.ppf(0.95))
+    assert upper - lower == approx(expected_width, rel=0.2)
+    assert lower < statistics.quantile(0.95) < upper
@@ -17,19 +17,23 @@ class CombinedHeatPower(Process):
     def instantiate_default_requirements(self):
         self.calculate_requirements()
 
-    def calculate_requirements(self, gas_supplied=None,
+    def calculate_requirements(self, ML_predictions=None,
+                               gas_supplied=None,
                                LHV_gas=None,
                                displaced_heat_source=None,
                                CHP_type=None,
                                efficiency_electrical=None,
                                efficiency_heat=None,
                                demand_parasitic=None,
-                               FU=settings.general["FU"]):
+                               FU=None):
         """
         Calculates all requirements and impacts of using syngas for combined heat and power (CHP).
 
         Parameters
         ----------
+        ML_predictions: dict
+            Dictionary of all predicted model outputs as distributions. Only used if gas_supplied or LHV_gas are not
+            given.
         gas_supplied: list
             Monte Carlo Syngas predictions from ML model [Nm3/kg wb].
         LHV_gas: list
@@ -44,21 +48,25 @@ class CombinedHeatPower(Process):
             Thermal energy conversion efficiency as a decimal.
         demand_parasitic: float
             Parasitic electricity requirements as a decimal.
-        FU: int
-            Functional Unit.
+        FU: int | None
+            Functional Unit. Defaults to the functional unit defined in settings.
         """
 
         # Get defaults
         if gas_supplied is None or LHV_gas is None:
-            all_predictions = get_all_prediction_distributions()
+            if ML_predictions is None:
+                ML_predictions = get_all_prediction_distributions()
             if gas_supplied is None:
-                gas_supplied = all_predictions["Gas yield [Nm3/kg wb]"],
+                gas_supplied = ML_predictions["Gas yield [Nm3/kg wb]"]
             if LHV_gas is None:
-                LHV_gas = all_predictions['LHV [MJ/Nm3]']
+                LHV_gas = ML_predictions['LHV [MJ/Nm3]']
 
         if displaced_heat_source is None:
             displaced_heat_source = "natural gas"
 
+        if FU is None:
+            FU = settings.general["FU"]
+
         # Select correct CHP unit data
         if CHP_type is None:
             CHP_type = settings.user_inputs.processes.CHP.type
@@ -91,14 +99,14 @@ class CombinedHeatPower(Process):
         energy_produced = MJ_to_kWh(energy_production_rate * FU)  # [kWh/FU]
 
         # Calculate electricity displacement
-        electricity_produced = list((energy_produced * efficiency_electrical) * (1 - demand_parasitic))  # [kWh/FU]
+        electricity_produced = (energy_produced * efficiency_electrical) * (1 - demand_parasitic)  # [kWh/FU]
 
         # Calculate heat displacement
         heat_produced = energy_produced * efficiency_heat  # [kWh/FU]
 
         # Economic requirements
         CAPEX = get_CHP_CAPEX_distribution()
-        o_and_m_costs = get_operation_and_maintenance_cost(CAPEX.values)
+        o_and_m_costs = get_operation_and_maintenance_cost(CAPEX.values, input_name="O&M ratio CHP")
 
         # Initialise Requirements object and add requirements
         CHP_requirements = Requirements(name=self.name)
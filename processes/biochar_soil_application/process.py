@@ -7,7 +7,7 @@ from objects import triangular_dist_maker, gaussian_dist_maker
 from objects import Process
 from objects import Requirements, BiogenicGWP, FossilGWP
 from functions.general.predictions_to_distributions import get_all_prediction_distributions
-from functions.MonteCarloSimulation import to_fixed_MC_array, get_distribution_draws
+from functions.MonteCarloSimulation import to_fixed_MC_array, get_distribution_draws, get_rng
 from functions.TEA.cost_benefit_components import biochar_sale_cost_benefit
 from processes.biochar_soil_application.utils import load_biochar_properties_data, avoided_N2O_emissions
 
@@ -97,12 +97,12 @@ class BiocharSoilApplication(Process):
 
             # Create Monte Carlo array
             if carbon_fraction_else_case:
-                carbon_fraction_array = np.random.default_rng().uniform(low=carbon_fraction_min,
-                                                                        high=carbon_fraction_max,
-                                                                        size=settings.user_inputs.general.MC_iterations)
+                carbon_fraction_array = get_rng("biochar soil application").uniform(
+                    low=carbon_fraction_min, high=carbon_fraction_max, size=settings.user_inputs.general.MC_iterations)
             else:
                 carbon_fraction_array = get_distribution_draws(
-                    gaussian_dist_maker(mean=carbon_fraction_mean, std=carbon_fraction_std))
+                    gaussian_dist_maker(mean=carbon_fraction_mean, std=carbon_fraction_std),
+                    input_name="biochar carbon fraction")
 
         else:  # Fixed value scenario
             carbon_fraction_array = to_fixed_MC_array(carbon_fraction)
@@ -114,7 +114,8 @@ class BiocharSoilApplication(Process):
 
             recalcitrant_carbon_array = get_distribution_draws(triangular_dist_maker(lower=recalcitrant_carbon_data.lower,
                                                                                      mode=recalcitrant_carbon_data.mode,
-                                                                                     upper=recalcitrant_carbon_data.upper))
+                                                                                     upper=recalcitrant_carbon_data.upper),
+                                                               input_name="biochar recalcitrant carbon fraction")
 
         else:  # Fixed value scenario
             recalcitrant_carbon_array = to_fixed_MC_array(stability)
@@ -136,14 +137,14 @@ class BiocharSoilApplication(Process):
             raise Warning("No default biogenic fraction available for this feedstock type - 100% biogenic assumed.")
 
         # Calculate biogenic and fossil emissions due to carbon in biochar
-        recalcitrant_biogenic_CO2 = list(GWP_recalcitrant * biogenic_fraction)
-        recalcitrant_fossil_CO2 = list(GWP_recalcitrant * (1-biogenic_fraction))
-        labile_biogenic_CO2 = list(GWP_labile * biogenic_fraction)
-        labile_fossil_CO2 = list(GWP_labile * (1 - biogenic_fraction))
+        recalcitrant_biogenic_CO2 = GWP_recalcitrant * biogenic_fraction
+        recalcitrant_fossil_CO2 = GWP_recalcitrant * (1-biogenic_fraction)
+        labile_biogenic_CO2 = GWP_labile * biogenic_fraction
+        labile_fossil_CO2 = GWP_labile * (1 - biogenic_fraction)
 
         # Calculate benefits due to reduced N2O emissions from soil due to biochar application
-        avoided_N20 = list(map(avoided_N2O_emissions, biochar_yield))  # N20/FU
-        avoided_N2O_GWP = [get_CO2_equ(N2O=i) for i in avoided_N20]  # kg CO2 eq./FU
+        avoided_N20 = avoided_N2O_emissions(biochar_yield)  # N20/FU
+        avoided_N2O_GWP = get_CO2_equ(N2O=avoided_N20)  # kg CO2 eq./FU
 
         # Requirements related to biochar to soil application
 
@@ -152,21 +153,21 @@ class BiocharSoilApplication(Process):
 
         if biogenic_fraction > 0:
             biochar_requirements.add_requirement(
-                BiogenicGWP(values=list(labile_biogenic_CO2),
+                BiogenicGWP(values=labile_biogenic_CO2,
                             name="Emissions due to labile biogenic fraction of biochar",
                             short_label="Labile $C_{b}$"))
             biochar_requirements.add_requirement(
-                BiogenicGWP(values=list(recalcitrant_biogenic_CO2),
+                BiogenicGWP(values=recalcitrant_biogenic_CO2,
                             name="Avoided emissions due to recalcitrant biogenic fraction of biochar",
                             negative_emissions=True,
                             short_label="Recalc. $C_{b}$"))
         if biogenic_fraction < 1:
             biochar_requirements.add_requirement(
-                FossilGWP(values=list(labile_fossil_CO2),
+                FossilGWP(values=labile_fossil_CO2,
                           name="Emissions due to labile non-biogenic fraction of biochar",
                           short_label="Labile $C_{f}$"))
             biochar_requirements.add_requirement(
-                FossilGWP(values=list(recalcitrant_fossil_CO2),
+                FossilGWP(values=recalcitrant_fossil_CO2,
                           name="Avoided emissions due to recalcitrant non-biogenic fraction of biochar",
                           negative_emissions=True,
                           short_label="Recalc. $C_{f}$"))
@@ -179,7 +180,7 @@ class BiocharSoilApplication(Process):
                         short_label="Avoid. $N_{2}O$"))
 
         # Economic requirements
-        annual_value_biochar_sale = biochar_sale_cost_benefit()
+        annual_value_biochar_sale = biochar_sale_cost_benefit(biochar_yield_predictions=biochar_yield_predictions)
         biochar_requirements.add_requirement(annual_value_biochar_sale)
 
         # Add requirements to object
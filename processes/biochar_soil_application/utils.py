@@ -1,9 +1,9 @@
-import pickle
+import functions
 
 import numpy as np
 
 from config import settings
-from functions.general.utility import get_project_root
+from functions.general.utility import get_data_path, load_data
 
 
 def load_biochar_properties_data(full_file_path=None):
@@ -22,30 +22,36 @@ def load_biochar_properties_data(full_file_path=None):
         Loaded data on biochar properties.
     """
     if full_file_path is None:
-        project_root = get_project_root()
-        full_file_path = str(project_root) + r"\data\biochar_properties_results"
+        full_file_path = get_data_path("biochar_properties_results")
 
-    # Load pickled data
-    loaded_data = pickle.load(open(full_file_path, "rb"))
+    # Load pickled data (kept in memory after first use)
+    loaded_data = load_data(full_file_path)
 
     return loaded_data
 
 
-def avoided_N2O_emissions(biochar_yield):
+def avoided_N2O_emissions(biochar_yield, rng=None):
     """
     Avoided N20 emissions due to applying biochar to soil.
 
     Parameters
     ----------
-    biochar_yield: float
-        Biochar yield [kg/FU].
+    biochar_yield: float | np.ndarray
+        Biochar yield [kg/FU]. One emission rate is drawn per element.
+    rng: np.random.Generator | None
+        Random number generator used for the draws. Defaults to the "biochar soil application" stream of the current
+        run.
 
     Returns
     -------
-    float
+    float | np.ndarray
         Reduction in N2O release from soil after biochar application [kg N2O/FU].
 
     """
+    # Get defaults
+    if rng is None:
+        rng = functions.MonteCarloSimulation.get_rng("biochar soil application")
+
     # Data: https://doi.org/10.1371/journal.pone.0176111
     soil_emissions_mean = 2.27  # kg N ha^-1 yr^-1
     soil_emissions_1st_quartile = 1.18  # kg N ha^-1 yr^-1
@@ -64,8 +70,9 @@ def avoided_N2O_emissions(biochar_yield):
     application_rate = 25000  # kg ha^-1 yr^-1
 
     # Generate random unit value
-    emission_rng = np.random.normal(soil_emissions_mean * N_to_N2O,
-                                    soil_emissions_std_avg * N_to_N2O)  # kg N2O ha^-1 yr^-1
+    emission_rng = rng.normal(soil_emissions_mean * N_to_N2O,
+                              soil_emissions_std_avg * N_to_N2O,
+                              size=np.shape(biochar_yield))  # kg N2O ha^-1 yr^-1
 
     avoided_N20_emissions = (-1 * emission_rng * N2O_reduction_factor * biochar_yield) / 25000  # N20
 
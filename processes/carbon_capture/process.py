@@ -22,14 +22,15 @@ class CarbonCapture(Process):
         self.calculate_requirements()
 
     def calculate_requirements(self, ML_predictions=None, syngas_combustion_object=None,
-                               cc_method=None, MC_iterations=settings.user_inputs.general.MC_iterations):
+                               cc_method=None, MC_iterations=None):
         """
         Calculate the requirements and impacts of carbon capture and storage (CCS) process.
 
         Parameters
         ----------
         ML_predictions: dict
-            Dictionary of all predicted model outputs as distributions.
+            Dictionary of all predicted model outputs as distributions. Only used if no syngas_combustion_object is
+            given.
         syngas_combustion_object: object
             Syngas combustion sub model outputs.
         cc_method: str
@@ -39,10 +40,11 @@ class CarbonCapture(Process):
             Number of Monte Carlo iterations.
         """
         # Get defaults
-        if ML_predictions is None:
-            ML_predictions = get_all_prediction_distributions()
         if syngas_combustion_object is None:
-            syngas_combustion_object = SyngasCombustion()
+            if ML_predictions is None:
+                ML_predictions = get_all_prediction_distributions()
+            syngas_combustion_object = SyngasCombustion(instantiate_with_default_reqs=False)
+            syngas_combustion_object.calculate_requirements(ML_predictions=ML_predictions)
         if cc_method is None:
             cc_method = "VPSA post combustion"
 
@@ -118,11 +120,12 @@ class CarbonCapture(Process):
             raise ValueError("Carbon capture method not supported")
 
         # Economic requirements
-        CO2_capture_rate = list(np.add(captured_CO2_fossil, captured_CO2_biogenic))  # [tonne CO2/FU]
+        CO2_capture_rate = np.add(captured_CO2_fossil, captured_CO2_biogenic)  # [tonne CO2/FU]
         CAPEX = get_carbon_capture_CAPEX_distribution(CO2_capture_rate)
 
         o_and_m_costs = get_operation_and_maintenance_cost(get_present_value(values=CAPEX.values,
-                                                                             value_type="AV"))
+                                                                             value_type="AV"),
+                                                           input_name="O&M ratio carbon capture")
 
         CC_transport, CC_storage = carbon_capture_transport_storage_cost_benefit(CO2_capture_rate)
 
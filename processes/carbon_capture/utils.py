@@ -1,10 +1,11 @@
+import functions
 import numpy as np
 from functions.general.utility import MJ_to_kWh
 # Define models for different carbon capture process' based on analysis completed in
 # analysis\preliminary\carbon_capture_energy_consumption.ipynb
 
 
-def carbon_capture_VPSA_pre_comb(units="kWh"):
+def carbon_capture_VPSA_pre_comb(units="kWh", rng=None):
     """
     Calculates the energy requirements and carbon recovery rate **on a syngas basis** for a pre combustion
     vacuum pressure swing adsorption carbon capture process.
@@ -14,6 +15,8 @@ def carbon_capture_VPSA_pre_comb(units="kWh"):
     ----------
     units: str
         Either "MJ" or "kWh" to energy requirements as [MJ/kg CO2] or [kWh/kg CO2].
+    rng: np.random.Generator | None
+        Random number generator used for the draws. Defaults to the "carbon capture" stream of the current run.
 
     Returns
     -------
@@ -22,6 +25,10 @@ def carbon_capture_VPSA_pre_comb(units="kWh"):
         "Heat consumption".
     """
 
+    # Get defaults
+    if rng is None:
+        rng = functions.MonteCarloSimulation.get_rng("carbon capture")
+
     # Define required data
     recovery_mean = 0.873  # as decimal on a syngas basis
     recovery_std = recovery_mean * 0.1  # use an estimated std of 10%
@@ -33,9 +40,9 @@ def carbon_capture_VPSA_pre_comb(units="kWh"):
     heat_consumption_std = heat_consumption_mean * 0.1  # [MJ/kg CO2] use an estimated std of 10%
 
     # Calculate outputs
-    recovery_out = np.random.normal(recovery_mean, recovery_std)  # decimal
-    electricity_out = np.random.normal(electricity_consumption_mean, electricity_consumption_std)  # [MJ/kg CO2]
-    heat_out = np.random.normal(heat_consumption_mean, heat_consumption_std)  # [MJ/kg CO2]
+    recovery_out = rng.normal(recovery_mean, recovery_std)  # decimal
+    electricity_out = rng.normal(electricity_consumption_mean, electricity_consumption_std)  # [MJ/kg CO2]
+    heat_out = rng.normal(heat_consumption_mean, heat_consumption_std)  # [MJ/kg CO2]
 
     # Convert units to kWh
     if units == "kWh":
@@ -45,7 +52,7 @@ def carbon_capture_VPSA_pre_comb(units="kWh"):
     return {"Recovery": recovery_out, "Electricity consumption": electricity_out, "Heat consumption": heat_out}
 
 
-def carbon_capture_amine_post_comb(units="kWh"):
+def carbon_capture_amine_post_comb(units="kWh", rng=None):
     """
     Calculates the energy requirements and carbon recovery rate **on a flue gas basis** for a post combustion
     amine-based carbon capture process.
@@ -56,6 +63,8 @@ def carbon_capture_amine_post_comb(units="kWh"):
     ----------
     units: str
         Either "MJ" or "kWh" to energy requirements as [MJ/kg CO2] or [kWh/kg CO2].
+    rng: np.random.Generator | None
+        Random number generator used for the draws. Defaults to the "carbon capture" stream of the current run.
 
     Returns
     -------
@@ -64,19 +73,23 @@ def carbon_capture_amine_post_comb(units="kWh"):
         "Heat consumption".
     """
 
+    # Get defaults
+    if rng is None:
+        rng = functions.MonteCarloSimulation.get_rng("carbon capture")
+
     # Define required data
     recovery_mean = 0.90  # as decimal on a flue gas basis
     recovery_std = recovery_mean * 0.1  # use an estimated std of 10%
 
     total_consumption_mean = 3.403  # [MJ/kg CO2]
     total_consumption_std = 0.342  # [MJ/kg CO2]
-    total_consumption = np.random.normal(total_consumption_mean, total_consumption_std)
+    total_consumption = rng.normal(total_consumption_mean, total_consumption_std)
 
-    electricity_fraction = np.random.normal(0.138, 0.064)
+    electricity_fraction = rng.normal(0.138, 0.064)
     heat_fraction = 1-electricity_fraction
 
     # Calculate outputs
-    recovery_out = np.random.normal(recovery_mean, recovery_std)  # decimal
+    recovery_out = rng.normal(recovery_mean, recovery_std)  # decimal
     electricity_out = total_consumption * electricity_fraction  # [MJ/kg CO2]
     if electricity_out < 0:
         electricity_out = 0  # Do not allow values smaller than 0
@@ -92,7 +105,7 @@ def carbon_capture_amine_post_comb(units="kWh"):
     return {"Recovery": recovery_out, "Electricity consumption": electricity_out, "Heat consumption": heat_out}
 
 
-def carbon_capture_VPSA_post_comb(units="kWh"):
+def carbon_capture_VPSA_post_comb(units="kWh", rng=None):
     """
     Calculates the energy requirements and carbon recovery rate **on a flue gas basis** for a post combustion
     vacuum pressure swing adsorption carbon capture process.
@@ -102,6 +115,8 @@ def carbon_capture_VPSA_post_comb(units="kWh"):
     ----------
     units: str
         Either "MJ" or "kWh" to energy requirements as [MJ/kg CO2] or [kWh/kg CO2].
+    rng: np.random.Generator | None
+        Random number generator used for the draws. Defaults to the "carbon capture" stream of the current run.
 
     Returns
     -------
@@ -109,6 +124,10 @@ def carbon_capture_VPSA_post_comb(units="kWh"):
         Dictionary of randomised values for "Recovery" on a flue gas basis, "Electricity consumption", and
         "Heat consumption".
     """
+    # Get defaults
+    if rng is None:
+        rng = functions.MonteCarloSimulation.get_rng("carbon capture")
+
     # Define required data
     recovery_mean = 0.874  # as decimal on a flue gas basis
     recovery_std = 0.073
@@ -119,8 +138,8 @@ def carbon_capture_VPSA_post_comb(units="kWh"):
     heat_consumption = 0  # no heat required
 
     # Calculate outputs
-    recovery_out = np.random.normal(recovery_mean, recovery_std)  # decimal
-    electricity_out = np.random.normal(electricity_consumption_mean, electricity_consumption_std)  # [MJ/kg CO2]
+    recovery_out = rng.normal(recovery_mean, recovery_std)  # decimal
+    electricity_out = rng.normal(electricity_consumption_mean, electricity_consumption_std)  # [MJ/kg CO2]
     if electricity_out < 0:
         electricity_out = 0  # don't allow negative values
     heat_out = heat_consumption  # [MJ/kg CO2]
@@ -18,7 +18,8 @@ class Gasification(Process):
     def instantiate_default_requirements(self):
         self.calculate_requirements()
 
-    def calculate_requirements(self, agent_type=None, agent_mass=None, FU=None, MC_iterations=None):
+    def calculate_requirements(self, agent_type=None, agent_mass=None, FU=None, MC_iterations=None,
+                               ML_predictions=None, CHP_results_object=None):
         """
         Calculates all requirements for the gasification process.
 
@@ -32,6 +33,11 @@ class Gasification(Process):
             Functional unit of process in kg.
         MC_iterations: int
             Number of Monte Carlo iterations.
+        ML_predictions: dict
+            Dictionary of all predicted model outputs as distributions. Used to estimate the heat available from CHP.
+            Only used if no CHP_results_object is given.
+        CHP_results_object: CombinedHeatPower
+            CHP process with calculated requirements. Used to estimate the heat available from CHP.
         """
 
         # Define defaults
@@ -60,7 +66,7 @@ class Gasification(Process):
             total_oxygen_mass = agent_mass["Oxygen"] * FU  # [kg O2/FU]
             agent_requirements.add_requirement(Oxygen(name="Electricity for oxygen production",
                                                       short_label="Ele",
-                                                      values=list(to_fixed_MC_array(total_oxygen_mass))))
+                                                      values=to_fixed_MC_array(total_oxygen_mass)))
 
             # Get economic requirement for oxygen provision
             Cost_O2 = oxygen_consumption_cost_benefit(unit_oxygen_requirement=agent_mass["Oxygen"])
@@ -71,11 +77,12 @@ class Gasification(Process):
             total_steam_mass = agent_mass["Steam"] * FU  # [kg Steam/FU]
             agent_requirements.add_requirement(Steam(short_label="Heat",
                                                      name="Heat for steam production",
-                                                     values=list(to_fixed_MC_array(total_steam_mass))))
+                                                     values=to_fixed_MC_array(total_steam_mass)))
 
             # Get economic requirement for boiler to generate steam
             CAPEX_boiler = get_boiler_CAPEX_distribution(unit_steam_requirement=agent_mass["Steam"])
-            o_and_m_costs_boiler = get_operation_and_maintenance_cost(CAPEX_boiler.values)
+            o_and_m_costs_boiler = get_operation_and_maintenance_cost(CAPEX_boiler.values,
+                                                                      input_name="O&M ratio boiler")
             agent_requirements.add_requirement(CAPEX_boiler)
             agent_requirements.add_requirement(AnnualValue(name="O&M Costs Boiler for Steam Generation",
                                                            short_label="O&M Stm",
@@ -94,7 +101,10 @@ class Gasification(Process):
             electricity_auxiliary.append(demands_ele_aux_gas_cleaning())
 
         # Heat
-        heat_auxiliary = demands_heat_auxiliary_gasification(CHP_results_object=CombinedHeatPower(),
+        if CHP_results_object is None:
+            CHP_results_object = CombinedHeatPower(instantiate_with_default_reqs=False)
+            CHP_results_object.calculate_requirements(ML_predictions=ML_predictions)
+        heat_auxiliary = demands_heat_auxiliary_gasification(CHP_results_object=CHP_results_object,
                                                              MC_iterations=MC_iterations)
 
         auxiliary_requirements.add_requirement(Electricity(values=electricity_auxiliary,
@@ -107,8 +117,10 @@ class Gasification(Process):
 
         CAPEX_results = get_gasification_and_gas_cleaning_CAPEX_distributions()
         CAPEX_gasification, CAPEX_gas_cleaning = CAPEX_results
-        o_and_m_costs_gasification = get_operation_and_maintenance_cost(CAPEX_gasification.values)
-        o_and_m_costs_gas_cleaning = get_operation_and_maintenance_cost(CAPEX_gas_cleaning.values)
+        o_and_m_costs_gasification = get_operation_and_maintenance_cost(CAPEX_gasification.values,
+                                                                        input_name="O&M ratio gasifier")
+        o_and_m_costs_gas_cleaning = get_operation_and_maintenance_cost(CAPEX_gas_cleaning.values,
+                                                                        input_name="O&M ratio gas cleaning")
 
         economic_requirements.add_requirement(CAPEX_gasification)
         economic_requirements.add_requirement(CAPEX_gas_cleaning)
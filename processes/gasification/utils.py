@@ -1,21 +1,14 @@
-import pickle
-
 import numpy as np
 
 from config import settings
-from functions.general.utility import ultimate_comp_daf_to_wb, get_project_root
+from functions.general.utility import ultimate_comp_daf_to_wb, get_data_path, load_data
 from functions.general.utility import MJ_to_kWh
 from processes.CHP import CombinedHeatPower
 from functions.MonteCarloSimulation import get_distribution_draws
+from functions.MonteCarloSimulation.random_number_generation import get_rng
 
 
-def oxygen_for_stoichiometric_combustion(C=settings.user_inputs.feedstock.carbon,
-                                         H=settings.user_inputs.feedstock.hydrogen,
-                                         N=settings.user_inputs.feedstock.nitrogen,
-                                         S=settings.user_inputs.feedstock.sulphur,
-                                         O=settings.user_inputs.feedstock.oxygen,
-                                         moisture=None,
-                                         ash=settings.user_inputs.feedstock.ash):
+def oxygen_for_stoichiometric_combustion(C=None, H=None, N=None, S=None, O=None, moisture=None, ash=None):
     """
     Calculates the oxygen required for the complete combustion of a given feedstock.
     By default, takes feedstock data given by user.
@@ -25,14 +18,7 @@ def oxygen_for_stoichiometric_combustion(C=settings.user_inputs.feedstock.carbon
     float
         Required oxygen for stoichiometric combustion [kg oxygen / kg of feedstock wb]
     """
-    # Get defaults
-    if moisture is None:
-        try:
-            moisture = settings.user_inputs.feedstock.moisture_post_drying
-        except:
-            moisture = settings.user_inputs.feedstock.moisture_ar
-
-    # Get ultimate composition as wet basis
+    # Get ultimate composition as wet basis - defaults are taken from the user inputs by ultimate_comp_daf_to_wb
     ultimate_comp_wb = ultimate_comp_daf_to_wb(C, H, N, S, O, moisture, ash)
 
     # Calculate oxygen required in kg oxygen per kg wb feedstock
@@ -142,11 +128,10 @@ def load_gasification_aux_electricity_demands_data(full_file_path=None):
         Loaded data on requirements for gas cleaning and auxiliary gasification demands.
     """
     if full_file_path is None:
-        project_root = get_project_root()
-        full_file_path = str(project_root) + r"\data\gasification_aux_demands_results"
+        full_file_path = get_data_path("gasification_aux_demands_results")
 
-    # Load pickled data
-    loaded_data = pickle.load(open(full_file_path, "rb"))
+    # Load pickled data (kept in memory after first use)
+    loaded_data = load_data(full_file_path)
 
     return loaded_data
 
@@ -167,32 +152,30 @@ def load_gasification_aux_heat_demands_data(full_file_path=None):
         Loaded data on requirements for gas cleaning and auxiliary gasification demands.
     """
     if full_file_path is None:
-        project_root = get_project_root()
-        full_file_path = str(project_root) + r"\data\gasification_aux_heat_demands_results"
+        full_file_path = get_data_path("gasification_aux_heat_demands_results")
 
-    # Load pickled data
-    loaded_data = pickle.load(open(full_file_path, "rb"))
+    # Load pickled data (kept in memory after first use)
+    loaded_data = load_data(full_file_path)
 
     return loaded_data
 
 
-def demands_ele_aux_gas_cleaning(C=settings.user_inputs.feedstock.carbon,
-                                 H=settings.user_inputs.feedstock.hydrogen,
-                                 S=settings.user_inputs.feedstock.sulphur,
-                                 moisture=None):
+def demands_ele_aux_gas_cleaning(C=None, H=None, S=None, moisture=None, rng=None):
     """
     Calculates electricity requirements for auxiliary gasification operations and syngas cleaning.
 
     Parameters
     ----------
-    C: float
-        Carbon content of feedstock [% daf].
-    H: float
-        Hydrogen content of feedstock [% daf].
-    S: float
-        Sulphur content of feedstock [% daf].
-    moisture: float
+    C: float | None
+        Carbon content of feedstock [% daf]. Defaults to the user's feedstock.
+    H: float | None
+        Hydrogen content of feedstock [% daf]. Defaults to the user's feedstock.
+    S: float | None
+        Sulphur content of feedstock [% daf]. Defaults to the user's feedstock.
+    moisture: float | None
         Moisture content of feedstock [% wb].
+    rng: np.random.Generator | None
+        Random number generator used for the draws. Defaults to the "gasification auxiliary electricity" stream of the current run.
 
     Returns
     -------
@@ -200,12 +183,24 @@ def demands_ele_aux_gas_cleaning(C=settings.user_inputs.feedstock.carbon,
         Electricity requirement for auxiliary gasification demands and gas cleaning.
     """
     # Get defaults
+    if C is None:
+        C = settings.user_inputs.feedstock.carbon
+
+    if H is None:
+        H = settings.user_inputs.feedstock.hydrogen
+
+    if S is None:
+        S = settings.user_inputs.feedstock.sulphur
+
     if moisture is None:
         try:
             moisture = settings.user_inputs.feedstock.moisture_post_drying
         except:
             moisture = settings.user_inputs.feedstock.moisture_ar
 
+    if rng is None:
+        rng = get_rng("gasification auxiliary electricity")
+
     # Get feedstock LHV
     feedstock_LHV = settings.user_inputs.feedstock.LHV  # MJ/kg wb
 
@@ -216,9 +211,9 @@ def demands_ele_aux_gas_cleaning(C=settings.user_inputs.feedstock.carbon,
     aux_requirements_data = load_gasification_aux_electricity_demands_data()
 
     # Draw sample from triangular_dist_maker distribution.
-    aux_fraction = np.random.default_rng().triangular(left=aux_requirements_data.lower,
-                                                      mode=aux_requirements_data.mode,
-                                                      right=aux_requirements_data.upper)
+    aux_fraction = rng.triangular(left=aux_requirements_data.lower,
+                                  mode=aux_requirements_data.mode,
+                                  right=aux_requirements_data.upper)
     # Calculate auxiliary energy requirements
     aux_energy = aux_fraction * total_feedstock_energy
 
@@ -238,8 +233,9 @@ def demands_heat_auxiliary_gasification(CHP_results_object=None,
 
     aux_heat_reqs_data = load_gasification_aux_heat_demands_data()
 
-    dist_draws = get_distribution_draws(distribution_maker=aux_heat_reqs_data, length_array=MC_iterations)
+    dist_draws = get_distribution_draws(distribution_maker=aux_heat_reqs_data, length_array=MC_iterations,
+                                        input_name="gasification auxiliary heat demand")
 
-    aux_heat_demands = list(np.array(heat_production) * dist_draws)
+    aux_heat_demands = heat_production * dist_draws
 
     return aux_heat_demands
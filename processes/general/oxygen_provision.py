@@ -1,8 +1,8 @@
-import pickle
+import functions
 
 import numpy as np
 
-from functions.general.utility import get_project_root
+from functions.general.utility import get_data_path, load_data
 
 
 def load_air_separation_unit_data(full_file_path=None):
@@ -21,37 +21,47 @@ def load_air_separation_unit_data(full_file_path=None):
         Loaded air separation unit data
     """
     if full_file_path is None:
-        project_root = get_project_root()
-        full_file_path = str(project_root) + r"\data\air_separation_unit_results"
+        full_file_path = get_data_path("air_separation_unit_results")
 
-    # Load pickled data
-    loaded_data = pickle.load(open(full_file_path, "rb"))
+    # Load pickled data (kept in memory after first use)
+    loaded_data = load_data(full_file_path)
 
     return loaded_data
 
 
-def oxygen_rng_elect_req(mass_oxygen):
+def oxygen_rng_elect_req(mass_oxygen, rng=None):
     """
     Generates a randomised electricity requirement of an air separation unit (ASU) for the provision of oxygen based
     on a normal distribution defined by literature values.
 
     Parameters
     ----------
-    mass_oxygen: float
-        Required mass of oxygen. [kg]
+    mass_oxygen: float | ArrayLike
+        Required mass of oxygen. [kg] Arrays (e.g. a Monte Carlo distribution) are converted at once, with one random
+        draw per element.
+    rng: np.random.Generator | None
+        Random number generator used for the draws. Defaults to the "oxygen provision" stream of the current run.
 
     Returns
     -------
-    float
+    float | ArrayLike
         Randomised electricity requirement of ASU for oxygen production [kWh el].
     """
 
+    # Get defaults
+    if rng is None:
+        rng = functions.MonteCarloSimulation.get_rng("oxygen provision")
+
     # Get data - More info in analysis - air_separation_unit_comparison.ipynb
     data = load_air_separation_unit_data()
     mean = data["Mean"]  # [kWh el./Nm3 O2]
     std = data["Std"]  # [kWh el./Nm3 O2]
 
-    # Generate random value
-    value = np.random.normal(mean, std) * mass_oxygen  # [kWh el]
+    # Generate random value(s)
+    if np.isscalar(mass_oxygen):
+        value = rng.normal(mean, std) * mass_oxygen  # [kWh el]
+    else:
+        mass_oxygen = np.asarray(mass_oxygen, dtype=float)
+        value = rng.normal(mean, std, size=mass_oxygen.shape) * mass_oxygen  # [kWh el]
 
     return value
@@ -1,9 +1,9 @@
-import pickle
+import functions
 
 import numpy as np
 
 from config import settings
-from functions.general.utility import kJ_to_kWh, get_project_root
+from functions.general.utility import kJ_to_kWh, get_data_path, load_data
 
 
 def load_boiler_efficiency_data(full_file_path=None):
@@ -22,30 +22,39 @@ def load_boiler_efficiency_data(full_file_path=None):
         Loaded boiler efficiency data
     """
     if full_file_path is None:
-        project_root = get_project_root()
-        full_file_path = str(project_root) + r"\data\boiler_efficiency_results"
+        full_file_path = get_data_path("boiler_efficiency_results")
 
-    # Load pickled data
-    loaded_data = pickle.load(open(full_file_path, "rb"))
+    # Load pickled data (kept in memory after first use)
+    loaded_data = load_data(full_file_path)
 
     return loaded_data
 
 
-def steam_rng_heat_req(mass_steam):
+def steam_rng_heat_req(mass_steam, rng=None):
     """
     Calculates heat requirement for steam production after applying some uncertainty.
 
     Parameters
     ----------
-    mass_steam: float
-        Required mass of steam [kg].
+    mass_steam: float | ArrayLike
+        Required mass of steam [kg]. Arrays (e.g. a Monte Carlo distribution) are converted at once, with one random
+        draw per element.
+    rng: np.random.Generator | None
+        Random number generator used for the draws. Defaults to the "steam provision" stream of the current run.
 
     Returns
     -------
-    float
+    float | ArrayLike
         Randomised heat requirement for steam production [kWh th].
     """
 
+    # Get defaults
+    if rng is None:
+        rng = functions.MonteCarloSimulation.get_rng("steam provision")
+
+    if not np.isscalar(mass_steam):
+        mass_steam = np.asarray(mass_steam, dtype=float)
+
     # Get some reference parameters
     room_temperature = settings.data.feedstock_drying.room_temperature  # in deg C
     boiling_temperature = 100  # in deg C
@@ -64,10 +73,10 @@ def steam_rng_heat_req(mass_steam):
     upper_efficiency = boiler_efficiency_data['triangular distribution object'].upper
 
     # Apply boiler efficiency
-
-    randomised_boiler_efficiency = np.random.triangular(left=lower_efficiency,
-                                                        mode=mode_efficiency,
-                                                        right=upper_efficiency)
+    randomised_boiler_efficiency = rng.triangular(left=lower_efficiency,
+                                                  mode=mode_efficiency,
+                                                  right=upper_efficiency,
+                                                  size=np.shape(mass_steam) or None)
 
     randomised_heat_req = total_theoretical_heat_required * 1/randomised_boiler_efficiency
 
@@ -38,17 +38,17 @@ class FeedstockDrying(Process):
 
         # Get economic requirements
         CAPEX = get_dryer_CAPEX_distribution()
-        o_and_m_costs = get_operation_and_maintenance_cost(CAPEX.values)
+        o_and_m_costs = get_operation_and_maintenance_cost(CAPEX.values, input_name="O&M ratio dryer")
 
         # Initialise Requirements object and add requirements
         feedstock_drying_requirements = Requirements(name=self.name)
         feedstock_drying_requirements.add_requirement(
-            Heat(values=list(functions.MonteCarloSimulation.to_fixed_MC_array(energy_drying_dict["heat"])),
+            Heat(values=functions.MonteCarloSimulation.to_fixed_MC_array(energy_drying_dict["heat"]),
                  name="Heat use for feedstock drying",
                  source=energy_drying_dict["heat source"]))
         feedstock_drying_requirements.add_requirement(
-            Electricity(values=list(functions.MonteCarloSimulation.to_fixed_MC_array(energy_drying_dict
-                                                                                     ["electricity"])),
+            Electricity(values=functions.MonteCarloSimulation.to_fixed_MC_array(energy_drying_dict
+                                                                                ["electricity"]),
                         name="Electricity use for feedstock drying"))
         feedstock_drying_requirements.add_requirement(CAPEX)
         feedstock_drying_requirements.add_requirement(AnnualValue(name="O&M Costs Feedstock Dryer",
@@ -20,7 +20,7 @@ class FeedstockMilling(Process):
     def instantiate_default_requirements(self):
         self.calculate_requirements()
 
-    def calculate_requirements(self, screensize=3.2, MC_iterations=settings.user_inputs.general.MC_iterations):
+    def calculate_requirements(self, screensize=3.2, MC_iterations=None):
         """
         Calculate the requirements for feedstock milling.
 
@@ -32,6 +32,10 @@ class FeedstockMilling(Process):
         MC_iterations: int
             Number of Monte Carlo iterations.
         """
+        # Get defaults
+        if MC_iterations is None:
+            MC_iterations = settings.user_inputs.general.MC_iterations
+
         # Initialise list to store electricity requirements and particle sizes
         electricity_req = []
         particle_sizes = []
@@ -62,10 +66,11 @@ class FeedstockMilling(Process):
         global_life_span = settings.user_inputs.general.system_life_span
         if CAPEX.number_of_periods < global_life_span:
             repetitions = math.floor(global_life_span / CAPEX.number_of_periods)
-            CAPEX.values = list(np.multiply(CAPEX.values, repetitions))
+            CAPEX.values = np.multiply(CAPEX.values, repetitions)
 
         # Calculate O&M Cost
-        o_and_m_costs = get_operation_and_maintenance_cost(CAPEX.values, range_dist_maker(0.10, 0.18))
+        o_and_m_costs = get_operation_and_maintenance_cost(CAPEX.values, range_dist_maker(0.10, 0.18),
+                                                          input_name="O&M ratio mill")
         # operation_and_maintenance_cost = 10% to 18%
         # Sources: "Development of agri-pellet production cost and optimum size", Sultana et al., 2010
         # "Economics of producing fuel pellets from biomass", Mani et al., 2006
@@ -19,7 +19,7 @@ class FeedstockPelleting(Process):
     def instantiate_default_requirements(self):
         self.calculate_requirements()
 
-    def calculate_requirements(self, particle_size=None, MC_iterations=settings.user_inputs.general.MC_iterations):
+    def calculate_requirements(self, particle_size=None, MC_iterations=None):
         """
         Calculate the requirements for feedstock pelleting.
         Note: Ensure that milling function is run first to update particle size post milling.
@@ -40,6 +40,9 @@ class FeedstockPelleting(Process):
             except:
                 particle_size = settings.user_inputs.feedstock.particle_size_ar
 
+        if MC_iterations is None:
+            MC_iterations = settings.user_inputs.general.MC_iterations
+
         # Initialise storage list
         electricity_requirement_pelleting = []
 
@@ -64,14 +67,16 @@ class FeedstockPelleting(Process):
         global_life_span = settings.user_inputs.general.system_life_span
         if CAPEX_mill.number_of_periods < global_life_span:
             repetitions_mill = math.floor(global_life_span / CAPEX_mill.number_of_periods)
-            CAPEX_mill.values = list(np.multiply(CAPEX_mill.values, repetitions_mill))
+            CAPEX_mill.values = np.multiply(CAPEX_mill.values, repetitions_mill)
         if CAPEX_cooler.number_of_periods < global_life_span:
             repetitions_cooler = math.floor(global_life_span / CAPEX_mill.number_of_periods)
-            CAPEX_cooler.values = list(np.multiply(CAPEX_cooler.values, repetitions_cooler))
+            CAPEX_cooler.values = np.multiply(CAPEX_cooler.values, repetitions_cooler)
 
         # Calculate O&M Cost
-        o_and_m_mill = get_operation_and_maintenance_cost(CAPEX_mill.values, fixed_dist_maker(0.10))
-        o_and_m_cooler = get_operation_and_maintenance_cost(CAPEX_cooler.values, fixed_dist_maker(0.10))
+        o_and_m_mill = get_operation_and_maintenance_cost(CAPEX_mill.values, fixed_dist_maker(0.10),
+                                                          input_name="O&M ratio pellet mill")
+        o_and_m_cooler = get_operation_and_maintenance_cost(CAPEX_cooler.values, fixed_dist_maker(0.10),
+                                                            input_name="O&M ratio pellet cooler")
         # O&M cost = 10%
         # Source: "Development of agri-pellet production cost and optimum size, Sultana et al., 2010 and Economics of
         # producing fuel pellets from biomass", Mani et al., 2006"
@@ -17,7 +17,7 @@ class FeedstockBaleShredding(Process):
     def instantiate_default_requirements(self):
         self.calculate_requirements()
 
-    def calculate_requirements(self, MC_iterations=settings.user_inputs.general.MC_iterations):
+    def calculate_requirements(self, MC_iterations=None):
         """
         Calculate the requirements for feedstock bale shredding.
 
@@ -27,6 +27,10 @@ class FeedstockBaleShredding(Process):
              Number of Monte Carlo iterations.
         """
 
+        # Get defaults
+        if MC_iterations is None:
+            MC_iterations = settings.user_inputs.general.MC_iterations
+
         # Initialise storage list
         electricity_requirement_shredding = []
 
@@ -36,7 +40,7 @@ class FeedstockBaleShredding(Process):
 
         # Get economic requirements
         CAPEX = get_shredding_CAPEX_distribution()
-        o_and_m_costs = get_operation_and_maintenance_cost(CAPEX.values)
+        o_and_m_costs = get_operation_and_maintenance_cost(CAPEX.values, input_name="O&M ratio shredder")
 
         # Initialise Requirements object and add requirements
         feedstock_shredding_requirements = Requirements(name=self.name)
@@ -1,10 +1,10 @@
-import pickle
+import functions
 import warnings
 
 import numpy as np
 
 from config import settings
-from functions.general.utility import kJ_to_kWh, get_project_root
+from functions.general.utility import kJ_to_kWh, get_data_path, load_data
 
 
 def energy_drying(mass_feedstock=None,
@@ -211,16 +211,15 @@ def load_milling_pelleting_data(full_file_path=None):
         Loaded data on milling and pelleting energy demands etc.
     """
     if full_file_path is None:
-        project_root = get_project_root()
-        full_file_path = str(project_root) + r"\data\milling_pelleting_results"
+        full_file_path = get_data_path("milling_pelleting_results")
 
-    # Load pickled data
-    loaded_data = pickle.load(open(full_file_path, "rb"))
+    # Load pickled data (kept in memory after first use)
+    loaded_data = load_data(full_file_path)
 
     return loaded_data
 
 
-def electricity_milling(screensize=None, feedstock_type=None, show_warnings=True):
+def electricity_milling(screensize=None, feedstock_type=None, show_warnings=True, rng=None):
     """
     Calculates the electricity requirements for milling 1 tonne of feedstock.
     Analysis and data: analysis/preliminary/milling_pelleting/milling_pelleting_energy_consumption.ipynb.
@@ -233,6 +232,8 @@ def electricity_milling(screensize=None, feedstock_type=None, show_warnings=True
         Specifies the type of feedstock
     show_warnings: bool
         Determine whether warnings should be displayed.
+    rng: np.random.Generator | None
+        Random number generator used for the draws. Defaults to the "milling" stream of the current run.
 
     Returns
     -------
@@ -247,6 +248,9 @@ def electricity_milling(screensize=None, feedstock_type=None, show_warnings=True
     if feedstock_type is None:
         feedstock_type = settings.user_inputs.feedstock.category
 
+    if rng is None:
+        rng = functions.MonteCarloSimulation.get_rng("milling")
+
     # Load required data
     data = load_milling_pelleting_data()
 
@@ -261,7 +265,7 @@ def electricity_milling(screensize=None, feedstock_type=None, show_warnings=True
     milling_rmse = data["Energy milling model"]["RMSE"]  # [kWh/tonne]
 
     # Calculate randomised electricity requirement
-    electricity_requirement = np.random.normal(milling_prediction, milling_rmse)  # [kWh/tonne]
+    electricity_requirement = rng.normal(milling_prediction, milling_rmse)  # [kWh/tonne]
 
     # Add energy penalty for woody biomass
     if feedstock_type == "woody biomass":
@@ -272,12 +276,12 @@ def electricity_milling(screensize=None, feedstock_type=None, show_warnings=True
     particle_size_rmse = data["Particle size from milling"]["RMSE"]  # [kWh/tonne]
 
     # Calculate randomised particle size post milling
-    particle_size = np.random.normal(particle_size_prediction, particle_size_rmse)
+    particle_size = rng.normal(particle_size_prediction, particle_size_rmse)
 
     return electricity_requirement, particle_size
 
 
-def electricity_pelleting(particle_size=None, show_warnings=True):
+def electricity_pelleting(particle_size=None, show_warnings=True, rng=None):
     """
     Calculates the electricity requirements for pelleting 1 tonne of feedstock.
     Analysis and data: analysis/preliminary/milling_pelleting/milling_pelleting_energy_consumption.ipynb.
@@ -288,6 +292,8 @@ def electricity_pelleting(particle_size=None, show_warnings=True):
         Particle size of feedstock either as received or after milling.
     show_warnings: bool
         Determine whether warnings should be displayed.
+    rng: np.random.Generator | None
+        Random number generator used for the draws. Defaults to the "pelleting" stream of the current run.
 
     Returns
     -------
@@ -302,6 +308,9 @@ def electricity_pelleting(particle_size=None, show_warnings=True):
         except:
             particle_size = settings.user_inputs.feedstock.particle_size_ar
 
+    if rng is None:
+        rng = functions.MonteCarloSimulation.get_rng("pelleting")
+
     # Run checks
     if particle_size > 31 and show_warnings:
         warnings.warn("Particle size larger than currently supported. Consider adding milling process.")
@@ -314,17 +323,19 @@ def electricity_pelleting(particle_size=None, show_warnings=True):
     rmse = data["Pelleting model"]["RMSE"]  # [kWh/tonne]
 
     # Calculate randomised electricity requirement
-    electricity_requirement = np.random.normal(prediction, rmse)  # [kWh/tonne]
+    electricity_requirement = rng.normal(prediction, rmse)  # [kWh/tonne]
 
     return electricity_requirement
 
 
-def electricity_shredding():
+def electricity_shredding(rng=None):
     """
     Calculates the electricity requirements for shredding 1 tonne of baled feedstock to a length of 25 to 100 mm.
     Source: https://doi.org/10.13140/RG.2.2.17486.25922
     Parameters
     ----------
+    rng: np.random.Generator | None
+        Random number generator used for the draws. Defaults to the "shredding" stream of the current run.
 
     Returns
     -------
@@ -332,6 +343,10 @@ def electricity_shredding():
         Electricity requirement for shredding [kWh/tonne].
     """
 
+    # Get defaults
+    if rng is None:
+        rng = functions.MonteCarloSimulation.get_rng("shredding")
+
     # Get electricity requirements - Note reference suggests that substantial savings could be made but also that
     # requirements could increase.
     shredding_electricity_requirement_most_likely = 14.9  # [kWh/tonne]
@@ -339,10 +354,9 @@ def electricity_shredding():
     shredding_electricity_requirement_upper_estimate = shredding_electricity_requirement_most_likely * 1.5
 
     # Calculate randomised electricity requirement
-    default_generator = np.random.default_rng()  # Initialise default generator
     # Get req in [kWh/tonne]
-    electricity_requirement = default_generator.triangular(left=shredding_electricity_requirement_lower_estimate,
-                                                           mode=shredding_electricity_requirement_most_likely,
-                                                           right=shredding_electricity_requirement_upper_estimate)
+    electricity_requirement = rng.triangular(left=shredding_electricity_requirement_lower_estimate,
+                                             mode=shredding_electricity_requirement_most_likely,
+                                             right=shredding_electricity_requirement_upper_estimate)
 
     return electricity_requirement
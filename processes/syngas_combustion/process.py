@@ -64,8 +64,8 @@ class SyngasCombustion(Process):
                 warnings.warn("No default biogenic fraction available for this feedstock type - 0% biogenic assumed.")
 
         # Calculate biogenic and fossil emissions
-        biogenic_CO2 = list(np.array(total_CO2) * biogenic_fraction)
-        fossil_CO2 = list(np.array(total_CO2) * (1 - biogenic_fraction))
+        biogenic_CO2 = total_CO2 * biogenic_fraction
+        fossil_CO2 = total_CO2 * (1 - biogenic_fraction)
 
         # Initialise Requirements object and add requirements
         syngas_combustion_requirements = Requirements(name="Syngas combustion")
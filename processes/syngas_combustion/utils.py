@@ -29,7 +29,7 @@ def get_conversion_ratios_to_CO2():
     return {"CO": CO_conv_ratio, "CH4": CH4_conv_ratio, "C2H4": C2H4_conv_ratio}
 
 
-def syngas_combustion_CO2_eq(scaled_gas_fractions, gas_yield, FU=settings.general["FU"]):
+def syngas_combustion_CO2_eq(scaled_gas_fractions, gas_yield, FU=None):
     """
     Sub-function used to calculate the GWP from syngas combustion.
     Simplified function assuming complete conversion of all species to CO2 are employed.
@@ -38,23 +38,25 @@ def syngas_combustion_CO2_eq(scaled_gas_fractions, gas_yield, FU=settings.genera
     ----------
     scaled_gas_fractions: dict
         Scaled gas fraction in decimals.
-    gas_yield: list
+    gas_yield: ArrayLike
         Gas yields associated with each iteration.
-    FU: int
-        Functional unit.
+    FU: int | None
+        Functional unit. Defaults to the functional unit defined in settings.
 
     Returns
     -------
+    np.ndarray
         GWP values in kg CO2eq./FU.
     """
 
+    # Get defaults
+    if FU is None:
+        FU = settings.general["FU"]
+
     # Ensure inputs are the correct length
     if len(scaled_gas_fractions) != 6:
         raise ValueError(f"gas_fractions needs to be length 6, is {len(scaled_gas_fractions)}")
 
-    # Set up empty list to store calculated GWPs
-    GWP = []
-
     # Get gas conversion ratios
     conversion_ratios = get_conversion_ratios_to_CO2()
     CO_conv_ratio = conversion_ratios["CO"]
@@ -64,13 +66,11 @@ def syngas_combustion_CO2_eq(scaled_gas_fractions, gas_yield, FU=settings.genera
     # Get gas densities
     densities = settings.data.densities
 
-    # Calculate GWPs for each MC iteration
-    for iterations in np.arange(len(scaled_gas_fractions["N2 [vol.% db]"])):
-        calculated_GWP = (scaled_gas_fractions["CO2 [vol.% db]"][iterations] * densities["CO2"] +
-                          scaled_gas_fractions["CO [vol.% db]"][iterations] * densities["CO"] * CO_conv_ratio +
-                          scaled_gas_fractions["CH4 [vol.% db]"][iterations] * densities["CH4"] * CH4_conv_ratio +
-                          scaled_gas_fractions["C2Hn [vol.% db]"][iterations] * densities["C2H4"] * C2H4_conv_ratio
-                          ) * gas_yield[iterations] * FU
-        GWP.append(calculated_GWP)  # add GWP to storage list
+    # Calculate GWPs for all MC iterations at once
+    GWP = (np.asarray(scaled_gas_fractions["CO2 [vol.% db]"]) * densities["CO2"] +
+           np.asarray(scaled_gas_fractions["CO [vol.% db]"]) * densities["CO"] * CO_conv_ratio +
+           np.asarray(scaled_gas_fractions["CH4 [vol.% db]"]) * densities["CH4"] * CH4_conv_ratio +
+           np.asarray(scaled_gas_fractions["C2Hn [vol.% db]"]) * densities["C2H4"] * C2H4_conv_ratio
+           ) * np.asarray(gas_yield) * FU
 
     return GWP